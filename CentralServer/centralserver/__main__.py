@@ -1,9 +1,9 @@
 from uvicorn import config, run
 
-from centralserver.internals.config_handler import app_config
+from centralserver.internals.config_handler import app_config, config_store
 
 if __name__ == "__main__":
-    app_config.run_internal = True  # app is running using __main__
+    config_store.set_run_internal(True)  # app is running using __main__
     run(
         "centralserver:app",  # import using module:attribute
         host=app_config.connection.host,
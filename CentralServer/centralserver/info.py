@@ -16,6 +16,9 @@ FORBIDDEN_CONFIG_KEYS = {
     ],  # Security-critical keys that should not be changed via web
     "mailing": ["password"],  # Sensitive credentials (though we allow this for now)
 }
+# Configuration sections that are only applied when the server starts.
+# Other sections are applied as soon as the configuration file changes.
+RESTART_REQUIRED_CONFIG_SECTIONS: Final = frozenset({"database"})
 
 
 class AnnouncementRecipients(Enum):
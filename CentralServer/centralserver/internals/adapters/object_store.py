@@ -15,6 +15,7 @@ from centralserver.internals.adapters.config import (
 )
 from centralserver.internals.config_handler import app_config
 from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.metrics import timed_object_store_operation
 from centralserver.internals.models.object_store import BucketObject
 
 logger = LoggerFactory().get_logger(__name__)
@@ -230,6 +231,7 @@ class LocalObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def check(self) -> None:
         """Check if the local object store is healthy."""
 
@@ -241,6 +243,7 @@ class LocalObjectStoreAdapter(ObjectStoreAdapter):
             subdir.mkdir(parents=True, exist_ok=True)
 
     @override
+    @timed_object_store_operation
     async def put(self, bucket: BucketNames, fn: str, obj: bytes) -> BucketObject:
         """Store the object in the local object store.
 
@@ -275,6 +278,7 @@ class LocalObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def get(
         self, bucket: BucketNames, hashed_filename: str
     ) -> BucketObject | None:
@@ -302,6 +306,7 @@ class LocalObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def delete(self, bucket: BucketNames, hashed_filename: str) -> None:
         """Remove an object from the local object store.
 
@@ -363,6 +368,7 @@ class MinIOObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def check(self) -> None:
         """Check if the MinIO object store is healthy."""
 
@@ -374,6 +380,7 @@ class MinIOObjectStoreAdapter(ObjectStoreAdapter):
                 self.client.make_bucket(bucket.value)
 
     @override
+    @timed_object_store_operation
     async def put(self, bucket: BucketNames, fn: str, obj: bytes) -> BucketObject:
         """Upload an object to the MinIO object store.
 
@@ -404,6 +411,7 @@ class MinIOObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def get(
         self, bucket: BucketNames, hashed_filename: str
     ) -> BucketObject | None:
@@ -439,6 +447,7 @@ class MinIOObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def delete(self, bucket: BucketNames, hashed_filename: str) -> None:
         """Remove an object from the MinIO object store.
 
@@ -499,6 +508,7 @@ class GarageObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def check(self) -> None:
         """Check if the Garage object store is healthy."""
 
@@ -510,6 +520,7 @@ class GarageObjectStoreAdapter(ObjectStoreAdapter):
                 self.client.make_bucket(bucket.value)
 
     @override
+    @timed_object_store_operation
     async def put(self, bucket: BucketNames, fn: str, obj: bytes) -> BucketObject:
         """Upload an object to the Garage object store.
 
@@ -540,6 +551,7 @@ class GarageObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def get(
         self, bucket: BucketNames, hashed_filename: str
     ) -> BucketObject | None:
@@ -575,6 +587,7 @@ class GarageObjectStoreAdapter(ObjectStoreAdapter):
         )
 
     @override
+    @timed_object_store_operation
     async def delete(self, bucket: BucketNames, hashed_filename: str) -> None:
         """Remove an object from the Garage object store.
 
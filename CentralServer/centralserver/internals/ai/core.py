@@ -1,48 +1,106 @@
+import asyncio
+import datetime as dt
+import functools
 from datetime import datetime, timedelta
-from typing import Optional, DefaultDict, Deque, Annotated
-from collections import defaultdict, deque
+from typing import Optional, Annotated
 
-from intents import INTENT_KEYWORDS, SAFE_GENERAL_TOPICS
-from rapidfuzz import fuzz
-import google.generativeai as genai
+from centralserver.internals.ai.intents import (
+    KEYWORD_INTENTS,
+    KEYWORDS,
+    SAFE_GENERAL_TOPICS,
+)
+from rapidfuzz import fuzz, process
 
 from sqlmodel import Session
 
-from utils import PH_TZ, extract_date_from_prompt
-from typo import correct_typos_advanced
-from config import config
+from centralserver.internals.ai.utils import (
+    PH_TZ,
+    extract_date_from_prompt,
+    extract_sales_period,
+)
+from centralserver.internals.ai.typo import correct_typos_advanced
+from centralserver.internals.ai.llm import GeminiModel, ModelClient, normalize_prompt
+from centralserver.internals.ai.memory import (
+    ConversationMemory,
+    SQLiteConversationMemory,
+    create_conversation_memory,
+)
+from centralserver.internals.auth_handler import get_user, verify_user_permission
+from centralserver.internals.config_handler import AppConfig, app_config, config_store
+from centralserver.internals.sales_handler import (
+    get_daily_entry,
+    get_monthly_total,
+    get_weekly_total,
+)
 
-from auth import UserInfo
-from .routers import (get_school_daily_report_entries,logged_in_dep,)
+from centralserver.internals.ai.auth import UserInfo
+from .routers import logged_in_dep
 
 
+SYSTEM_INSTRUCTION = (
+    "You are a helpful assistant for a school canteen sales bot. "
+    "Only answer based on user prompts. If you're unsure, say you don't know. "
+    "Keep answers short, direct, and friendly."
+)
+NO_SCHOOL_REPLY = "🏫 You are not assigned to a school, so I can't look up its sales."
+
 
+@functools.cache
+def get_model_client() -> ModelClient:
+    """Get the client of the Gemini model, creating it on first use."""
 
-# Load Gemini model
-gemini_api_key = config.get("ai", {}).get("gemini_api_key")
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel(
-    model_name="gemini-2.0-flash",
-    system_instruction=(
-        "You are a helpful assistant for a school canteen sales bot. "
-        "Only answer based on user prompts. If you're unsure, say you don't know. "
-        "Keep answers short, direct, and friendly."
+    model = GeminiModel(
+        app_config.connection.gemini_api_key, app_config.ai.model, SYSTEM_INSTRUCTION
     )
+    return ModelClient(model, app_config.ai)
+
+@functools.cache
+def get_user_memory() -> ConversationMemory | SQLiteConversationMemory:
+    """Get the memory of recent prompts of each user, creating it on first use."""
+
+    return create_conversation_memory(app_config.ai)
+
+
+MEMORY_CONFIG_FIELDS = (
+    "history_length",
+    "memory_max_users",
+    "memory_idle_timeout",
+    "memory_filepath",
 )
 
-user_memory: DefaultDict[str, Deque[str]] = defaultdict(lambda: deque(maxlen=3))
+
+def _apply_config(old_config: AppConfig, new_config: AppConfig) -> None:
+    """Create the model client and the memory again if their configuration changed."""
+
+    old_ai, new_ai = old_config.ai.export(), new_config.ai.export()
+    if (
+        old_ai != new_ai
+        or old_config.connection.gemini_api_key != new_config.connection.gemini_api_key
+    ):
+        get_model_client.cache_clear()
+
+    if any(old_ai[field] != new_ai[field] for field in MEMORY_CONFIG_FIELDS):
+        get_user_memory.cache_clear()
 
 
+config_store.subscribe(_apply_config)
+
+
+@functools.lru_cache(maxsize=1024)
 def classify_intent_local(prompt: str) -> str:
-    prompt_lower = prompt.lower()
-    for intent, keywords in INTENT_KEYWORDS.items():
-        for keyword in keywords:
-            if fuzz.partial_ratio(keyword, prompt_lower) > 85:
-                return intent
-    return "unknown"
+    # Score every keyword in one call and use the first one that matches.
+    matches = process.extract(
+        prompt.lower(),
+        KEYWORDS,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=85,
+        limit=None,
+    )
+    indices = [index for _, score, index in matches if score > 85]
+    return KEYWORD_INTENTS[min(indices)] if indices else "unknown"
 
 
-def classify_intent_gemini(prompt: str) -> str:
+async def classify_intent_gemini(prompt: str, user_id: str = "default") -> str:
     classification_prompt = f"""
 You are an intent classification AI. Classify the following user prompt into one of the following categories:
 
@@ -57,13 +115,49 @@ Respond ONLY with the category name.
 Prompt: "{prompt}"
 """
     try:
-        response = model.generate_content(classification_prompt)
-        return response.text.strip().lower()
+        intent = await get_model_client().generate(
+            classification_prompt, user_id, cache_key=("intent", normalize_prompt(prompt))
+        )
+        return intent.lower()
     except Exception as e:
         print(f"[Gemini Fallback Error] {e}")
         return "unknown"
 
 
+async def get_sales_school(
+    token: logged_in_dep, session: Session, user_info: Optional[UserInfo] = None
+) -> int | None:
+    """Get the school whose sales the user is asking about.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        user_info: The profile of the user, if it was fetched.
+
+    Returns:
+        The ID of the school, or None if the user has no school.
+
+    Raises:
+        PermissionError: If the user cannot read the sales of the school.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if user is None:
+        raise PermissionError("User not found.")
+
+    school_id = user_info.school_id if user_info else user.schoolId
+    if school_id is None or school_id < 1:  # The profile uses -1 for no school
+        return None
+
+    required_permission = (
+        "reports:local:read" if user.schoolId == school_id else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise PermissionError("You do not have permission to view sales reports.")
+
+    return school_id
+
+
 async def get_sales(
     date: str,
     user_info: Optional[UserInfo] = None,
@@ -73,44 +167,103 @@ async def get_sales(
     if not token or not session:
         return "❌ Missing authentication token or database session."
 
-    school_id = user_info.school_id if user_info else 1
-    year, month, day = map(int, date.split("-"))
+    try:
+        school_id = await get_sales_school(token, session, user_info)
+    except PermissionError:
+        return "🔒 You do not have permission to view sales reports."
+
+    if school_id is None:
+        return NO_SCHOOL_REPLY
 
     try:
-        daily_entries = await get_school_daily_report_entries(token, session, school_id, year, month)
+        entry = await get_daily_entry(session, school_id, dt.date.fromisoformat(date))
     except Exception as e:
         return f"❌ Error fetching sales data: {str(e)}"
 
-    for entry in daily_entries:
-        if entry.day == day:
-            sales = float(entry.sales or 0)
-            return f"📊 The sales on {date} was ₱{sales:,.2f}."
+    if entry is not None:
+        sales = float(entry.sales or 0)
+        return f"📊 The sales on {date} was ₱{sales:,.2f}."
 
     return f"📭 No sales record found for {date}."
 
 
+async def get_sales_summary(
+    period: str,
+    today: dt.date,
+    user_info: Optional[UserInfo] = None,
+    token: Optional[Annotated[logged_in_dep, None]] = None,
+    session: Optional[Session] = None,
+) -> str:
+    if not token or not session:
+        return "❌ Missing authentication token or database session."
+
+    try:
+        school_id = await get_sales_school(token, session, user_info)
+    except PermissionError:
+        return "🔒 You do not have permission to view sales reports."
+
+    if school_id is None:
+        return NO_SCHOOL_REPLY
+
+    last_month = today.replace(day=1) - timedelta(days=1)
+    try:
+        if period in ("this_week", "last_week"):
+            week_day = today if period == "this_week" else today - timedelta(days=7)
+            total = await get_weekly_total(session, school_id, week_day)
+            label = "this week" if period == "this_week" else "last week"
+            return (
+                f"📊 The sales {label} ({total.start} to {total.end}) "
+                f"was ₱{total.sales:,.2f}."
+            )
+
+        this_month_total = await get_monthly_total(session, school_id, today.year, today.month)
+        last_month_total = await get_monthly_total(session, school_id, last_month.year, last_month.month)
+    except Exception as e:
+        return f"❌ Error fetching sales data: {str(e)}"
+
+    if period == "this_month":
+        return f"📊 The sales this month was ₱{this_month_total.sales:,.2f}."
+    if period == "last_month":
+        return f"📊 The sales last month was ₱{last_month_total.sales:,.2f}."
+
+    difference = this_month_total.sales - last_month_total.sales
+    comparison = (
+        f" ({difference / last_month_total.sales:+.1%})" if last_month_total.sales else ""
+    )
+    return (
+        f"📊 The sales this month was ₱{this_month_total.sales:,.2f}, compared to "
+        f"₱{last_month_total.sales:,.2f} last month{comparison}."
+    )
+
+
 async def smart_ask(prompt: str, user_id: str = "default", user_info: Optional[UserInfo] = None, token: Optional[logged_in_dep] = None, session: Optional[Session] = None) -> str:
     prompt = prompt.strip()
     if not prompt:
         return ""
 
     prompt_corrected = correct_typos_advanced(prompt)
-    user_memory[user_id].append(prompt)
-    recent_history: list[str] = list(user_memory[user_id])
+
+    # Remember and limit requests by the authenticated user if known
+    requester_id = user_info.id if user_info else user_id
+    memory = get_user_memory()
+    if isinstance(memory, SQLiteConversationMemory):
+        # Reading and writing the database file blocks, so keep it off the event loop.
+        recent_history = await asyncio.to_thread(memory.add, requester_id, prompt)
+    else:
+        recent_history = memory.add(requester_id, prompt)
 
     intent = classify_intent_local(prompt_corrected)
     if intent == "unknown":
-        intent = classify_intent_gemini(prompt_corrected)
+        intent = await classify_intent_gemini(prompt_corrected, requester_id)
 
     now_ph = datetime.now(PH_TZ)
 
     if intent == "sales_query":
-        if "kahapon" in prompt_corrected or "yesterday" in prompt_corrected:
-            return await get_sales((now_ph - timedelta(days=1)).strftime("%Y-%m-%d"), user_info, token, session)
-        elif "ngayon" in prompt_corrected or "today" in prompt_corrected:
-            return await get_sales(now_ph.strftime("%Y-%m-%d"), user_info, token, session)
+        period = extract_sales_period(prompt_corrected)
+        if period:
+            return await get_sales_summary(period, now_ph.date(), user_info, token, session)
 
-        extracted_date = extract_date_from_prompt(prompt_corrected)
+        extracted_date = extract_date_from_prompt(prompt_corrected, now_ph)
         if extracted_date:
             return await get_sales(extracted_date, user_info, token, session)
 
@@ -141,11 +294,16 @@ async def smart_ask(prompt: str, user_id: str = "default", user_info: Optional[U
             try:
                 history = "\n".join(f"User: {p}" for p in recent_history[:-1])
                 gemini_prompt = f"{history}\nUser: {prompt_corrected}" if history else prompt_corrected
-                response = model.generate_content(gemini_prompt)
-                text = response.text.strip()
+                text = await get_model_client().generate(
+                    gemini_prompt,
+                    requester_id,
+                    cache_key=(intent, normalize_prompt(gemini_prompt)),
+                )
                 if len(text) > 300:
                     text = text[:300].rsplit('.', 1)[0] + "..."
                 return text
+            except TimeoutError:
+                return "⌛ Gemini took too long to reply. Please try again later."
             except Exception as e:
                 return f"🤖 Gemini error: {str(e)}"
         else:
@@ -20,3 +20,23 @@ SAFE_GENERAL_TOPICS = [
     "tell me about yourself",
     "who made you"
 ]
+
+# Lowercased keywords in the order they are checked, and the intent of each.
+KEYWORDS = tuple(kw.lower() for kws in INTENT_KEYWORDS.values() for kw in kws)
+KEYWORD_INTENTS = tuple(
+    intent for intent, kws in INTENT_KEYWORDS.items() for _ in kws
+)
+
+# Common Tagalog words in prompts. These are not corrected by the English
+# spell checker, which would change them into unrelated English words.
+TAGALOG_WORDS = frozenset(
+    {
+        "ako", "ang", "ano", "araw", "ba", "benta", "bukas", "buwan",
+        "din", "ito", "ka", "kahapon", "kailan", "kami", "kamusta", "kanina",
+        "kinita", "kita", "ko", "kumusta", "lang", "linggo", "magkano",
+        "maraming", "mo", "na", "naging", "nabenta", "nakaraan",
+        "nakaraang", "namin", "natin", "ng", "ngayon", "ngayong", "nila",
+        "noon", "noong", "nung", "pa", "paano", "po", "sa", "salamat",
+        "si", "taon", "tayo", "yung",
+    }
+)
@@ -0,0 +1,163 @@
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+import google.generativeai as genai
+
+from centralserver.internals.config_handler import AI
+
+
+class LanguageModel(Protocol):
+    """A model that generates a text reply to a prompt."""
+
+    async def generate(self, prompt: str) -> str:
+        """Generate a reply to the prompt."""
+        ...
+
+
+class GeminiModel:
+    """Generate replies with the Google Gemini API."""
+
+    def __init__(
+        self, api_key: str | None, model_name: str, system_instruction: str
+    ) -> None:
+        genai.configure(api_key=api_key)
+        self.__model = genai.GenerativeModel(
+            model_name=model_name, system_instruction=system_instruction
+        )
+
+    async def generate(self, prompt: str) -> str:
+        response = await self.__model.generate_content_async(prompt)
+        return response.text
+
+
+class TTLCache:
+    """A bounded cache whose entries expire after some time."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        """Create a new cache.
+
+        Args:
+            ttl: Seconds to keep each entry. Nothing is cached if this is 0.
+            maxsize: Maximum number of entries. The least recently used
+                     entry is removed when the cache is full.
+        """
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.__entries: OrderedDict[tuple[str, ...], tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: tuple[str, ...]) -> str | None:
+        """Get a value from the cache, or None if it is missing or expired."""
+
+        entry = self.__entries.get(key, None)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.__entries[key]
+            return None
+
+        self.__entries.move_to_end(key)
+        return value
+
+    def set(self, key: tuple[str, ...], value: str) -> None:
+        """Add a value to the cache."""
+
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self.__entries[key] = (time.monotonic() + self.ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.maxsize:
+            _ = self.__entries.popitem(last=False)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so that trivially different prompts share a cache entry.
+
+    Args:
+        prompt: The prompt to normalize.
+
+    Returns:
+        The prompt in lowercase, with surrounding punctuation removed and
+        whitespace collapsed.
+    """
+
+    return re.sub(r"\s+", " ", prompt.lower()).strip(" \t\n.,!?")
+
+
+class ModelClient:
+    """Send prompts to a language model without blocking the event loop.
+
+    Requests are limited globally and per user, time out after the
+    configured number of seconds, and their replies are cached.
+    """
+
+    def __init__(self, model: LanguageModel, config: AI) -> None:
+        """Create a new client.
+
+        Args:
+            model: The model to send prompts to.
+            config: The AI assistant configuration.
+        """
+
+        self.model = model
+        self.timeout = config.timeout
+        self.max_user_concurrency = config.max_user_concurrency
+        self.cache = TTLCache(config.cache_ttl, config.cache_size)
+        self.__global_limit = asyncio.Semaphore(config.max_concurrency)
+        # Semaphores of users with requests in progress, and how many.
+        self.__user_limits: dict[str, tuple[asyncio.Semaphore, int]] = {}
+
+    async def generate(
+        self, prompt: str, user_id: str, cache_key: tuple[str, ...] | None = None
+    ) -> str:
+        """Generate a reply to a prompt.
+
+        Args:
+            prompt: The prompt to send to the model.
+            user_id: The user who sent the prompt.
+            cache_key: The key of the reply in the cache. The reply is not
+                       cached if this is None.
+
+        Returns:
+            The reply of the model.
+
+        Raises:
+            TimeoutError: If there is no reply within the timeout, including
+                          the time spent waiting for other requests.
+        """
+
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        user_limit, waiting = self.__user_limits.get(
+            user_id, (asyncio.Semaphore(self.max_user_concurrency), 0)
+        )
+        self.__user_limits[user_id] = (user_limit, waiting + 1)
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with user_limit, self.__global_limit:
+                    reply = (await self.model.generate(prompt)).strip()
+
+        finally:
+            user_limit, waiting = self.__user_limits[user_id]
+            if waiting == 1:
+                del self.__user_limits[user_id]
+
+            else:
+                self.__user_limits[user_id] = (user_limit, waiting - 1)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, reply)
+
+        return reply
@@ -0,0 +1,64 @@
+import asyncio
+import importlib
+import threading
+from types import ModuleType
+
+from centralserver.internals.logger import LoggerFactory
+
+logger = LoggerFactory().get_logger(__name__)
+
+# The AI assistant imports the Gemini client, the spell checker dictionary,
+# and dateparser, which take seconds to load. They are only imported when
+# the assistant is first used, or by the warm-up thread after startup.
+AI_CORE_MODULE = "centralserver.internals.ai.core"
+
+__warm_up_thread: threading.Thread | None = None
+__warm_up_lock = threading.Lock()
+
+
+def load_ai_core() -> ModuleType:
+    """Import the AI assistant if it is not yet imported.
+
+    Returns:
+        The `centralserver.internals.ai.core` module.
+    """
+
+    return importlib.import_module(AI_CORE_MODULE)
+
+
+async def get_ai_core() -> ModuleType:
+    """Get the AI assistant without blocking the event loop while it is imported.
+
+    Returns:
+        The `centralserver.internals.ai.core` module.
+    """
+
+    return await asyncio.to_thread(load_ai_core)
+
+
+def __warm_up() -> None:
+    try:
+        core = load_ai_core()
+        # Load the spell checker and the intent keywords index
+        _ = core.classify_intent_local(core.correct_typos_advanced("hello"))
+        _ = core.extract_date_from_prompt("two weeks ago")  # Import dateparser
+        _ = core.get_model_client()
+        _ = core.get_user_memory()
+        logger.debug("AI assistant loaded")
+
+    except Exception:  # pylint: disable=W0718
+        logger.exception("Failed to load the AI assistant in the background")
+
+
+def start_warm_up() -> None:
+    """Load the AI assistant in a background thread."""
+
+    global __warm_up_thread  # pylint: disable=W0603
+    with __warm_up_lock:
+        if __warm_up_thread is not None:
+            return
+
+        __warm_up_thread = threading.Thread(
+            target=__warm_up, name="ai-warm-up", daemon=True
+        )
+        __warm_up_thread.start()
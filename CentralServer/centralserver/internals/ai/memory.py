@@ -0,0 +1,215 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import closing
+from pathlib import Path
+
+from centralserver.internals.config_handler import AI
+
+
+class ConversationMemory:
+    """Remember the recent prompts of each user in memory.
+
+    Only the prompts of the most recently active users are kept, and users
+    who have been idle for too long are forgotten.
+    """
+
+    def __init__(self, history_length: int, max_users: int, idle_timeout: float):
+        """Create a new conversation memory.
+
+        Args:
+            history_length: Number of prompts to remember per user.
+            max_users: Number of users to remember. The least recently
+                       active user is forgotten when this is exceeded.
+            idle_timeout: Seconds of inactivity before a user is forgotten.
+        """
+
+        self.history_length = history_length
+        self.max_users = max_users
+        self.idle_timeout = idle_timeout
+        self.__lock = threading.Lock()
+        # Last activity and prompts of each user, least recently active first.
+        self.__users: OrderedDict[str, tuple[float, deque[str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__users)
+
+    def add(self, user_id: str, prompt: str) -> list[str]:
+        """Remember a prompt of a user.
+
+        Args:
+            user_id: The user who sent the prompt.
+            prompt: The prompt to remember.
+
+        Returns:
+            The recent prompts of the user, oldest first, including this one.
+        """
+
+        now = time.monotonic()
+        with self.__lock:
+            self.__evict_idle(now)
+            _, history = self.__users.pop(
+                user_id, (now, deque(maxlen=self.history_length))
+            )
+            history.append(prompt)
+            self.__users[user_id] = (now, history)
+            while len(self.__users) > self.max_users:
+                _ = self.__users.popitem(last=False)
+
+            return list(history)
+
+    def get(self, user_id: str) -> list[str]:
+        """Get the recent prompts of a user, oldest first."""
+
+        with self.__lock:
+            self.__evict_idle(time.monotonic())
+            _, history = self.__users.get(user_id, (0.0, deque[str]()))
+            return list(history)
+
+    def __evict_idle(self, now: float) -> None:
+        while self.__users:
+            last_active, _ = next(iter(self.__users.values()))
+            if now - last_active < self.idle_timeout:
+                break
+
+            _ = self.__users.popitem(last=False)
+
+
+class SQLiteConversationMemory:
+    """Remember the recent prompts of each user in an SQLite database.
+
+    Conversations are kept across restarts and shared by all workers that
+    use the same database file.
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        history_length: int,
+        max_users: int,
+        idle_timeout: float,
+    ):
+        """Create a new persistent conversation memory.
+
+        Args:
+            filepath: The path to the SQLite database file.
+            history_length: Number of prompts to remember per user.
+            max_users: Number of users to remember. The least recently
+                       active users are forgotten when this is exceeded.
+            idle_timeout: Seconds of inactivity before a user is forgotten.
+        """
+
+        self.filepath = filepath
+        self.history_length = history_length
+        self.max_users = max_users
+        self.idle_timeout = idle_timeout
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self.__connect()) as connection, connection:
+            _ = connection.execute("PRAGMA journal_mode=WAL")
+            _ = connection.execute(
+                "CREATE TABLE IF NOT EXISTS conversation_memory ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "user_id TEXT NOT NULL, "
+                "prompt TEXT NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            _ = connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_conversation_memory_user_id "
+                "ON conversation_memory (user_id, id)"
+            )
+            _ = connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_conversation_memory_created_at "
+                "ON conversation_memory (created_at)"
+            )
+
+    def __connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.filepath, timeout=5.0)
+
+    def __len__(self) -> int:
+        with closing(self.__connect()) as connection:
+            row = connection.execute(
+                "SELECT COUNT(DISTINCT user_id) FROM conversation_memory "
+                "WHERE created_at >= ?",
+                (time.time() - self.idle_timeout,),
+            ).fetchone()
+            return row[0]
+
+    def add(self, user_id: str, prompt: str) -> list[str]:
+        """Remember a prompt of a user.
+
+        Args:
+            user_id: The user who sent the prompt.
+            prompt: The prompt to remember.
+
+        Returns:
+            The recent prompts of the user, oldest first, including this one.
+        """
+
+        now = time.time()
+        with closing(self.__connect()) as connection, connection:
+            # Forget idle users, and prompts that no longer fit in the history
+            _ = connection.execute(
+                "DELETE FROM conversation_memory WHERE user_id IN ("
+                "SELECT user_id FROM conversation_memory GROUP BY user_id "
+                "HAVING MAX(created_at) < ?)",
+                (now - self.idle_timeout,),
+            )
+            _ = connection.execute(
+                "INSERT INTO conversation_memory (user_id, prompt, created_at) "
+                "VALUES (?, ?, ?)",
+                (user_id, prompt, now),
+            )
+            _ = connection.execute(
+                "DELETE FROM conversation_memory WHERE user_id = ? AND id NOT IN ("
+                "SELECT id FROM conversation_memory WHERE user_id = ? "
+                "ORDER BY id DESC LIMIT ?)",
+                (user_id, user_id, self.history_length),
+            )
+            _ = connection.execute(
+                "DELETE FROM conversation_memory WHERE user_id IN ("
+                "SELECT user_id FROM conversation_memory GROUP BY user_id "
+                "ORDER BY MAX(id) DESC LIMIT -1 OFFSET ?)",
+                (self.max_users,),
+            )
+            return self.__get(connection, user_id)
+
+    def get(self, user_id: str) -> list[str]:
+        """Get the recent prompts of a user, oldest first."""
+
+        with closing(self.__connect()) as connection:
+            return self.__get(connection, user_id)
+
+    def __get(self, connection: sqlite3.Connection, user_id: str) -> list[str]:
+        rows = connection.execute(
+            "SELECT prompt FROM conversation_memory "
+            "WHERE user_id = ? AND created_at >= ? ORDER BY id DESC LIMIT ?",
+            (user_id, time.time() - self.idle_timeout, self.history_length),
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+
+def create_conversation_memory(
+    config: AI,
+) -> ConversationMemory | SQLiteConversationMemory:
+    """Create the conversation memory selected in the configuration.
+
+    Args:
+        config: The AI assistant configuration.
+
+    Returns:
+        A persistent memory if a database file is set, or an in-memory one.
+    """
+
+    if config.memory_filepath:
+        return SQLiteConversationMemory(
+            config.memory_filepath,
+            config.history_length,
+            config.memory_max_users,
+            config.memory_idle_timeout,
+        )
+
+    return ConversationMemory(
+        config.history_length, config.memory_max_users, config.memory_idle_timeout
+    )
@@ -1,10 +1,8 @@
 from centralserver.routers.users_routes import get_user_profile_endpoint
 from centralserver.routers.schools_routes import get_all_schools_endpoint, get_assigned_schools_endpoint
-from centralserver.routers.reports_routes.daily import get_school_daily_report_entries
 from centralserver.routers.misc_routes import logged_in_dep
 
 __all__ = [
-    "get_school_daily_report_entries",
     "logged_in_dep",
     "get_user_profile_endpoint",
     "get_all_schools_endpoint",
@@ -1,28 +1,61 @@
+import functools
 import re
 import typing
+
+from rapidfuzz import fuzz, process
 from spellchecker import SpellChecker
-from rapidfuzz import process
 
-from centralserver.internals.ai.intents import INTENT_KEYWORDS
+from centralserver.internals.ai.intents import KEYWORDS, TAGALOG_WORDS
+from centralserver.internals.ai.utils import MONTHS, WEEKDAYS
+
+spell = SpellChecker(language="en")
+
+# Tokens with a keyword match above this score are replaced by the keyword.
+KEYWORD_SCORE_CUTOFF: typing.Final[float] = 85
+
+# Month and weekday names are left as they are so that dates in prompts
+# can still be parsed.
+DATE_WORDS = frozenset(MONTHS) | frozenset(WEEKDAYS)
+
+
+@functools.lru_cache(maxsize=4096)
+def correct_token(token: str) -> str:
+    """Correct the spelling of a single word.
+
+    Numbers, month and weekday names, and Tagalog words are left unchanged.
+    Words close to an intent keyword are replaced by the keyword, and other
+    words are corrected with the English spell checker.
 
-spell = SpellChecker(language='en')
+    Args:
+        token: The word to correct.
+
+    Returns:
+        The corrected word.
+    """
+
+    if not token.isalpha():
+        return token
+
+    token_lower = token.lower()
+    if token_lower in DATE_WORDS or token_lower in TAGALOG_WORDS:
+        return token
+
+    match = process.extractOne(
+        token_lower, KEYWORDS, scorer=fuzz.ratio, score_cutoff=KEYWORD_SCORE_CUTOFF
+    )
+    if match and match[1] > KEYWORD_SCORE_CUTOFF:
+        return match[0]
+
+    if spell.known([token_lower]):
+        return token
+
+    corrected_word = spell.correction(token)
+    return corrected_word if corrected_word else token
 
-all_keywords = [kw for kws in INTENT_KEYWORDS.values() for kw in kws]
 
 def correct_typos_advanced(text: str) -> str:
     tokens = re.findall(r"\w+|[^\w\s]", text, re.UNICODE)
-    corrected_tokens: typing.List[str] = []
-
-    for token in tokens:
-        if token.isalpha():
-            match = process.extractOne(token.lower(), [k.lower() for k in all_keywords])
-            if match and match[1] > 85:
-                corrected_tokens.append(match[0])
-            else:
-                corrected_word = spell.correction(token)
-                corrected_tokens.append(corrected_word if corrected_word else token)
-        else:
-            corrected_tokens.append(token)
+    corrected_tokens: typing.List[str] = [correct_token(token) for token in tokens]
 
     output = ""
     for t in corrected_tokens:
@@ -1,7 +1,7 @@
-from datetime import datetime
+import re
+from datetime import date, datetime, timedelta
 from pytz import timezone
 from typing import Optional, TypedDict
-from dateparser.search import search_dates
 
 PH_TZ = timezone("Asia/Manila")
 
@@ -12,22 +12,124 @@ ROLE_MAP = {
     5: "Canteen Manager",
 }
 
+# Periods of sales totals that can be asked for, checked in order.
+SALES_PERIOD_PATTERNS = (
+    ("compare_month", re.compile(r"\b(compare|ikumpara|kumpara)\b.*\b(month|buwan)\b")),
+    ("last_week", re.compile(r"\b(last|previous|nakaraang)\s+(week|linggo)\b")),
+    ("this_week", re.compile(r"\b(this|ngayong)\s+(week|linggo)\b")),
+    ("last_month", re.compile(r"\b(last|previous|nakaraang)\s+(month|buwan)\b")),
+    ("this_month", re.compile(r"\b(this|ngayong)\s+(month|buwan)\b")),
+)
+
+# Month and weekday names (and abbreviations) in English and Tagalog.
+MONTHS = {
+    "january": 1, "jan": 1, "enero": 1,
+    "february": 2, "feb": 2, "pebrero": 2,
+    "march": 3, "mar": 3, "marso": 3,
+    "april": 4, "apr": 4, "abril": 4,
+    "may": 5, "mayo": 5,
+    "june": 6, "jun": 6, "hunyo": 6,
+    "july": 7, "jul": 7, "hulyo": 7,
+    "august": 8, "aug": 8, "agosto": 8,
+    "september": 9, "sep": 9, "sept": 9, "setyembre": 9,
+    "october": 10, "oct": 10, "oktubre": 10,
+    "november": 11, "nov": 11, "nobyembre": 11,
+    "december": 12, "dec": 12, "disyembre": 12,
+}
+WEEKDAYS = {
+    "monday": 0, "mon": 0, "lunes": 0,
+    "tuesday": 1, "tue": 1, "tues": 1, "martes": 1,
+    "wednesday": 2, "wed": 2, "miyerkules": 2,
+    "thursday": 3, "thu": 3, "thurs": 3, "huwebes": 3,
+    "friday": 4, "fri": 4, "biyernes": 4,
+    "saturday": 5, "sat": 5, "sabado": 5,
+    "sunday": 6, "sun": 6, "linggo": 6,
+}
+# Days before today, for words that refer to a day relative to today.
+RELATIVE_DAYS = {
+    "today": 0, "ngayon": 0, "ngayong araw": 0,
+    "yesterday": 1, "kahapon": 1,
+    "day before yesterday": 2, "kamakalawa": 2,
+}
+
+_MONTH = "|".join(sorted(MONTHS, key=len, reverse=True))
+_WEEKDAY = "|".join(sorted(WEEKDAYS, key=len, reverse=True))
+_RELATIVE_DAY = "|".join(sorted(RELATIVE_DAYS, key=len, reverse=True))
+_DAY = r"(?:ika-?\s*)?(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?:,?\s+(?P<year>\d{4}))?"
+
+# Date formats checked before falling back to dateparser, in order.
+DATE_PATTERNS = (
+    ("iso", re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\b")),
+    ("numeric", re.compile(r"\b(?P<month>\d{1,2})/(?P<day>\d{1,2})(?:/(?P<year>\d{4}))?\b")),
+    ("month_day", re.compile(rf"\b(?P<month_name>{_MONTH})\.?\s+{_DAY}\b{_YEAR}")),
+    ("day_month", re.compile(rf"\b{_DAY}\s+(?:ng\s+|of\s+)?(?P<month_name>{_MONTH})\b{_YEAR}")),
+    ("relative", re.compile(rf"\b(?P<relative>{_RELATIVE_DAY})\b")),
+    ("weekday", re.compile(rf"\b(?:(?P<past>last|noong|nung|nakaraang)\s+)?(?P<weekday>{_WEEKDAY})\b")),
+)
+
 class DailyFinancialReportEntry(TypedDict, total=False):
     day: int
     sales: Optional[float]
     purchases: Optional[float]
     parent: Optional[str]
 
-def extract_date_from_prompt(prompt: str) -> Optional[str]:
-    now_ph = datetime.now(PH_TZ)
-    base_year = 2025  # or dynamically: now_ph.year
-    relative_base = now_ph.replace(year=base_year)
+def parse_date_rules(prompt: str, today: date) -> Optional[date]:
+    """Find a date in a prompt using the common English and Tagalog formats.
+
+    Dates without a year are assumed to be in the past, like in dateparser.
+
+    Args:
+        prompt: The prompt to search.
+        today: The date to resolve relative dates against.
+
+    Returns:
+        The first date found, or None if no known format matches.
+    """
+
+    prompt_lower = prompt.lower()
+    for kind, pattern in DATE_PATTERNS:
+        match = pattern.search(prompt_lower)
+        if match is None:
+            continue
+
+        if kind == "relative":
+            return today - timedelta(days=RELATIVE_DAYS[match["relative"]])
+
+        if kind == "weekday":
+            days_back = (today.weekday() - WEEKDAYS[match["weekday"]]) % 7
+            return today - timedelta(days=days_back or (7 if match["past"] else 0))
+
+        month = MONTHS[match["month_name"]] if match.groupdict().get("month_name") else int(match["month"])
+        try:
+            if match["year"]:
+                return date(int(match["year"]), month, int(match["day"]))
+
+            parsed = date(today.year, month, int(match["day"]))
+            return parsed if parsed <= today else parsed.replace(year=today.year - 1)
+
+        except ValueError:  # Not a valid date, such as February 30
+            continue
+
+    return None
+
+
+def extract_date_from_prompt(prompt: str, now: Optional[datetime] = None) -> Optional[str]:
+    now_ph = now or datetime.now(PH_TZ)
+
+    parsed = parse_date_rules(prompt, now_ph.date())
+    if parsed is not None:
+        return parsed.strftime("%Y-%m-%d")
+
+    # dateparser is slow to import and to search, so it is only used for
+    # formats that the rules above do not handle.
+    from dateparser.search import search_dates
 
     result = search_dates(
         prompt,
         settings={
             "PREFER_DATES_FROM": "past",
-            "RELATIVE_BASE": relative_base
+            "RELATIVE_BASE": now_ph.replace(tzinfo=None),
         },
         languages=["en", "tl"]
     )
@@ -37,3 +139,13 @@ def extract_date_from_prompt(prompt: str) -> Optional[str]:
         return parsed_date.strftime("%Y-%m-%d")
 
     return None
+
+
+def extract_sales_period(prompt: str) -> Optional[str]:
+    """Get the period of sales totals asked for in a prompt, if any."""
+
+    prompt_lower = prompt.lower()
+    for period, pattern in SALES_PERIOD_PATTERNS:
+        if pattern.search(prompt_lower):
+            return period
+    return None
@@ -14,8 +14,8 @@ from centralserver import info
 from centralserver.internals import permissions
 from centralserver.internals.adapters.oauth import GoogleOAuthAdapter
 from centralserver.internals.config_handler import app_config
-from centralserver.internals.logger import LoggerFactory
-from centralserver.internals.mail_handler import get_template, send_mail
+from centralserver.internals.logger import LoggerFactory, bind_request_user
+from centralserver.internals.mail_handler import get_template_pair, send_mail
 from centralserver.internals.models.role import Role
 from centralserver.internals.models.token import DecodedJWTToken, JWTToken
 from centralserver.internals.models.user import User
@@ -208,30 +208,22 @@ async def authenticate_user(
                 found_user.failedLoginAttempts
                 == app_config.security.failed_login_notify_attempts
             ):
+                text, html = get_template_pair(
+                    "unusual_login",
+                    name=found_user.nameFirst or found_user.username,
+                    app_name=info.Program.name,
+                    failed_login_attempts=found_user.failedLoginAttempts,
+                    last_failed_login_time=found_user.lastFailedLoginTime.strftime(
+                        "%d %B %Y %I:%M:%S %p"
+                    ),
+                    last_failed_login_ip=found_user.lastFailedLoginIp or "Unknown",
+                )
                 background_tasks.add_task(
                     send_mail,
                     to_address=found_user.email,
                     subject=f"{info.Program.name} | Someone is trying to access your account",
-                    text=get_template(
-                        "unusual_login.txt",
-                        name=found_user.nameFirst or found_user.username,
-                        app_name=info.Program.name,
-                        failed_login_attempts=found_user.failedLoginAttempts,
-                        last_failed_login_time=found_user.lastFailedLoginTime.strftime(
-                            "%d %B %Y %I:%M:%S %p"
-                        ),
-                        last_failed_login_ip=found_user.lastFailedLoginIp or "Unknown",
-                    ),
-                    html=get_template(
-                        "unusual_login.html",
-                        name=found_user.nameFirst or found_user.username,
-                        app_name=info.Program.name,
-                        failed_login_attempts=found_user.failedLoginAttempts,
-                        last_failed_login_time=found_user.lastFailedLoginTime.strftime(
-                            "%d %B %Y %I:%M:%S %p"
-                        ),
-                        last_failed_login_ip=found_user.lastFailedLoginIp or "Unknown",
-                    ),
+                    text=text,
+                    html=html,
                 )
 
         tries_remaining = (
@@ -362,6 +354,7 @@ async def verify_access_token(
                 detail="Failed to validate user.",
             )
 
+        bind_request_user(user_id)
         return DecodedJWTToken(id=user_id, is_refresh_token=is_refresh_token)
 
     except (JWTError, JWEError) as e:
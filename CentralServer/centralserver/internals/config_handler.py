@@ -1,7 +1,11 @@
+import copy
+import functools
 import json
+import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, cast
 
 from centralserver import info
 from centralserver.internals.adapters.config import (
@@ -104,6 +108,13 @@ class Logging:
         "encoding",
         "log_format",
         "date_format",
+        "queue_size",
+        "json_format",
+        "debug_sample_rate",
+        "debug_sample_routes",
+        "slow_query_ms",
+        "query_budget",
+        "query_budget_routes",
     ]
 
     def __init__(
@@ -115,6 +126,13 @@ class Logging:
         encoding: str | None = None,
         log_format: str | None = None,
         date_format: str | None = None,
+        queue_size: int | None = None,
+        json_format: bool | None = None,
+        debug_sample_rate: float | None = None,
+        debug_sample_routes: dict[str, float] | None = None,
+        slow_query_ms: int | None = None,
+        query_budget: int | None = None,
+        query_budget_routes: dict[str, int] | None = None,
     ):
         """Create a configuration object for logging.
 
@@ -126,8 +144,30 @@ class Logging:
             encoding: The encoding of the log file.
             log_format: The format of the log messages.
             date_format: The format of the date in the log messages.
+            queue_size: The maximum number of log records waiting to be
+                        written. Records are dropped when the queue is full.
+            json_format: Whether to write log records as JSON objects. (Default: False)
+            debug_sample_rate: The fraction of requests whose debug messages
+                               are logged. (Default: 1.0)
+            debug_sample_routes: Per-route overrides of `debug_sample_rate`,
+                                 keyed by route path (e.g. "/v1/users/me").
+            slow_query_ms: Log database queries that take longer than this
+                           many milliseconds. Set to 0 to disable. (Default: 500)
+            query_budget: The maximum number of database queries a request
+                          should make before a warning is logged. Set to 0
+                          to disable. (Default: 25)
+            query_budget_routes: Per-route overrides of `query_budget`, keyed
+                                 by route path.
         """
 
+        if debug_sample_rate is not None and not 0.0 <= debug_sample_rate <= 1.0:
+            raise ValueError("Debug sample rate must be between 0.0 and 1.0.")
+
+        if debug_sample_routes is not None and not all(
+            0.0 <= rate <= 1.0 for rate in debug_sample_routes.values()
+        ):
+            raise ValueError("Debug sample rates must be between 0.0 and 1.0.")
+
         self.file_logging_enabled: bool = (
             file_logging_enabled if file_logging_enabled is not None else True
         )
@@ -141,6 +181,15 @@ class Logging:
             log_format or "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
         )
         self.date_format: str = date_format or "%d-%m-%y_%H-%M-%S"
+        self.queue_size: int = queue_size or 10000
+        self.json_format: bool = json_format or False
+        self.debug_sample_rate: float = (
+            debug_sample_rate if debug_sample_rate is not None else 1.0
+        )
+        self.debug_sample_routes: dict[str, float] = debug_sample_routes or {}
+        self.slow_query_ms: int = slow_query_ms if slow_query_ms is not None else 500
+        self.query_budget: int = query_budget if query_budget is not None else 25
+        self.query_budget_routes: dict[str, int] = query_budget_routes or {}
 
     def export(self) -> dict[str, Any]:
         """Export the logging configuration as a dictionary."""
@@ -386,6 +435,91 @@ class Mailing:
         }
 
 
+class AI:
+    """The AI assistant configuration."""
+
+    __exportable_fields = [
+        "enabled",
+        "warm_up",
+        "model",
+        "timeout",
+        "max_concurrency",
+        "max_user_concurrency",
+        "cache_ttl",
+        "cache_size",
+        "history_length",
+        "memory_max_users",
+        "memory_idle_timeout",
+        "memory_filepath",
+    ]
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        warm_up: bool | None = None,
+        model: str | None = None,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        max_user_concurrency: int | None = None,
+        cache_ttl: float | None = None,
+        cache_size: int | None = None,
+        history_length: int | None = None,
+        memory_max_users: int | None = None,
+        memory_idle_timeout: float | None = None,
+        memory_filepath: str | None = None,
+    ):
+        """Create a configuration object for the AI assistant.
+
+        The Gemini API key is set in the connection configuration.
+
+        Args:
+            enabled: Whether the AI assistant is enabled. (Default: True)
+            warm_up: Load the AI assistant in the background after startup instead of on first use. (Default: True)
+            model: The Gemini model to use. (Default: "gemini-2.0-flash")
+            timeout: Seconds to wait for a reply from the model. (Default: 30)
+            max_concurrency: Maximum number of requests to the model at a time. (Default: 8)
+            max_user_concurrency: Maximum number of requests to the model at a time per user. (Default: 1)
+            cache_ttl: Seconds to keep replies of the model in the cache, 0 to disable. (Default: 300)
+            cache_size: Maximum number of replies in the cache. (Default: 1024)
+            history_length: Number of recent prompts to remember per user. (Default: 3)
+            memory_max_users: Maximum number of users to remember prompts of. (Default: 1000)
+            memory_idle_timeout: Seconds before the prompts of an idle user are forgotten. (Default: 3600)
+            memory_filepath: SQLite database file to keep prompts in across restarts. (Optional)
+        """
+
+        if (max_concurrency is not None and max_concurrency < 1) or (
+            max_user_concurrency is not None and max_user_concurrency < 1
+        ):
+            raise ValueError("AI concurrency limits must be at least 1.")
+
+        if (history_length is not None and history_length < 1) or (
+            memory_max_users is not None and memory_max_users < 1
+        ):
+            raise ValueError("AI memory limits must be at least 1.")
+
+        self.enabled: bool = enabled if enabled is not None else True
+        self.warm_up: bool = warm_up if warm_up is not None else True
+        self.model: str = model or "gemini-2.0-flash"
+        self.timeout: float = timeout or 30.0
+        self.max_concurrency: int = max_concurrency or 8
+        self.max_user_concurrency: int = max_user_concurrency or 1
+        self.cache_ttl: float = cache_ttl if cache_ttl is not None else 300.0
+        self.cache_size: int = cache_size if cache_size is not None else 1024
+        self.history_length: int = history_length or 3
+        self.memory_max_users: int = memory_max_users or 1000
+        self.memory_idle_timeout: float = memory_idle_timeout or 3600.0
+        self.memory_filepath: str | None = memory_filepath
+
+    def export(self) -> dict[str, Any]:
+        """Export the AI assistant configuration as a dictionary."""
+
+        return {
+            field: getattr(self, field)
+            for field in AI.__exportable_fields
+            if hasattr(self, field)
+        }
+
+
 class AppConfig:
     """The main configuration object for the application."""
 
@@ -401,6 +535,7 @@ class AppConfig:
         authentication: Authentication | None = None,
         security: Security | None = None,
         mailing: Mailing | None = None,
+        ai: AI | None = None,
     ):
         """Create a configuration object for the application.
 
@@ -416,6 +551,7 @@ class AppConfig:
             authentication: Authentication configuration.
             security: Security configuration.
             mailing: Mailing configuration.
+            ai: AI assistant configuration.
         """
 
         self.__filepath: str | Path = fp
@@ -433,6 +569,7 @@ class AppConfig:
         self.authentication: Authentication = authentication or Authentication()
         self.security: Security = security or Security()
         self.mailing: Mailing = mailing or Mailing()
+        self.ai: AI = ai or AI()
 
     @property
     def filepath(self) -> str | Path:
@@ -457,6 +594,7 @@ class AppConfig:
             "authentication": self.authentication.export(),
             "security": self.security.export(),
             "mailing": self.mailing.export(),
+            "ai": self.ai.export(),
         }
 
     def save(self) -> None:
@@ -498,6 +636,7 @@ def read_config(
     authentication_config = config.get("authentication", {})
     security_config = config.get("security", {})
     mailing_config = config.get("mailing", {})
+    ai_config = config.get("ai", {})
 
     # Determine database type and create the appropriate config object
     database: dict[str, Any] = config.get("database", {})
@@ -627,6 +766,13 @@ def read_config(
             encoding=logging_config.get("encoding", None),
             log_format=logging_config.get("log_format", None),
             date_format=logging_config.get("date_format", None),
+            queue_size=logging_config.get("queue_size", None),
+            json_format=logging_config.get("json_format", None),
+            debug_sample_rate=logging_config.get("debug_sample_rate", None),
+            debug_sample_routes=logging_config.get("debug_sample_routes", None),
+            slow_query_ms=logging_config.get("slow_query_ms", None),
+            query_budget=logging_config.get("query_budget", None),
+            query_budget_routes=logging_config.get("query_budget_routes", None),
         ),
         database=final_db_config,
         object_store=final_object_store_config,
@@ -683,6 +829,20 @@ def read_config(
             templates_dir=mailing_config.get("templates_dir", None),
             templates_encoding=mailing_config.get("templates_encoding", None),
         ),
+        ai=AI(
+            enabled=ai_config.get("enabled", None),
+            warm_up=ai_config.get("warm_up", None),
+            model=ai_config.get("model", None),
+            timeout=ai_config.get("timeout", None),
+            max_concurrency=ai_config.get("max_concurrency", None),
+            max_user_concurrency=ai_config.get("max_user_concurrency", None),
+            cache_ttl=ai_config.get("cache_ttl", None),
+            cache_size=ai_config.get("cache_size", None),
+            history_length=ai_config.get("history_length", None),
+            memory_max_users=ai_config.get("memory_max_users", None),
+            memory_idle_timeout=ai_config.get("memory_idle_timeout", None),
+            memory_filepath=ai_config.get("memory_filepath", None),
+        ),
     )
 
 
@@ -712,15 +872,189 @@ def __read_config_file(
         )
 
 
+class ConfigStore:
+    """Hold the current configuration and reload it when its file changes.
+
+    Attribute access is forwarded to the current `AppConfig` snapshot. When
+    the configuration file changes, it is read and validated again, and the
+    snapshot is replaced as a whole. Code that reads `app_config.<section>`
+    when it needs a value always sees the latest configuration. Code that
+    copies values at startup can subscribe to be notified of changes. The
+    store is read-only, so a snapshot is never changed once it is in use.
+    """
+
+    def __init__(self, loader: Callable[[], AppConfig]):
+        """Create a new configuration store.
+
+        Args:
+            loader: A function that reads and validates the configuration file.
+        """
+
+        self.__loader = loader
+        self.__current: AppConfig = loader()
+        self.__mtime: float | None = self.__get_mtime()
+        self.__subscribers: list[Callable[[AppConfig, AppConfig], None]] = []
+        self.__lock = threading.Lock()
+        self.__watcher: threading.Thread | None = None
+        self.__stop_watching = threading.Event()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_ConfigStore__"):  # Not yet initialized
+            raise AttributeError(name)
+
+        return getattr(self.__current, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_ConfigStore__"):
+            raise AttributeError(
+                f"Cannot set `{name}`: the configuration is read-only. "
+                "Change the configuration file instead."
+            )
+
+        object.__setattr__(self, name, value)
+
+    @property
+    def current(self) -> AppConfig:
+        """Get the current configuration snapshot."""
+
+        return self.__current
+
+    def set_run_internal(self, run_internal: bool) -> None:
+        """Set whether the server was started with `python -m centralserver`.
+
+        The current snapshot is replaced with a copy that has the new value,
+        and the value is kept when the configuration is reloaded.
+
+        Args:
+            run_internal: True if the server was started using `__main__`.
+        """
+
+        with self.__lock:
+            new_config = copy.copy(self.__current)
+            new_config.run_internal = run_internal
+            self.__current = new_config
+
+    def __get_mtime(self) -> float | None:
+        try:
+            return os.stat(self.__current.filepath).st_mtime
+
+        except OSError:
+            return None
+
+    def subscribe(self, callback: Callable[[AppConfig, AppConfig], None]) -> None:
+        """Call a function every time the configuration is reloaded.
+
+        Args:
+            callback: A function that takes the old and new configuration.
+        """
+
+        self.__subscribers.append(callback)
+
+    def reload(self) -> AppConfig:
+        """Read the configuration file and replace the current configuration.
+
+        Returns:
+            The new configuration.
+
+        Raises:
+            OSError: If the configuration file cannot be read.
+            ValueError: If the configuration file is invalid. The current
+                        configuration is kept.
+        """
+
+        with self.__lock:
+            new_config = self.__loader()
+            new_config.run_internal = self.__current.run_internal
+            old_config, self.__current = self.__current, new_config
+            self.__mtime = self.__get_mtime()
+
+        for callback in self.__subscribers:
+            try:
+                callback(old_config, new_config)
+
+            except Exception:  # pylint: disable=W0718
+                logging.getLogger(__name__).exception(
+                    "Failed to apply configuration change to %s", callback
+                )
+
+        return new_config
+
+    def reload_if_changed(self) -> bool:
+        """Reload the configuration if its file was modified.
+
+        Returns:
+            True if the configuration was reloaded.
+        """
+
+        mtime = self.__get_mtime()
+        if mtime is None or mtime == self.__mtime:
+            return False
+
+        try:
+            _ = self.reload()
+            return True
+
+        except Exception:  # pylint: disable=W0718
+            # Keep the current configuration, and keep watching the file.
+            self.__mtime = mtime  # Do not retry until the file changes again
+            logging.getLogger(__name__).exception(
+                "Ignoring invalid configuration file %s", self.filepath
+            )
+            return False
+
+    def watch(self, interval: float = 5.0) -> None:
+        """Check the configuration file for changes in a background thread.
+
+        Args:
+            interval: How often to check the file, in seconds.
+        """
+
+        with self.__lock:
+            if self.__watcher is not None and self.__watcher.is_alive():
+                return
+
+            self.__stop_watching.clear()
+            self.__watcher = threading.Thread(
+                target=self.__watch,
+                args=(interval,),
+                name="config-watcher",
+                daemon=True,
+            )
+            self.__watcher.start()
+
+    def __watch(self, interval: float) -> None:
+        while not self.__stop_watching.wait(interval):
+            _ = self.reload_if_changed()
+
+    def stop_watching(self) -> None:
+        """Stop checking the configuration file for changes."""
+
+        self.__stop_watching.set()
+        with self.__lock:
+            watcher, self.__watcher = self.__watcher, None
+
+        if watcher is not None:
+            watcher.join()
+
+
 # The global configuration object for the application.
 __port = os.getenv("CENTRAL_SERVER_PORT", None)
 if __port is not None:
     __port = int(__port)
 
-app_config = __read_config_file(
-    os.getenv("CENTRAL_SERVER_CONFIG_FILE", str(info.Configuration.default_filepath)),
-    os.getenv("CENTRAL_SERVER_CONFIG_ENCODING", info.Configuration.default_encoding),
-    os.getenv("CENTRAL_SERVER_HOST", None),
-    __port,
-    os.getenv("CENTRAL_SERVER_HOT_RELOAD", "false").lower() == "true",
+config_store = ConfigStore(
+    functools.partial(
+        __read_config_file,
+        os.getenv(
+            "CENTRAL_SERVER_CONFIG_FILE", str(info.Configuration.default_filepath)
+        ),
+        os.getenv(
+            "CENTRAL_SERVER_CONFIG_ENCODING", info.Configuration.default_encoding
+        ),
+        os.getenv("CENTRAL_SERVER_HOST", None),
+        __port,
+        os.getenv("CENTRAL_SERVER_HOT_RELOAD", "false").lower() == "true",
+    )
 )
+# Typed as AppConfig; attribute access always reads the current configuration.
+app_config = cast(AppConfig, config_store)
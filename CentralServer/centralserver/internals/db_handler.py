@@ -1,14 +1,42 @@
-from typing import Generator
+from contextlib import contextmanager
+from hashlib import sha256
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Generator, Iterator
 
+from sqlalchemy import Column, Dialect, Table, event, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import ExecutionContext
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from centralserver import info
 from centralserver.internals import models, permissions
 from centralserver.internals.config_handler import app_config
-from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.logger import LoggerFactory, request_context
+from centralserver.internals.metrics import DB_QUERIES, DB_QUERY_DURATION
+from centralserver.internals.migration_handler import (
+    MIGRATIONS,
+    migrate,
+    plan_migrations,
+)
+from centralserver.internals.models.schema_migration import SchemaFingerprint
 from centralserver.internals.user_handler import create_user
 
+try:
+    import fcntl
+except ImportError:  # Windows has no `flock()`; SQLite workers are not coordinated
+    fcntl = None
+
 logger = LoggerFactory().get_logger(__name__)
+
+# The lock that only one worker can hold while it populates the database
+POPULATE_LOCK_KEY = 0x53434152  # PostgreSQL advisory lock key
+POPULATE_LOCK_NAME = "centralserver.populate_db"  # MySQL named lock
+POPULATE_LOCK_FILE = ".__centralserver.populate.lock"  # Next to the SQLite file
+POPULATE_LOCK_TIMEOUT = 300  # seconds
+
 engine = create_engine(
     app_config.database.sqlalchemy_uri,
     connect_args=app_config.database.connect_args,
@@ -16,6 +44,158 @@ engine = create_engine(
 )
 
 
+@event.listens_for(engine, "before_cursor_execute", named=True)
+def _before_cursor_execute(context: ExecutionContext | None, **_: Any) -> None:
+    """Record when a query starts executing."""
+
+    if context is not None:
+        context.query_start_time = perf_counter()  # type: ignore[attr-defined]
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describe the bound parameters of a query without their values.
+
+    Args:
+        parameters: The parameters passed to the DB-API cursor.
+        executemany: Whether `parameters` is a sequence of parameter sets.
+
+    Returns:
+        The parameter types, and the number of parameter sets for
+        `executemany()` calls (e.g. `3 x (str, int)`).
+    """
+
+    if executemany and parameters:
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+
+    if isinstance(parameters, dict):
+        return (
+            "{"
+            + ", ".join(
+                f"{key}: {type(value).__name__}" for key, value in parameters.items()
+            )
+            + "}"
+        )
+
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+
+    return type(parameters).__name__
+
+
+@event.listens_for(engine, "after_cursor_execute", named=True)
+def _after_cursor_execute(
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+    **_: Any,
+) -> None:
+    """Record executed queries, and log those slower than the threshold."""
+
+    start: float | None = getattr(context, "query_start_time", None)
+    if start is None:
+        return
+
+    duration = perf_counter() - start
+    operation = statement.lstrip().split(maxsplit=1)[0].upper() if statement else ""
+    DB_QUERIES.inc(operation)
+    DB_QUERY_DURATION.observe(duration, operation)
+
+    current_request = request_context.get()
+    if current_request is not None:
+        current_request.query_count += 1
+
+    duration_ms = duration * 1000
+    if 0 < app_config.logging.slow_query_ms <= duration_ms:
+        logger.warning(
+            "Slow query (%.1f ms): %s | Parameters: %s",
+            duration_ms,
+            statement,
+            parameter_shape(parameters, executemany),
+            extra={"duration_ms": round(duration_ms, 1)},
+        )
+
+
+def get_natural_key(table: Table) -> list[Column[Any]]:
+    """Get the columns that identify the rows of a table.
+
+    Args:
+        table: The table.
+
+    Returns:
+        The columns of the table's unique index, or its primary key if the
+        table has no unique index.
+    """
+
+    for index in table.indexes:
+        if index.unique:
+            return list(index.columns)
+
+    return list(table.primary_key.columns)
+
+
+def upsert(
+    session: Session,
+    table: Table,
+    rows: list[dict[str, Any]],
+    update_columns: list[str],
+) -> None:
+    """Insert rows, or update some of their columns if they already exist.
+
+    All rows are written with a single `INSERT ... ON CONFLICT DO UPDATE`
+    (SQLite and PostgreSQL) or `INSERT ... ON DUPLICATE KEY UPDATE` (MySQL)
+    statement. Rows conflict if they have the same natural key (see
+    `get_natural_key()`).
+
+    Args:
+        session: The database session to execute the statement in.
+        table: The table to write to.
+        rows: The values of the rows to write.
+        update_columns: The columns to update in rows that already exist, or
+            an empty list to leave existing rows as they are.
+
+    Raises:
+        ValueError: If the database does not support upserts.
+    """
+
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+    match dialect:
+        case "sqlite" | "postgresql":
+            dialect_module = sqlite if dialect == "sqlite" else postgresql
+            insert_statement = dialect_module.insert(table).values(rows)
+            if not update_columns:
+                statement = insert_statement.on_conflict_do_nothing(
+                    index_elements=get_natural_key(table)
+                )
+            else:
+                statement = insert_statement.on_conflict_do_update(
+                    index_elements=get_natural_key(table),
+                    set_={
+                        column: insert_statement.excluded[column]
+                        for column in update_columns
+                    },
+                )
+
+        case "mysql" | "mariadb":
+            insert_statement = mysql.insert(table).values(rows)
+            # Setting a key column to itself leaves the existing row unchanged.
+            statement = insert_statement.on_duplicate_key_update(
+                {column: insert_statement.inserted[column] for column in update_columns}
+                or {
+                    column.name: column
+                    for column in list(table.primary_key.columns)[:1]
+                }
+            )
+
+        case _:
+            raise ValueError(f"Upserts are not supported on {dialect} databases.")
+
+    _ = session.exec(statement)
+
+
 def get_db_session() -> Generator[Session, None, None]:
     """Get a new database session.
 
@@ -28,10 +208,147 @@ def get_db_session() -> Generator[Session, None, None]:
         yield session
 
 
+def get_schema_fingerprint(dialect: Dialect) -> str:
+    """Hash the schema of the models and the records that `populate_db()`
+    creates with it.
+
+    Args:
+        dialect: The dialect of the database.
+
+    Returns:
+        The fingerprint of the schema.
+    """
+
+    digest = sha256()
+    for table in SQLModel.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+
+    digest.update(f"migration:{MIGRATIONS[-1].version}".encode())
+    for role in permissions.DEFAULT_ROLES:
+        digest.update(f"role:{role.id}:{role.description}:{role.modifiable}".encode())
+
+    digest.update(f"user:{info.Database.default_user}".encode())
+    return digest.hexdigest()
+
+
+def get_stored_schema_fingerprint() -> str | None:
+    """Get the fingerprint of the schema that the database was populated with.
+
+    Returns:
+        The fingerprint, or None if the database was never populated.
+    """
+
+    try:
+        with engine.connect() as connection:
+            return connection.execute(
+                select(SchemaFingerprint.fingerprint).where(SchemaFingerprint.id == 1)
+            ).scalar()
+
+    except (OperationalError, ProgrammingError):  # The table does not exist yet
+        return None
+
+
+@contextmanager
+def _populate_lock() -> Iterator[None]:
+    """Hold a lock that only one worker at a time can take while it populates
+    the database. The lock is released if the worker dies."""
+
+    with engine.connect() as connection:
+        match connection.dialect.name:
+            case "postgresql":
+                _ = connection.execute(
+                    text("SELECT pg_advisory_lock(:key)"), {"key": POPULATE_LOCK_KEY}
+                )
+                # The lock outlives the transaction, which would otherwise keep
+                # `CREATE INDEX CONCURRENTLY` waiting in the migrations.
+                connection.commit()
+                try:
+                    yield
+                finally:
+                    _ = connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": POPULATE_LOCK_KEY},
+                    )
+
+            case "mysql" | "mariadb":
+                locked = connection.execute(
+                    text("SELECT GET_LOCK(:name, :timeout)"),
+                    {"name": POPULATE_LOCK_NAME, "timeout": POPULATE_LOCK_TIMEOUT},
+                ).scalar()
+                connection.commit()
+                if not locked:
+                    logger.warning("Populating the database without its lock.")
+
+                try:
+                    yield
+                finally:
+                    _ = connection.execute(
+                        text("SELECT RELEASE_LOCK(:name)"), {"name": POPULATE_LOCK_NAME}
+                    )
+
+            case _:
+                database = connection.engine.url.database
+                if fcntl is None or not database or database == ":memory:":
+                    yield
+                    return
+
+                lock_path = Path(database).absolute().parent / POPULATE_LOCK_FILE
+                with open(lock_path, "a", encoding="utf-8") as lock_file:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 async def populate_db() -> bool:
-    """Populate the database with tables."""
+    """Populate the database with tables and default records.
+
+    Only the fingerprint of the schema is read when it matches the models, so
+    workers that start after the database is populated skip everything else.
+
+    Returns:
+        True if any default record was created.
+    """
+
+    fingerprint = get_schema_fingerprint(engine.dialect)
+    if get_stored_schema_fingerprint() == fingerprint:
+        logger.debug("The database is already populated.")
+        return False
+
+    with _populate_lock():
+        # Another worker may have populated the database while this one waited.
+        if get_stored_schema_fingerprint() == fingerprint:
+            logger.debug("The database was populated by another worker.")
+            return False
+
+        populated = await _populate_db()
+        with next(get_db_session()) as session:
+            _ = session.merge(SchemaFingerprint(fingerprint=fingerprint))
+            session.commit()
+
+    return populated
+
+
+async def _populate_db() -> bool:
+    """Migrate the database, create its tables, and create the default
+    records that do not exist yet."""
 
     populated = False
+    for planned in plan_migrations(engine):
+        if planned.blocking:
+            logger.warning(
+                "Migration %s locks %s (about %s rows) while it runs: %s",
+                planned.version,
+                planned.table,
+                planned.rows,
+                planned.statement,
+            )
+
+    _ = migrate(engine)
+
     logger.warning("Creating database tables")
     SQLModel.metadata.create_all(bind=engine)
 
@@ -4,3 +4,11 @@ class EmailTemplateNotFoundError(Exception):
 
 class NotificationNotFoundError(Exception):
     """An exception raised when a notification is not found."""
+
+
+class SpreadsheetFormatError(Exception):
+    """An exception raised when a spreadsheet cannot be read."""
+
+
+class ReportKeyMigrationError(Exception):
+    """An exception raised when the report tables cannot be migrated."""
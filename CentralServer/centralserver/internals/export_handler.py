@@ -0,0 +1,249 @@
+import datetime
+import hashlib
+import tempfile
+from typing import Any, AsyncIterator, Iterator
+
+from sqlalchemy import and_, null
+from sqlmodel import Session, select
+from starlette.concurrency import iterate_in_threadpool
+
+from centralserver.internals.adapters.object_store import (
+    BucketNames,
+    get_object_store_handler,
+)
+from centralserver.internals.config_handler import app_config
+from centralserver.internals.db_handler import engine, get_natural_key
+from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.models.reports.payroll_report import PayrollReportEntry
+from centralserver.internals.models.reports.report_status import ReportStatus
+from centralserver.internals.spreadsheet_handler import CellValue, SpreadsheetFormat
+
+logger = LoggerFactory().get_logger(__name__)
+
+# Number of rows fetched from the database at a time
+EXPORT_YIELD_PER = 1000
+# Exports of reports with these statuses can no longer change, so they are cached.
+IMMUTABLE_REPORT_STATUSES = frozenset({ReportStatus.APPROVED, ReportStatus.ARCHIVED})
+# Size of an export that is kept in memory before it is written to disk
+EXPORT_SPOOL_SIZE = 1024 * 1024
+
+
+def get_export_columns(entry_model: Any) -> dict[str, Any]:
+    """Get the columns of a report's entries to export.
+
+    The headers match the fields of the entry schemas, so that exported files
+    can be imported again.
+
+    Args:
+        entry_model: The model of the report entries.
+
+    Returns:
+        The columns to export, keyed by their header.
+    """
+
+    if entry_model is DailyFinancialReportEntry:
+        return {
+            "day": DailyFinancialReportEntry.day,
+            "sales": DailyFinancialReportEntry.sales,
+            "purchases": DailyFinancialReportEntry.purchases,
+        }
+
+    if entry_model is PayrollReportEntry:
+        return {
+            "week_number": PayrollReportEntry.weekNumber,
+            "employee_name": PayrollReportEntry.employeeName,
+            **{
+                day: getattr(PayrollReportEntry, day)
+                for day in ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+            },
+            "signature": PayrollReportEntry.signature,
+        }
+
+    # Liquidation report entries name some of their columns differently.
+    columns = entry_model.__table__.columns
+
+    def first_column(*names: str) -> Any:
+        return next((columns[name] for name in names if name in columns), null())
+
+    return {
+        "date": columns["date"],
+        "particulars": columns["particulars"],
+        "receiptNumber": first_column("receiptNumber", "receipt"),
+        "quantity": first_column("quantity"),
+        "unit": first_column("unit"),
+        "unitPrice": first_column("unitPrice", "unit_price"),
+        "amount": first_column("amount"),
+    }
+
+
+def get_export_periods(
+    session: Session,
+    report_model: Any,
+    school_id: int | None,
+    start: datetime.date,
+    end: datetime.date,
+) -> list[tuple[int, datetime.date, datetime.datetime, ReportStatus | None]]:
+    """Get the reports of each school and month included in an export.
+
+    Args:
+        session: The database session.
+        report_model: The model of the exported report (e.g. the payroll report).
+        school_id: The school to export, or None to export all schools.
+        start: The first month to export.
+        end: The last month to export.
+
+    Returns:
+        The school, month, last modification and status of each report.
+    """
+
+    query = (
+        select(
+            MonthlyReport.submittedBySchool,
+            MonthlyReport.id,
+            MonthlyReport.lastModified,
+            report_model.reportStatus,
+        )
+        .join(
+            report_model,
+            and_(
+                report_model.schoolId == MonthlyReport.submittedBySchool,
+                report_model.parent == MonthlyReport.id,
+            ),
+        )
+        .where(MonthlyReport.id >= start, MonthlyReport.id <= end)
+        .order_by(MonthlyReport.submittedBySchool, MonthlyReport.id)
+    )
+    if school_id is not None:
+        query = query.where(MonthlyReport.submittedBySchool == school_id)
+
+    return [tuple(row) for row in session.exec(query)]  # type: ignore
+
+
+def get_export_cache_name(
+    key: str,
+    spreadsheet_format: SpreadsheetFormat,
+    periods: list[tuple[int, datetime.date, datetime.datetime, ReportStatus | None]],
+) -> str | None:
+    """Get the name of the cached copy of an export.
+
+    Args:
+        key: What is exported (e.g. the report type, school and months).
+        spreadsheet_format: The format of the export.
+        periods: The reports included in the export.
+
+    Returns:
+        The object name of the export in the report exports bucket, or None
+        if the export must not be cached because some reports can still change.
+    """
+
+    if not periods or any(
+        report_status not in IMMUTABLE_REPORT_STATUSES
+        for _, _, _, report_status in periods
+    ):
+        return None
+
+    # A report that is reopened and approved again has a new modification time.
+    digest = hashlib.sha256(key.encode())
+    for school_id, month, last_modified, report_status in periods:
+        digest.update(
+            f"|{school_id}:{month.isoformat()}:{last_modified.isoformat()}:"
+            f"{report_status.value if report_status else ''}".encode()
+        )
+
+    return f"{digest.hexdigest()}.{spreadsheet_format}"
+
+
+def iter_export_rows(
+    entry_model: Any,
+    columns: list[Any],
+    school_id: int | None,
+    start: datetime.date,
+    end: datetime.date,
+) -> Iterator[tuple[CellValue, ...]]:
+    """Read the entries to export from the database, a batch at a time.
+
+    The rows are read in their own session, because they are streamed after
+    the request's session is closed.
+
+    Args:
+        entry_model: The model of the report entries.
+        columns: The columns of the entries to export.
+        school_id: The school to export, or None to export all schools.
+        start: The first month to export.
+        end: The last month to export.
+
+    Yields:
+        The school, month and exported columns of each entry.
+    """
+
+    query = (
+        select(entry_model.schoolId, entry_model.parent, *columns)
+        .where(entry_model.parent >= start, entry_model.parent <= end)
+        .order_by(*get_natural_key(entry_model.__table__))
+        .execution_options(yield_per=EXPORT_YIELD_PER)
+    )
+    if school_id is not None:
+        query = query.where(entry_model.schoolId == school_id)
+
+    with Session(engine) as session:
+        for row in session.exec(query):
+            yield tuple(row)
+
+
+async def get_cached_export(name: str) -> bytes | None:
+    """Get the cached copy of an export.
+
+    Args:
+        name: The object name of the export.
+
+    Returns:
+        The export, or None if it is not cached.
+    """
+
+    handler = await get_object_store_handler(app_config.object_store)
+    cached = await handler.get(BucketNames.REPORT_EXPORTS, name)
+    return None if cached is None else cached.obj
+
+
+async def stream_and_cache_export(
+    chunks: Iterator[bytes], name: str | None
+) -> AsyncIterator[bytes]:
+    """Stream an export, and cache a copy of it once it is complete.
+
+    The chunks are generated in a worker thread. The copy is spooled to disk,
+    and is discarded if the client disconnects before the export is complete.
+
+    Args:
+        chunks: The chunks of the export.
+        name: The object name to cache the export as, or None to not cache it.
+
+    Yields:
+        The chunks of the export.
+    """
+
+    if name is None:
+        async for chunk in iterate_in_threadpool(chunks):
+            yield chunk
+
+        return
+
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE) as copy:
+        async for chunk in iterate_in_threadpool(chunks):
+            _ = copy.write(chunk)
+            yield chunk
+
+        _ = copy.seek(0)
+        try:
+            handler = await get_object_store_handler(app_config.object_store)
+            _ = await handler.put(BucketNames.REPORT_EXPORTS, name, copy.read())
+            logger.debug("Cached report export `%s`.", name)
+
+        except FileExistsError:
+            logger.debug("Report export `%s` is already cached.", name)
+
+        except Exception as e:  # pylint: disable=W0718
+            logger.warning("Failed to cache report export `%s`: %s", name, e)
@@ -0,0 +1,138 @@
+import re
+from typing import Any, Callable, Iterable
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table
+from sqlmodel import Session
+
+from centralserver.internals.db_handler import get_natural_key, upsert
+from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.models.reports.report_import import (
+    ImportResult,
+    ImportRowError,
+)
+from centralserver.internals.spreadsheet_handler import CellValue
+
+logger = LoggerFactory().get_logger(__name__)
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_ERRORS = 100
+
+
+def _header_key(header: str) -> str:
+    """Normalize a header so that `Week Number` matches `week_number`."""
+
+    return re.sub(r"[\s_-]+", "", header).lower()
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def import_records(
+    session: Session,
+    records: Iterable[tuple[int, dict[str, CellValue]]],
+    schema: type[BaseModel],
+    to_row: Callable[[Any], dict[str, Any]],
+    table: Table,
+    update_columns: list[str],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_errors: int = IMPORT_MAX_ERRORS,
+) -> ImportResult:
+    """Validate spreadsheet records and upsert them into a table in batches.
+
+    Records are read one at a time, so only one batch of rows is kept in
+    memory. Rows that fail validation are skipped and reported. The session
+    is not committed.
+
+    Args:
+        session: The database session to write the rows in.
+        records: The row number and values of each record, keyed by header.
+        schema: The schema to validate each record with. Headers are matched
+                to its fields ignoring case, spaces and underscores.
+        to_row: Convert a validated record to the values of a table row.
+                It may raise a `ValueError` to reject the record.
+        table: The table to write the rows to.
+        update_columns: The columns to update in rows that already exist.
+        batch_size: The number of rows to write per statement.
+        max_errors: The number of row errors to report. Rows that fail after
+                    this are still counted.
+
+    Returns:
+        The number of imported and failed rows, and the first row errors.
+    """
+
+    fields = {
+        _header_key(field.alias or name): name
+        for name, field in schema.model_fields.items()
+    }
+    # Generated IDs are left to the database, so rows are matched by the
+    # natural key instead.
+    columns = [
+        column for column in table.columns if column is not table.autoincrement_column
+    ]
+    natural_key = [column.name for column in get_natural_key(table)]
+    required = [
+        column.name
+        for column in columns
+        if not column.nullable and column.default is None
+    ]
+
+    result = ImportResult()
+    seen_keys: dict[tuple[Any, ...], int] = {}
+    batch: list[dict[str, Any]] = []
+
+    def reject(row_number: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < max_errors:
+            result.errors.append(ImportRowError(row=row_number, message=message))
+
+    for row_number, record in records:
+        values = {
+            fields[key]: value
+            for header, value in record.items()
+            if (key := _header_key(header)) in fields
+        }
+        try:
+            row = to_row(schema.model_validate(values))
+
+        except ValidationError as e:
+            reject(row_number, _format_validation_error(e))
+            continue
+
+        except ValueError as e:
+            reject(row_number, str(e))
+            continue
+
+        # Every row of a statement must have the same columns
+        row = {column.name: row.get(column.name) for column in columns}
+        missing = [column for column in required if row[column] is None]
+        if missing:
+            reject(row_number, f"Missing values for {', '.join(missing)}.")
+            continue
+
+        key = tuple(row[column] for column in natural_key)
+        if key in seen_keys:
+            reject(row_number, f"Duplicate of row {seen_keys[key]}.")
+            continue
+
+        seen_keys[key] = row_number
+        batch.append(row)
+        if len(batch) >= batch_size:
+            upsert(session, table, batch, update_columns)
+            result.imported += len(batch)
+            batch = []
+
+    upsert(session, table, batch, update_columns)
+    result.imported += len(batch)
+
+    logger.debug(
+        "Imported %s rows into %s, %s rows failed.",
+        result.imported,
+        table.name,
+        result.failed,
+    )
+    return result
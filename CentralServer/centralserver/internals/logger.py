@@ -1,16 +1,195 @@
+import atexit
+import json
 import logging
 import os
+import queue
+import random
 import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from time import strftime
+from typing import Any
 
 from concurrent_log_handler import ConcurrentRotatingFileHandler
 
 from centralserver import info
-from centralserver.internals.config_handler import app_config
+from centralserver.internals.config_handler import AppConfig, app_config, config_store
+
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return _orjson_dumps(obj, default=str).decode()
+
+except ImportError:  # orjson is optional; fall back to the standard library
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass(slots=True)
+class RequestContext:
+    """Information about the HTTP request being handled."""
+
+    request_id: str
+    scope: dict[str, Any]  # The ASGI scope of the request
+    user_id: str | None = None
+    debug_sampled: bool | None = None
+    query_count: int = 0  # Number of database queries made by the request
+
+    @property
+    def route(self) -> str:
+        """The path of the matched route, or the request path if not yet routed."""
+
+        route = self.scope.get("route", None)
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+
+# The context of the request being handled by the current task.
+request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
+def bind_request_user(user_id: str) -> None:
+    """Associate a user with the request being handled.
+
+    Args:
+        user_id: The ID of the authenticated user.
+    """
+
+    context = request_context.get()
+    if context is not None:
+        context.user_id = user_id
+
+
+class RequestContextFilter(logging.Filter):
+    """Add the request ID, user ID, and route to every log record.
+
+    Debug records are also sampled per request: the first debug record of a
+    request decides whether all of its debug records are logged, using the
+    sample rate configured for its route.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = request_context.get()
+        if context is None:
+            record.request_id = record.user_id = record.route = "-"
+            return True
+
+        record.request_id = context.request_id
+        record.user_id = context.user_id or "-"
+        record.route = context.route
+
+        if record.levelno <= logging.DEBUG:
+            if context.debug_sampled is None:
+                sample_rate = app_config.logging.debug_sample_routes.get(
+                    record.route, app_config.logging.debug_sample_rate
+                )
+                context.debug_sampled = random.random() < sample_rate
+
+            return context.debug_sampled
+
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    # Attributes of every log record, which are not copied as extra fields.
+    __record_attributes = frozenset(
+        (*logging.makeLogRecord({}).__dict__, "message", "asctime")
+    )
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # Fields added by the request context filter or passed using `extra`
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in JSONFormatter.__record_attributes
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return _dumps(entry)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """A queue handler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]):
+        """Create a new DroppingQueueHandler object.
+
+        Args:
+            log_queue: The bounded queue to put log records in.
+        """
+
+        super().__init__(log_queue)
+        self.dropped: int = 0
+        self.__reported: int = 0
+        self.__lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record in the queue, or count it as dropped if the queue is full.
+
+        Args:
+            record: The log record to enqueue.
+        """
+
+        try:
+            if self.dropped != self.__reported:
+                self.__report_dropped()
+
+            self.queue.put_nowait(record)
+
+        except queue.Full:
+            with self.__lock:
+                self.dropped += 1
+
+    def __report_dropped(self) -> None:
+        """Enqueue a warning about the records dropped since the last report.
+
+        Raises:
+            queue.Full: If the queue is still full.
+        """
+
+        with self.__lock:
+            dropped = self.dropped
+
+        record = logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": f"Dropped {dropped - self.__reported} log records because the log queue was full.",
+            }
+        )
+        _ = self.filter(record)  # Add the request context attributes
+        self.queue.put_nowait(record)
+        self.__reported = dropped
 
 
 class LoggerFactory:
-    """A factory class for creating loggers with a specific configuration."""
+    """A factory class for creating loggers with a specific configuration.
+
+    All loggers share a single queue handler. Log records are written to the
+    console and log file by one background thread so that request handlers
+    never wait on log I/O.
+    """
+
+    __queue_handler: DroppingQueueHandler | None = None
+    __listener: QueueListener | None = None
+    __setup_lock = threading.Lock()
+    # Names of loggers whose level follows the debug configuration
+    __default_level_loggers: set[str] = set()
 
     def __init__(
         self,
@@ -22,12 +201,117 @@ class LoggerFactory:
             log_level: Override the log level with the provided value.
         """
 
+        self.uses_default_level = log_level is None
         self.log_level = (
             log_level
             if log_level is not None
             else "DEBUG" if app_config.debug.enabled else "WARN"
         )
 
+    @staticmethod
+    def get_output_handlers() -> list[logging.Handler]:
+        """Create the handlers that write log records to their destinations.
+
+        Returns:
+            The stream handler, and the file handler if file logging is enabled.
+        """
+
+        handlers: list[logging.Handler] = [logging.StreamHandler()]
+
+        # Only add file handler if file logging is enabled
+        if app_config.logging.file_logging_enabled:
+            handlers.append(
+                ConcurrentRotatingFileHandler(
+                    app_config.logging.filepath.format(strftime("%Y-%m-%d_%H-%M-%S")),
+                    maxBytes=app_config.logging.max_bytes,
+                    backupCount=app_config.logging.backup_count,
+                    encoding=app_config.logging.encoding,
+                )
+            )
+
+        formatter = (
+            JSONFormatter(datefmt=app_config.logging.date_format)
+            if app_config.logging.json_format
+            else logging.Formatter(
+                fmt=app_config.logging.log_format,
+                datefmt=app_config.logging.date_format,
+            )
+        )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        return handlers
+
+    @classmethod
+    def get_queue_handler(cls) -> DroppingQueueHandler:
+        """Get the queue handler shared by all loggers.
+
+        The background listener is started the first time this is called.
+
+        Returns:
+            The shared queue handler.
+        """
+
+        with cls.__setup_lock:
+            if cls.__queue_handler is None:
+                cls.__queue_handler = DroppingQueueHandler(
+                    queue.Queue(maxsize=app_config.logging.queue_size)
+                )
+                cls.__queue_handler.addFilter(RequestContextFilter())
+                _ = atexit.register(cls.stop)
+
+            if cls.__listener is None:
+                cls.__listener = QueueListener(
+                    cls.__queue_handler.queue,
+                    *cls.get_output_handlers(),
+                    respect_handler_level=True,
+                )
+                cls.__listener.start()
+
+            return cls.__queue_handler
+
+    @classmethod
+    def dropped_records(cls) -> int:
+        """Get the number of log records dropped because the queue was full."""
+
+        return cls.__queue_handler.dropped if cls.__queue_handler else 0
+
+    @classmethod
+    def stop(cls) -> None:
+        """Write all queued log records and stop the background listener."""
+
+        with cls.__setup_lock:
+            if cls.__listener is not None:
+                cls.__listener.stop()  # Processes the remaining records
+                for handler in cls.__listener.handlers:
+                    handler.close()
+
+                cls.__listener = None
+
+    @classmethod
+    def apply_config(cls, old_config: AppConfig, new_config: AppConfig) -> None:
+        """Apply a new configuration to the existing loggers and handlers.
+
+        Args:
+            old_config: The previous configuration.
+            new_config: The new configuration.
+        """
+
+        if old_config.debug.enabled != new_config.debug.enabled:
+            log_level = "DEBUG" if new_config.debug.enabled else "WARN"
+            for name in cls.__default_level_loggers:
+                logging.getLogger(name).setLevel(log_level)
+
+        if old_config.logging.export() != new_config.logging.export():
+            if cls.__queue_handler is not None:
+                cls.__queue_handler.queue.maxsize = (  # type: ignore[attr-defined]
+                    new_config.logging.queue_size
+                )
+
+            # Restart the listener with handlers for the new configuration
+            cls.stop()
+            _ = cls.get_queue_handler()
+
     def get_logger(self, name: str) -> logging.Logger:
         """Get a logger with the provided name.
 
@@ -46,35 +330,17 @@ class LoggerFactory:
         else:
             raise ValueError("Invalid log level type. Must be int or str.")
 
-        # Add a handler if one does not already exist.
-        if not logger.handlers:
-            # handlers
-            stream_handler = logging.StreamHandler()
-
-            # formatters
-            formatter = logging.Formatter(
-                fmt=app_config.logging.log_format,
-                datefmt=app_config.logging.date_format,
-            )
+        if self.uses_default_level:
+            LoggerFactory.__default_level_loggers.add(name)
 
-            # add formatters to handlers
-            stream_handler.setFormatter(formatter)
+        # Add the shared handler if one does not already exist.
+        if not logger.handlers:
+            logger.addHandler(self.get_queue_handler())
 
-            # add handlers to logger
-            logger.addHandler(stream_handler)
+        return logger
 
-            # Only add file handler if file logging is enabled
-            if app_config.logging.file_logging_enabled:
-                file_handler = ConcurrentRotatingFileHandler(
-                    app_config.logging.filepath.format(strftime("%Y-%m-%d_%H-%M-%S")),
-                    maxBytes=app_config.logging.max_bytes,
-                    backupCount=app_config.logging.backup_count,
-                    encoding=app_config.logging.encoding,
-                )
-                file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
 
-        return logger
+config_store.subscribe(LoggerFactory.apply_config)
 
 
 def log_app_info(logger: logging.Logger):
@@ -126,6 +392,27 @@ def log_app_info(logger: logging.Logger):
         stats["Log Encoding"] = app_config.logging.encoding
         stats["Log Format"] = app_config.logging.log_format
         stats["Date Format"] = app_config.logging.date_format
+        stats["Log Queue Size"] = str(app_config.logging.queue_size)
+        stats["JSON Log Format"] = (
+            "Enabled" if app_config.logging.json_format else "Disabled"
+        )
+        stats["Debug Sample Rate"] = str(app_config.logging.debug_sample_rate)
+        stats["Debug Sample Routes"] = (
+            ", ".join(
+                f"{route}={rate}"
+                for route, rate in app_config.logging.debug_sample_routes.items()
+            )
+            or "Not set"
+        )
+        stats["Slow Query Threshold"] = f"{app_config.logging.slow_query_ms} ms"
+        stats["Query Budget"] = str(app_config.logging.query_budget)
+        stats["Query Budget Routes"] = (
+            ", ".join(
+                f"{route}={budget}"
+                for route, budget in app_config.logging.query_budget_routes.items()
+            )
+            or "Not set"
+        )
 
         # Database
         for key, value in app_config.database.export().items():
@@ -201,6 +488,20 @@ def log_app_info(logger: logging.Logger):
         stats["Templates Directory"] = app_config.mailing.templates_dir or "Not set"
         stats["Templates Encoding"] = app_config.mailing.templates_encoding or "Not set"
 
+        # AI Assistant
+        stats["AI Assistant"] = "Enabled" if app_config.ai.enabled else "Disabled"
+        stats["AI Warm Up"] = "Enabled" if app_config.ai.warm_up else "Disabled"
+        stats["AI Model"] = app_config.ai.model
+        stats["AI Timeout"] = f"{app_config.ai.timeout} seconds"
+        stats["AI Max Concurrency"] = str(app_config.ai.max_concurrency)
+        stats["AI Max User Concurrency"] = str(app_config.ai.max_user_concurrency)
+        stats["AI Cache TTL"] = f"{app_config.ai.cache_ttl} seconds"
+        stats["AI Cache Size"] = str(app_config.ai.cache_size)
+        stats["AI History Length"] = str(app_config.ai.history_length)
+        stats["AI Memory Max Users"] = str(app_config.ai.memory_max_users)
+        stats["AI Memory Idle Timeout"] = f"{app_config.ai.memory_idle_timeout} seconds"
+        stats["AI Memory File"] = app_config.ai.memory_filepath or "Not set (in memory)"
+
         # Environment Variables
         stats["Environment Variables"] = (
             "Opted Out" if app_config.debug.logenv_optout else str(os.environ)
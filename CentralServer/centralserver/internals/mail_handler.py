@@ -5,14 +5,17 @@ from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from time import perf_counter
 
+from jinja2 import TemplateNotFound
 from pydantic import EmailStr
 
 from centralserver import info
 from centralserver.internals.config_handler import app_config
 from centralserver.internals.exceptions import EmailTemplateNotFoundError
 from centralserver.internals.logger import LoggerFactory
-from centralserver.internals.templater import templater
+from centralserver.internals.metrics import SMTP_DURATION
+from centralserver.internals.templater import MAIL_TEMPLATE_EXTENSIONS, templater
 
 logger = LoggerFactory().get_logger(__name__)
 
@@ -92,14 +95,23 @@ async def send_mail(
                 message.attach(attachment)
 
         # Send the email
-        with smtplib.SMTP(app_config.mailing.server, app_config.mailing.port) as server:
-            server.starttls()  # Upgrade the connection to a secure encrypted SSL/TLS connection
-            server.login(app_config.mailing.username, app_config.mailing.password)
-            server.sendmail(
-                from_addr=app_config.mailing.from_address,
-                to_addrs=[to_address],
-                msg=message.as_string(),
-            )
+        outcome = "error"
+        start = perf_counter()
+        try:
+            with smtplib.SMTP(
+                app_config.mailing.server, app_config.mailing.port
+            ) as server:
+                server.starttls()  # Upgrade the connection to a secure encrypted SSL/TLS connection
+                server.login(app_config.mailing.username, app_config.mailing.password)
+                server.sendmail(
+                    from_addr=app_config.mailing.from_address,
+                    to_addrs=[to_address],
+                    msg=message.as_string(),
+                )
+                outcome = "success"
+
+        finally:
+            SMTP_DURATION.observe(perf_counter() - start, outcome)
 
     except smtplib.SMTPException as e:
         logger.error("Failed to send email: %s", e)
@@ -121,7 +133,24 @@ def get_template(template_name: str, **kwargs: ...) -> str:
     try:
         return templater.get_template(template_name).render(**kwargs)
 
-    except FileNotFoundError as exc:
+    except (FileNotFoundError, TemplateNotFound) as exc:
         raise EmailTemplateNotFoundError(
             f"The template '{template_name}' was not found in the templates directory."
         ) from exc
+
+
+def get_template_pair(template_name: str, **kwargs: ...) -> tuple[str, str]:
+    """Render the plain text and HTML versions of an email template.
+
+    Args:
+        template_name: The name of the template without its file extension.
+
+    Returns:
+        A tuple containing the plain text and the HTML content.
+    """
+
+    text, html = (
+        get_template(f"{template_name}.{extension}", **kwargs)
+        for extension in MAIL_TEMPLATE_EXTENSIONS
+    )
+    return text, html
@@ -0,0 +1,312 @@
+import functools
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Final, Iterable
+
+PROMETHEUS_CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets for durations, in seconds.
+DURATION_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Histogram buckets for response sizes, in bytes.
+SIZE_BUCKETS: Final[tuple[float, ...]] = (
+    100,
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Format label names and values as a Prometheus label set."""
+
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metric(ABC):
+    """Superclass of the metrics collected by the server."""
+
+    metric_type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        """Create a new metric and add it to the registry.
+
+        Args:
+            name: The name of the metric.
+            documentation: A short description of the metric.
+            labels: The names of the labels of the metric.
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Get the samples of the metric in the Prometheus text format."""
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A value that only goes up, such as the number of requests."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self.__values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Increase the counter.
+
+        Args:
+            label_values: The values of the labels, in order.
+            amount: How much to increase the counter by.
+        """
+
+        with self._lock:
+            self.__values[label_values] = self.__values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        """Get the current value of the counter."""
+
+        return self.__values.get(label_values, 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self.__values.items())
+
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_number(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """A value that can go up and down, such as the number of requests in flight."""
+
+    metric_type = "gauge"
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        """Decrease the gauge.
+
+        Args:
+            label_values: The values of the labels, in order.
+            amount: How much to decrease the gauge by.
+        """
+
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(Metric):
+    """Observations counted in buckets, such as request durations."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ):
+        """Create a new histogram and add it to the registry.
+
+        Args:
+            name: The name of the metric.
+            documentation: A short description of the metric.
+            labels: The names of the labels of the metric.
+            buckets: The upper bounds of the buckets, in ascending order.
+        """
+
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        # Per label set: [count per bucket (+Inf last), sum]
+        self.__values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value.
+            label_values: The values of the labels, in order.
+        """
+
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            if label_values not in self.__values:
+                self.__values[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+
+            counts, total = self.__values[label_values]
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, *label_values: str) -> int:
+        """Get the number of observations."""
+
+        values = self.__values.get(label_values, None)
+        return sum(values[0]) if values else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = [
+                (key, list(counts), total[0])
+                for key, (counts, total) in self.__values.items()
+            ]
+
+        samples: list[str] = []
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_number(bound)
+                bucket_labels = _format_labels((*self.labels, "le"), (*key, le))
+                samples.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+
+            labels = _format_labels(self.labels, key)
+            samples.append(f"{self.name}_sum{labels} {_format_number(total)}")
+            samples.append(f"{self.name}_count{labels} {cumulative}")
+
+        return samples
+
+
+class MetricsRegistry:
+    """A collection of metrics that can be rendered together."""
+
+    def __init__(self):
+        self.__metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """Add a metric to the registry.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+
+        if metric.name in self.__metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+
+        self.__metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+
+        return "\n".join(metric.render() for metric in self.__metrics.values()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = Counter(
+    "centralserver_http_requests_total",
+    "Number of HTTP requests handled.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "centralserver_http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "centralserver_http_requests_in_flight",
+    "Number of HTTP requests being handled.",
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "centralserver_http_response_size_bytes",
+    "Size of HTTP response bodies.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+DB_QUERIES = Counter(
+    "centralserver_db_queries_total",
+    "Number of database queries executed.",
+    ("operation",),
+)
+DB_QUERY_DURATION = Histogram(
+    "centralserver_db_query_duration_seconds",
+    "Time spent executing database queries.",
+    ("operation",),
+)
+OBJECT_STORE_DURATION = Histogram(
+    "centralserver_object_store_duration_seconds",
+    "Time spent on object store operations.",
+    ("adapter", "operation", "outcome"),
+)
+SMTP_DURATION = Histogram(
+    "centralserver_smtp_duration_seconds",
+    "Time spent sending emails through the SMTP server.",
+    ("outcome",),
+)
+
+
+def timed_object_store_operation[**P, R](
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """Record the duration of an object store adapter method.
+
+    Args:
+        func: The adapter method to time.
+
+    Returns:
+        The wrapped adapter method.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        adapter: Any = args[0]
+        outcome = "error"
+        start = perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+            outcome = "success"
+            return result
+
+        finally:
+            OBJECT_STORE_DURATION.observe(
+                perf_counter() - start,
+                type(adapter).__name__,
+                func.__name__,
+                outcome,
+            )
+
+    return wrapper
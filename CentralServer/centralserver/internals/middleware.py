@@ -0,0 +1,175 @@
+import re
+import uuid
+from time import perf_counter
+from typing import Final
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from centralserver.internals.config_handler import AppConfig, app_config, config_store
+from centralserver.internals.logger import (
+    LoggerFactory,
+    RequestContext,
+    request_context,
+)
+from centralserver.internals.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_RESPONSE_SIZE,
+)
+
+logger = LoggerFactory().get_logger(__name__)
+
+REQUEST_ID_HEADER: Final[str] = "X-Request-ID"
+# Sent with responses of requests that exceeded their database query budget.
+QUERY_COUNT_HEADER: Final[str] = "X-Query-Count"
+# Request IDs from clients are only reused if they are short and safe to log.
+_VALID_REQUEST_ID: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """Assign an ID to every HTTP request and make it available to the loggers.
+
+    The ID is taken from the `X-Request-ID` request header if it is valid, or
+    generated otherwise, and it is sent back in the response headers. Requests
+    that make more database queries than their route's budget are logged and
+    get an `X-Query-Count` response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        context = RequestContext(request_id=request_id, scope=scope)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+                if self.__over_query_budget(context):
+                    headers[QUERY_COUNT_HEADER] = str(context.query_count)
+
+            await send(message)
+
+        token = request_context.set(context)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+
+        finally:
+            request_context.reset(token)
+
+    @staticmethod
+    def __over_query_budget(context: RequestContext) -> bool:
+        """Check if a request made more database queries than its route allows.
+
+        A warning is logged if the budget is exceeded.
+
+        Args:
+            context: The context of the request.
+
+        Returns:
+            True if the query budget of the route is exceeded.
+        """
+
+        budget = app_config.logging.query_budget_routes.get(
+            context.route, app_config.logging.query_budget
+        )
+        if budget <= 0 or context.query_count <= budget:
+            return False
+
+        logger.warning(
+            "Request made %d database queries, exceeding the budget of %d for %s",
+            context.query_count,
+            budget,
+            context.route,
+            extra={"query_count": context.query_count, "query_budget": budget},
+        )
+        return True
+
+
+class MetricsMiddleware:
+    """Record the latency, status code, and response size of every HTTP request.
+
+    Requests are labelled with the path of the matched route (for example,
+    `/v1/users/me`) instead of the request path to keep the number of label
+    values small.
+    """
+
+    UNMATCHED_ROUTE: Final[str] = "<unmatched>"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # Reported if the app fails before responding
+        response_size = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_and_measure)
+
+        finally:
+            duration = perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+            method: str = scope["method"]
+            route = getattr(scope.get("route", None), "path", self.UNMATCHED_ROUTE)
+            HTTP_REQUESTS.inc(method, route, str(status_code))
+            HTTP_REQUEST_DURATION.observe(duration, method, route)
+            HTTP_RESPONSE_SIZE.observe(response_size, method, route)
+
+
+class ReloadableCORSMiddleware:
+    """Apply the CORS settings of the current security configuration.
+
+    Starlette's `CORSMiddleware` reads its settings once. This middleware
+    creates a new one every time the security configuration changes.
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: list[str] | None = None):
+        self.app = app
+        self.expose_headers = expose_headers or []
+        self.__cors = self.__create_cors_middleware(app_config.current)
+        config_store.subscribe(self.__apply_config)
+
+    def __create_cors_middleware(self, config: AppConfig) -> CORSMiddleware:
+        return CORSMiddleware(
+            self.app,
+            allow_origins=config.security.allow_origins,
+            allow_credentials=config.security.allow_credentials,
+            allow_methods=config.security.allow_methods,
+            allow_headers=config.security.allow_headers,
+            expose_headers=self.expose_headers,
+        )
+
+    def __apply_config(self, old_config: AppConfig, new_config: AppConfig) -> None:
+        if old_config.security.export() != new_config.security.export():
+            self.__cors = self.__create_cors_middleware(new_config)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.__cors(scope, receive, send)
@@ -0,0 +1,372 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Protocol
+
+from sqlalchemy import Connection, Dialect, Engine, Index, func, inspect, select
+from sqlalchemy import table as table_clause
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex as CreateIndexDDL
+from sqlmodel import Session, SQLModel
+
+from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.models.notification import Notification
+from centralserver.internals.models.reports.payroll_report import PayrollReportEntry
+from centralserver.internals.models.schema_migration import SchemaMigration
+from centralserver.internals.models.user import User
+from centralserver.internals.report_key_migration import (
+    REPORT_KEY_MIGRATION_BATCH_SIZE,
+    copy_rows,
+    get_report_tables,
+    migrate_report_keys,
+    move_legacy_table,
+    needs_report_key_migration,
+)
+
+logger = LoggerFactory().get_logger(__name__)
+
+# Tables with at least this many rows are large enough that a statement
+# locking them for its whole run stalls the server.
+MIGRATION_LARGE_TABLE_ROWS = 100_000
+# Dialects that can build an index while the table is being written to
+ONLINE_INDEX_DIALECTS = ("postgresql", "mysql", "mariadb")
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedStatement:
+    """A statement that a pending migration would run."""
+
+    version: int
+    table: str
+    statement: str
+    rows: int
+    locks: bool
+
+    @property
+    def blocking(self) -> bool:
+        """Whether the statement locks a large table until it is done."""
+
+        return self.locks and self.rows >= MIGRATION_LARGE_TABLE_ROWS
+
+
+class MigrationOperation(Protocol):
+    """A step of a migration."""
+
+    def plan(self, connection: Connection) -> list[tuple[str, str, bool]]:
+        """Get the table, statement, and if it locks the table, of each
+        statement that the operation would run on the database."""
+        ...
+
+    def apply(self, engine: Engine) -> None:
+        """Run the operation if the database still needs it."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class CreateIndex:
+    """Build an index declared in the models on an existing table.
+
+    The index is built without blocking writes on PostgreSQL
+    (`CREATE INDEX CONCURRENTLY`) and MySQL (`ALGORITHM=INPLACE, LOCK=NONE`).
+    SQLite locks the whole database while it builds the index.
+    """
+
+    table: str
+    name: str
+
+    def get_index(self) -> Index:
+        """Get the index from the table of its model.
+
+        Raises:
+            ValueError: If no model declares the index.
+        """
+
+        for index in SQLModel.metadata.tables[self.table].indexes:
+            if index.name == self.name:
+                return index
+
+        raise ValueError(f"The table `{self.table}` has no index `{self.name}`.")
+
+    def statements(self, dialect: Dialect) -> list[str]:
+        """Get the statements that build the index on a database.
+
+        Args:
+            dialect: The dialect of the database.
+
+        Returns:
+            The statements to run, in order.
+        """
+
+        index = self.get_index()
+        if dialect.name == "postgresql":
+            create = str(
+                CreateIndexDDL(index, if_not_exists=True).compile(dialect=dialect)
+            )
+            return [create.replace(" INDEX ", " INDEX CONCURRENTLY ", 1)]
+
+        if dialect.name in ("mysql", "mariadb"):
+            # MySQL fails the statement instead of silently locking the table
+            # when it cannot build the index in place.
+            create = str(CreateIndexDDL(index).compile(dialect=dialect))
+            return [f"{create} ALGORITHM=INPLACE LOCK=NONE"]
+
+        return [str(CreateIndexDDL(index, if_not_exists=True).compile(dialect=dialect))]
+
+    def is_needed(self, connection: Connection) -> bool:
+        """Check if the table exists without the index.
+
+        A missing table is created with its indexes by `create_all()`.
+        """
+
+        inspector = inspect(connection)
+        return inspector.has_table(self.table) and self.name not in {
+            index["name"] for index in inspector.get_indexes(self.table)
+        }
+
+    def plan(self, connection: Connection) -> list[tuple[str, str, bool]]:
+        if not self.is_needed(connection):
+            return []
+
+        locks = connection.dialect.name not in ONLINE_INDEX_DIALECTS
+        return [
+            (self.table, statement, locks)
+            for statement in self.statements(connection.dialect)
+        ]
+
+    def apply(self, engine: Engine) -> None:
+        # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction.
+        if engine.dialect.name == "postgresql":
+            engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+        with engine.begin() as connection:
+            if not self.is_needed(connection):
+                return
+
+            logger.warning("Creating index %s on %s", self.name, self.table)
+            for statement in self.statements(connection.dialect):
+                _ = connection.execute(text(statement))
+
+
+@dataclass(frozen=True, slots=True)
+class RewriteTables:
+    """Rewrite tables with a function that locks them until it is done."""
+
+    description: str
+    tables: tuple[str, ...]
+    needed: Callable[[Connection], bool]
+    function: Callable[[Engine], Any]
+
+    def plan(self, connection: Connection) -> list[tuple[str, str, bool]]:
+        if not self.needed(connection):
+            return []
+
+        inspector = inspect(connection)
+        return [
+            (table, f"-- {self.description}", True)
+            for table in self.tables
+            if inspector.has_table(table)
+        ]
+
+    def apply(self, engine: Engine) -> None:
+        _ = self.function(engine)
+
+
+@dataclass(frozen=True, slots=True)
+class RebuildTable:
+    """Recreate a table from its model and copy its rows to it.
+
+    This is for changes that SQLite cannot make with `ALTER TABLE`, like a new
+    primary key. Columns that the old table lacks get their default values.
+    """
+
+    table: str
+    column: str
+    batch_size: int = REPORT_KEY_MIGRATION_BATCH_SIZE
+
+    def is_needed(self, connection: Connection) -> bool:
+        """Check if the table exists without the column."""
+
+        inspector = inspect(connection)
+        return inspector.has_table(self.table) and self.column not in {
+            column["name"] for column in inspector.get_columns(self.table)
+        }
+
+    def plan(self, connection: Connection) -> list[tuple[str, str, bool]]:
+        if not self.is_needed(connection):
+            return []
+
+        return [(self.table, f"-- Rebuild {self.table} with `{self.column}`", True)]
+
+    def apply(self, engine: Engine) -> None:
+        with engine.begin() as connection:
+            if not self.is_needed(connection):
+                return
+
+            logger.warning("Rebuilding %s with `%s`", self.table, self.column)
+            legacy_table = move_legacy_table(connection, self.table)
+            table = SQLModel.metadata.tables[self.table]
+            table.create(connection)
+            query = select(
+                *(column for column in legacy_table.columns if column.name in table.c)
+            )
+            copied = copy_rows(connection, query, table, self.batch_size)
+            legacy_table.drop(connection)
+            logger.info("Copied %s rows to %s.", copied, self.table)
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """A versioned change to the schema of the database."""
+
+    version: int
+    name: str
+    operations: tuple[MigrationOperation, ...]
+
+
+# The migrations of the schema, oldest first. Add a migration here whenever a
+# model gains a column or an index that existing databases will not have.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        1,
+        "Key the report tables by school and month",
+        (
+            RewriteTables(
+                "Copy the reports to tables keyed by school and month",
+                tuple(table.name for table in get_report_tables()),
+                needs_report_key_migration,
+                migrate_report_keys,
+            ),
+        ),
+    ),
+    Migration(
+        2,
+        "Index notifications by owner and users by school",
+        (
+            CreateIndex(
+                Notification.__tablename__, "ix_notifications_ownerId_archived"
+            ),
+            CreateIndex(User.__tablename__, "ix_users_schoolId"),
+        ),
+    ),
+    Migration(
+        3,
+        "Identify payroll entries by ID",
+        (RebuildTable(PayrollReportEntry.__tablename__, "id"),),
+    ),
+)
+
+
+def estimate_rows(connection: Connection, table: str) -> int:
+    """Estimate the number of rows in a table.
+
+    PostgreSQL and MySQL estimates come from their table statistics, so they
+    are cheap to get but may be off. SQLite tables are counted.
+
+    Args:
+        connection: The database connection.
+        table: The name of the table.
+
+    Returns:
+        The estimated number of rows.
+    """
+
+    if connection.dialect.name == "postgresql":
+        query = text(
+            "SELECT CAST(reltuples AS BIGINT) FROM pg_class "
+            "WHERE relname = :table AND relkind = 'r'"
+        )
+    elif connection.dialect.name in ("mysql", "mariadb"):
+        query = text(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+        )
+    else:
+        query = select(func.count()).select_from(table_clause(table))
+
+    # PostgreSQL reports -1 rows for tables that were never analyzed.
+    return max(int(connection.execute(query, {"table": table}).scalar() or 0), 0)
+
+
+def get_applied_versions(connection: Connection) -> set[int]:
+    """Get the versions of the migrations applied to the database.
+
+    Args:
+        connection: The database connection.
+
+    Returns:
+        The applied versions.
+    """
+
+    if not inspect(connection).has_table(SchemaMigration.__tablename__):
+        return set()
+
+    return set(connection.execute(select(SchemaMigration.version)).scalars())
+
+
+def plan_migrations(engine: Engine) -> list[PlannedStatement]:
+    """Get the statements that the pending migrations would run.
+
+    Nothing is changed in the database.
+
+    Args:
+        engine: The database engine.
+
+    Returns:
+        The planned statements, in the order they would run.
+    """
+
+    planned: list[PlannedStatement] = []
+    rows: dict[str, int] = {}
+    with engine.connect() as connection:
+        applied = get_applied_versions(connection)
+        for migration in MIGRATIONS:
+            if migration.version in applied:
+                continue
+
+            for operation in migration.operations:
+                for table, statement, locks in operation.plan(connection):
+                    if table not in rows:
+                        rows[table] = estimate_rows(connection, table)
+
+                    planned.append(
+                        PlannedStatement(
+                            migration.version, table, statement, rows[table], locks
+                        )
+                    )
+
+    return planned
+
+
+def migrate(engine: Engine) -> list[int]:
+    """Apply the pending migrations to the database.
+
+    Each migration is recorded once all of its operations are done, so a
+    failed migration is retried from its first operation.
+
+    Args:
+        engine: The database engine.
+
+    Returns:
+        The versions of the applied migrations.
+    """
+
+    SchemaMigration.__table__.create(engine, checkfirst=True)  # type: ignore
+    with engine.connect() as connection:
+        applied = get_applied_versions(connection)
+
+    migrated: list[int] = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+
+        logger.warning(
+            "Applying schema migration %s: %s", migration.version, migration.name
+        )
+        for operation in migration.operations:
+            operation.apply(engine)
+
+        with Session(engine) as session:
+            session.add(SchemaMigration(version=migration.version, name=migration.name))
+            session.commit()
+
+        migrated.append(migration.version)
+
+    return migrated
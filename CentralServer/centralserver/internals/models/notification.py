@@ -3,6 +3,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -33,6 +34,9 @@ class Notification(SQLModel, table=True):
     """A model representing a notification in the system."""
 
     __tablename__ = "notifications"  # type: ignore
+    __table_args__ = (
+        Index("ix_notifications_ownerId_archived", "ownerId", "archived"),
+    )
 
     id: str = Field(
         default_factory=lambda: str(uuid.uuid4()),
@@ -1,6 +1,7 @@
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -16,12 +17,19 @@ class DailyFinancialReport(SQLModel, table=True):
     """
 
     __tablename__: str = "dailyFinancialReports"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="monthlyReports.id",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     reportStatus: ReportStatus | None = Field(
         default=ReportStatus.DRAFT,
         description="The status of the report.",
@@ -41,14 +49,23 @@ class DailyFinancialReportEntry(SQLModel, table=True):
     """A model representing an entry in the daily sales and purchases report."""
 
     __tablename__: str = "dailyFinancialReportsEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "day"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["dailyFinancialReports.schoolId", "dailyFinancialReports.parent"],
+        ),
+    )
 
     day: int = Field(  # The day of the month (1-31, depending on the month)
         primary_key=True,
         index=True,
     )
-    parent: datetime.date = Field(
-        primary_key=True, foreign_key="dailyFinancialReports.parent"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     sales: float  # Positive float representing the total sales for the day
     purchases: float  # Positive float representing the total purchases for the day
 
@@ -61,3 +78,29 @@ class DailyEntryData(SQLModel):
     day: int = Field(..., ge=1, le=31, description="Day of the month (1-31)")
     sales: float = Field(..., ge=0, description="Total sales for the day")
     purchases: float = Field(..., ge=0, description="Total purchases for the day")
+
+
+class SalesTotal(SQLModel):
+    """The total sales and purchases of a school over a range of days."""
+
+    start: datetime.date = Field(description="The first day of the range")
+    end: datetime.date = Field(description="The last day of the range")
+    sales: float = Field(default=0.0, description="Total sales in the range")
+    purchases: float = Field(default=0.0, description="Total purchases in the range")
+    days: int = Field(default=0, description="Number of days with entries")
+
+
+class DailyEntryUpsertResult(SQLModel):
+    """The result of writing one entry in a bulk upsert."""
+
+    day: int
+    sales: float
+    purchases: float
+    status: Literal["created", "updated"]
+
+
+class DailyEntriesUpsertResponse(SQLModel):
+    """The result of a bulk upsert of daily entries."""
+
+    entries: list[DailyEntryUpsertResult]
+    total: SalesTotal = Field(description="The totals of the month after the upsert")
@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -16,10 +17,19 @@ class DisbursementVoucher(SQLModel, table=True):
     """
 
     __tablename__ = "disbursementVouchers"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.date
 
     modeOfPayment: str  # MDS Check, Commercial Check, ADA, Others
@@ -64,10 +74,19 @@ class DisbursementVoucher(SQLModel, table=True):
 
 class DisbursementVoucherCertifiedBy(SQLModel, table=True):
     __tablename__ = "disbursementVoucherCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["disbursementVouchers.schoolId", "disbursementVouchers.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="disbursementVouchers.parent"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(foreign_key="users.id")
     role: str | None = None  # e.g. Principal, Accountant, Cashier
 
@@ -76,10 +95,19 @@ class DisbursementVoucherCertifiedBy(SQLModel, table=True):
 
 class DisbursementVoucherEntry(SQLModel, table=True):
     __tablename__ = "disbursementVoucherEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["disbursementVouchers.schoolId", "disbursementVouchers.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="disbursementVouchers.parent"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     # to be edited for specific inputs based on the report requirements
     date: datetime.datetime
     receipt: str | None
@@ -93,10 +121,19 @@ class DisbursementVoucherEntry(SQLModel, table=True):
 
 class DisbursementVoucherAccountingEntry(SQLModel, table=True):
     __tablename__ = "disbursementVoucherAccountingEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["disbursementVouchers.schoolId", "disbursementVouchers.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="disbursementVouchers.parent"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     uacs_code: str
     accountTitle: str
     debit: float
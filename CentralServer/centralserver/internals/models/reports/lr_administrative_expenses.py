@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -16,10 +17,19 @@ class LiquidationReportAdministrativeExpenses(SQLModel, table=True):
     """
 
     __tablename__: str = "liquidationReportAdministrativeExpenses"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     notedBy: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     teacherInCharge: str = Field(foreign_key="users.id")
@@ -45,12 +55,22 @@ class LiquidationReportAdministrativeExpenses(SQLModel, table=True):
 
 class AdministrativeExpensesCertifiedBy(SQLModel, table=True):
     __tablename__: str = "liquidationReportAdministrativeExpensesCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportAdministrativeExpenses.schoolId",
+                "liquidationReportAdministrativeExpenses.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportAdministrativeExpenses.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: "LiquidationReportAdministrativeExpenses" = Relationship(
@@ -62,12 +82,22 @@ class AdministrativeExpenseEntry(SQLModel, table=True):
     """A model representing an entry in the administrative expenses report."""
 
     __tablename__: str = "liquidationReportAdministrativeExpensesEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportAdministrativeExpenses.schoolId",
+                "liquidationReportAdministrativeExpenses.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportAdministrativeExpenses.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
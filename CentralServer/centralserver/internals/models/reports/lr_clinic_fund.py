@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -16,10 +17,19 @@ class LiquidationReportClinicFund(SQLModel, table=True):
     """
 
     __tablename__: str = "liquidationReportClinicFund"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     notedBy: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     teacherInCharge: str = Field(foreign_key="users.id")
@@ -43,12 +53,22 @@ class LiquidationReportClinicFund(SQLModel, table=True):
 
 class LiquidationReportClinicFundCertifiedBy(SQLModel, table=True):
     __tablename__: str = "liquidationReportClinicFundCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportClinicFund.schoolId",
+                "liquidationReportClinicFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportClinicFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: LiquidationReportClinicFund = Relationship(
@@ -58,12 +78,22 @@ class LiquidationReportClinicFundCertifiedBy(SQLModel, table=True):
 
 class LiquidationReportClinicFundEntry(SQLModel, table=True):
     __tablename__: str = "liquidationReportClinicFundEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportClinicFund.schoolId",
+                "liquidationReportClinicFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportClinicFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -13,10 +14,19 @@ class LiquidationReportFacultyAndStudentDevFund(SQLModel, table=True):
     """A model representing the liquidation (Faculty and Student Development Fund) reports."""
 
     __tablename__: str = "liquidationReportFacultyAndStudentDevFund"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     notedBy: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     teacherInCharge: str = Field(foreign_key="users.id")
@@ -42,12 +52,22 @@ class LiquidationReportFacultyAndStudentDevFund(SQLModel, table=True):
 
 class FacultyAndStudentDevFundAuditedBy(SQLModel, table=True):
     __tablename__: str = "liquidationReportFacultyAndStudentDevFundAuditedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportFacultyAndStudentDevFund.schoolId",
+                "liquidationReportFacultyAndStudentDevFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportFacultyAndStudentDevFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: LiquidationReportFacultyAndStudentDevFund = Relationship(
@@ -57,12 +77,22 @@ class FacultyAndStudentDevFundAuditedBy(SQLModel, table=True):
 
 class FacultyAndStudentDevFundEntry(SQLModel, table=True):
     __tablename__: str = "liquidationReportFacultyAndStudentDevFundEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportFacultyAndStudentDevFund.schoolId",
+                "liquidationReportFacultyAndStudentDevFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportFacultyAndStudentDevFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
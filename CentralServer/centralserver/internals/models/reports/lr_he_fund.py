@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -11,10 +12,19 @@ if TYPE_CHECKING:
 
 class LiquidationReportHEFund(SQLModel, table=True):
     __tablename__: str = "liquidationReportHEFund"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     certified_by: list["LiquidationReportHEFundCertifiedBy"] = Relationship(
         back_populates="parent_report"
     )
@@ -40,12 +50,19 @@ class LiquidationReportHEFundCertifiedBy(SQLModel, table=True):
     """A model representing the liquidation (HE Fund) reports."""
 
     __tablename__: str = "liquidationReportHEFundCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["liquidationReportHEFund.schoolId", "liquidationReportHEFund.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportHEFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: LiquidationReportHEFund = Relationship(back_populates="certified_by")
@@ -53,12 +70,19 @@ class LiquidationReportHEFundCertifiedBy(SQLModel, table=True):
 
 class LiquidationReportHEFundEntry(SQLModel, table=True):
     __tablename__: str = "liquidationReportHEFundEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["liquidationReportHEFund.schoolId", "liquidationReportHEFund.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportHEFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
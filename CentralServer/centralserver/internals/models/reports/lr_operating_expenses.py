@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -16,10 +17,19 @@ class LiquidationReportOperatingExpenses(SQLModel, table=True):
     """
 
     __tablename__: str = "liquidationReportOperatingExpenses"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     teacherInCharge: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     notedBy: str = Field(foreign_key="users.id")
@@ -47,12 +57,22 @@ class OperatingExpensesCertifiedBy(SQLModel, table=True):
     """A model representing the "Certified By" field in the operating expenses report."""
 
     __tablename__: str = "liquidationReportOperatingExpensesCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportOperatingExpenses.schoolId",
+                "liquidationReportOperatingExpenses.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportOperatingExpenses.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: "LiquidationReportOperatingExpenses" = Relationship(
@@ -64,12 +84,22 @@ class OperatingExpenseEntry(SQLModel, table=True):
     """A model representing an entry in the operating expenses report."""
 
     __tablename__: str = "liquidationReportOperatingExpensesEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportOperatingExpenses.schoolId",
+                "liquidationReportOperatingExpenses.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportOperatingExpenses.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -13,10 +14,19 @@ class LiquidationReportRevolvingFund(SQLModel, table=True):
     """A model representing the liquidation (Revolving Fund) reports."""
 
     __tablename__: str = "liquidationReportRevolvingFund"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     notedBy: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     teacherInCharge: str = Field(foreign_key="users.id")
@@ -44,12 +54,22 @@ class RevolvingFundCertifiedBy(SQLModel, table=True):
     """A model representing the "Certified By" field in the operating expenses report."""
 
     __tablename__: str = "liquidationReportRevolvingFundCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportRevolvingFund.schoolId",
+                "liquidationReportRevolvingFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportRevolvingFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: LiquidationReportRevolvingFund = Relationship(
@@ -59,12 +79,22 @@ class RevolvingFundCertifiedBy(SQLModel, table=True):
 
 class RevolvingFundEntry(SQLModel, table=True):
     __tablename__: str = "liquidationReportRevolvingFundEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportRevolvingFund.schoolId",
+                "liquidationReportRevolvingFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportRevolvingFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
@@ -1,6 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -13,10 +14,19 @@ class LiquidationReportSupplementaryFeedingFund(SQLModel, table=True):
     """A model representing the liquidation (Supplementary Feeding Fund) reports."""
 
     __tablename__: str = "liquidationReportSupplementaryFeedingFund"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     notedBy: str = Field(foreign_key="users.id")
     preparedBy: str = Field(foreign_key="users.id")
     teacherInCharge: str = Field(foreign_key="users.id")
@@ -42,12 +52,22 @@ class LiquidationReportSupplementaryFeedingFund(SQLModel, table=True):
 
 class SupplementaryFeedingFundCertifiedBy(SQLModel, table=True):
     __tablename__: str = "liquidationReportSupplementaryFeedingFundCertifiedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "user"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportSupplementaryFeedingFund.schoolId",
+                "liquidationReportSupplementaryFeedingFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportSupplementaryFeedingFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(primary_key=True, foreign_key="users.id")
 
     parent_report: "LiquidationReportSupplementaryFeedingFund" = Relationship(
@@ -57,12 +77,22 @@ class SupplementaryFeedingFundCertifiedBy(SQLModel, table=True):
 
 class SupplementaryFeedingFundEntry(SQLModel, table=True):
     __tablename__: str = "liquidationReportSupplementaryFeedingFundEntries"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent", "date", "particulars"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            [
+                "liquidationReportSupplementaryFeedingFund.schoolId",
+                "liquidationReportSupplementaryFeedingFund.parent",
+            ],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="liquidationReportSupplementaryFeedingFund.parent",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     date: datetime.datetime = Field(
         primary_key=True,
         index=True,
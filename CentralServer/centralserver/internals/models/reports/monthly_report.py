@@ -1,5 +1,6 @@
 import datetime
 
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.daily_financial_report import (
@@ -43,6 +44,8 @@ class MonthlyReport(SQLModel, table=True):
     """
 
     __tablename__: str = "monthlyReports"  # type: ignore
+    # Reports are looked up by school first, then by month.
+    __table_args__ = (PrimaryKeyConstraint("submittedBySchool", "id"),)
 
     id: datetime.date = Field(
         primary_key=True,
@@ -54,7 +57,7 @@ class MonthlyReport(SQLModel, table=True):
         description="The name of the report.",
     )
     submittedBySchool: int = Field(
-        index=True,
+        primary_key=True,
         foreign_key="schools.id",
         description="The school that submitted the report.",
     )
@@ -152,12 +155,19 @@ class MonthlyReport(SQLModel, table=True):
 
 class MonthlyReportAuditedBy(SQLModel, table=True):
     __tablename__: str = "monthlyReportAuditedBy"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
+    schoolId: int = Field(
         primary_key=True,
-        index=True,
-        foreign_key="monthlyReports.id",
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     user: str = Field(foreign_key="users.id")
 
     parent_report: MonthlyReport = Relationship(back_populates="audited_by")
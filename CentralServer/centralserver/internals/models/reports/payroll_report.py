@@ -1,7 +1,8 @@
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from centralserver.internals.models.reports.report_status import ReportStatus
@@ -14,10 +15,19 @@ class PayrollReport(SQLModel, table=True):
     """A model representing the monthly payroll report."""
 
     __tablename__: str = "payrollReports"  # type: ignore
+    __table_args__ = (
+        PrimaryKeyConstraint("schoolId", "parent"),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["monthlyReports.submittedBySchool", "monthlyReports.id"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="monthlyReports.id"
+    schoolId: int = Field(
+        primary_key=True,
+        description="The school that submitted the report.",
     )
+    parent: datetime.date = Field(primary_key=True, index=True)
     preparedBy: str = Field(
         foreign_key="users.id", description="The user who prepared the report."
     )
@@ -37,12 +47,30 @@ class PayrollReportEntry(SQLModel, table=True):
     """A model representing an entry in the payroll report for a week."""
 
     __tablename__: str = "payrollReportEntries"  # type: ignore
+    __table_args__ = (
+        Index(
+            "ix_payrollReportEntries_entry",
+            "schoolId",
+            "parent",
+            "weekNumber",
+            "employeeName",
+            unique=True,
+        ),
+        ForeignKeyConstraint(
+            ["schoolId", "parent"],
+            ["payrollReports.schoolId", "payrollReports.parent"],
+        ),
+    )
 
-    parent: datetime.date = Field(
-        primary_key=True, index=True, foreign_key="payrollReports.parent"
+    id: int | None = Field(
+        default=None,
+        primary_key=True,
+        description="The unique identifier of the entry.",
     )
-    weekNumber: int = Field(primary_key=True, description="Week number in the month")
-    employeeName: str = Field(primary_key=True, description="Name of the employee")
+    schoolId: int = Field(description="The school that submitted the report.")
+    parent: datetime.date = Field(index=True)
+    weekNumber: int = Field(description="Week number in the month")
+    employeeName: str = Field(description="Name of the employee")
     sun: float = Field(default=0.0, description="Amount received on Sunday")
     mon: float = Field(default=0.0, description="Amount received on Monday")
     tue: float = Field(default=0.0, description="Amount received on Tuesday")
@@ -61,6 +89,63 @@ class PayrollReportEntry(SQLModel, table=True):
     parent_report: PayrollReport = Relationship(back_populates="entries")
 
 
+class PayrollEmployeeTotal(SQLModel):
+    """The total amount received by an employee in a month."""
+
+    employeeName: str = Field(description="Name of the employee")
+    weeks: int = Field(default=0, description="Number of weeks with entries")
+    total: float = Field(default=0.0, description="Total amount received")
+
+
+class PayrollWeekTotal(SQLModel):
+    """The amounts received by all employees in a week of a month."""
+
+    weekNumber: int = Field(description="Week number in the month")
+    employees: int = Field(default=0, description="Number of employees paid")
+    sun: float = Field(default=0.0, description="Total amount paid on Sunday")
+    mon: float = Field(default=0.0, description="Total amount paid on Monday")
+    tue: float = Field(default=0.0, description="Total amount paid on Tuesday")
+    wed: float = Field(default=0.0, description="Total amount paid on Wednesday")
+    thu: float = Field(default=0.0, description="Total amount paid on Thursday")
+    fri: float = Field(default=0.0, description="Total amount paid on Friday")
+    sat: float = Field(default=0.0, description="Total amount paid on Saturday")
+    total: float = Field(default=0.0, description="Total amount paid in the week")
+
+
+class PayrollReportSummary(SQLModel):
+    """The totals of a payroll report by employee and by week."""
+
+    schoolId: int
+    parent: datetime.date
+    employees: list[PayrollEmployeeTotal]
+    weeks: list[PayrollWeekTotal]
+    total: float = Field(default=0.0, description="Total amount paid in the month")
+
+
+class PayrollMonthTotal(SQLModel):
+    """The payroll totals of a school for a month."""
+
+    schoolId: int
+    parent: datetime.date
+    employees: int = Field(default=0, description="Number of employees paid")
+    entries: int = Field(default=0, description="Number of weekly entries")
+    total: float = Field(default=0.0, description="Total amount paid in the month")
+
+
+class PayrollEntryBulkResult(SQLModel):
+    """The result of writing one entry in a bulk write of payroll entries."""
+
+    weekNumber: int
+    employeeName: str
+    status: Literal["created", "updated", "skipped"]
+
+
+class PayrollEntriesBulkResponse(SQLModel):
+    """The result of a bulk write of payroll entries."""
+
+    entries: list[PayrollEntryBulkResult]
+
+
 class PayrollEntryRequest(BaseModel):
     """Request model for creating payroll entry data."""
 
@@ -89,6 +174,12 @@ class PayrollEntryUpdateRequest(BaseModel):
     signature: str | None = None
 
 
+class PayrollEntryBatchUpdateRequest(PayrollEntryUpdateRequest):
+    """Request model for updating specific fields in a payroll entry by its ID."""
+
+    id: int
+
+
 class PayrollReportUpdateRequest(BaseModel):
     """Request model for updating payroll report metadata."""
 
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    """A row of an imported spreadsheet that could not be imported."""
+
+    row: int
+    message: str
+
+
+class ImportResult(BaseModel):
+    """The result of importing entries from a spreadsheet."""
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
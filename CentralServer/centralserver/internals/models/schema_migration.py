@@ -0,0 +1,34 @@
+import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class SchemaMigration(SQLModel, table=True):
+    """A model representing a schema migration applied to the database."""
+
+    __tablename__: str = "schemaMigrations"  # type: ignore
+
+    version: int = Field(
+        primary_key=True,
+        description="The version of the schema after the migration.",
+    )
+    name: str = Field(description="A short description of the migration.")
+    appliedAt: datetime.datetime = Field(
+        default_factory=datetime.datetime.now,
+        description="When the migration was applied.",
+    )
+
+
+class SchemaFingerprint(SQLModel, table=True):
+    """A model representing the schema that the database was populated with."""
+
+    __tablename__: str = "schemaFingerprint"  # type: ignore
+
+    id: int = Field(default=1, primary_key=True)
+    fingerprint: str = Field(
+        description="The hash of the schema and the records created with it."
+    )
+    populatedAt: datetime.datetime = Field(
+        default_factory=datetime.datetime.now,
+        description="When the database was last populated.",
+    )
@@ -59,6 +59,7 @@ class User(SQLModel, table=True):
     )
     schoolId: int | None = Field(
         default=None,
+        index=True,
         description="The ID of the school the user belongs to.",
         foreign_key="schools.id",
     )
@@ -0,0 +1,144 @@
+import datetime
+
+from sqlalchemy import ColumnElement
+from sqlmodel import Session, col, func, select
+
+from centralserver.internals.models.reports.payroll_report import (
+    PayrollEmployeeTotal,
+    PayrollMonthTotal,
+    PayrollReportEntry,
+    PayrollReportSummary,
+    PayrollWeekTotal,
+)
+
+# The columns of the amounts received on each day of a week
+PAYROLL_DAY_COLUMNS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+
+def _entry_total() -> ColumnElement[float]:
+    """Build the expression of the amount received by an employee in a week."""
+
+    total: ColumnElement[float] = col(PayrollReportEntry.sun)
+    for day in PAYROLL_DAY_COLUMNS[1:]:
+        total = total + col(getattr(PayrollReportEntry, day))
+
+    return total
+
+
+def _sum(column: ColumnElement[float]) -> ColumnElement[float]:
+    return func.coalesce(func.sum(column), 0.0)
+
+
+async def get_payroll_summary(
+    session: Session, school_id: int, parent: datetime.date
+) -> PayrollReportSummary:
+    """Get the totals of a payroll report by employee and by week.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school of the report.
+        parent: The first day of the month of the report.
+
+    Returns:
+        The totals, computed by the database.
+    """
+
+    in_report = (
+        col(PayrollReportEntry.schoolId) == school_id,
+        col(PayrollReportEntry.parent) == parent,
+    )
+    employees = session.exec(
+        select(
+            PayrollReportEntry.employeeName,
+            func.count(),
+            _sum(_entry_total()),
+        )
+        .where(*in_report)
+        .group_by(col(PayrollReportEntry.employeeName))
+        .order_by(col(PayrollReportEntry.employeeName))
+    ).all()
+    weeks = session.exec(
+        select(
+            PayrollReportEntry.weekNumber,
+            func.count(),
+            *(
+                _sum(col(getattr(PayrollReportEntry, day)))
+                for day in PAYROLL_DAY_COLUMNS
+            ),
+        )
+        .where(*in_report)
+        .group_by(col(PayrollReportEntry.weekNumber))
+        .order_by(col(PayrollReportEntry.weekNumber))
+    ).all()
+
+    week_totals = [
+        PayrollWeekTotal(
+            weekNumber=week_number,
+            employees=count,
+            total=sum(days),
+            **dict(zip(PAYROLL_DAY_COLUMNS, days)),
+        )
+        for week_number, count, *days in weeks
+    ]
+    return PayrollReportSummary(
+        schoolId=school_id,
+        parent=parent,
+        employees=[
+            PayrollEmployeeTotal(employeeName=name, weeks=count, total=total)
+            for name, count, total in employees
+        ],
+        weeks=week_totals,
+        total=sum(week.total for week in week_totals),
+    )
+
+
+async def get_payroll_totals(
+    session: Session,
+    start: datetime.date,
+    end: datetime.date,
+    school_id: int | None = None,
+) -> list[PayrollMonthTotal]:
+    """Get the payroll totals of every school and month in a range.
+
+    All the school-months are totalled in one query.
+
+    Args:
+        session: The database session.
+        start: A day in the first month of the range.
+        end: A day in the last month of the range.
+        school_id: The school to get the totals of, or None for all schools.
+
+    Returns:
+        The totals of each school and month with entries, ordered by school
+        and month.
+    """
+
+    query = (
+        select(
+            PayrollReportEntry.schoolId,
+            PayrollReportEntry.parent,
+            func.count(func.distinct(PayrollReportEntry.employeeName)),
+            func.count(),
+            _sum(_entry_total()),
+        )
+        .where(
+            col(PayrollReportEntry.parent).between(
+                start.replace(day=1), end.replace(day=1)
+            )
+        )
+        .group_by(col(PayrollReportEntry.schoolId), col(PayrollReportEntry.parent))
+        .order_by(col(PayrollReportEntry.schoolId), col(PayrollReportEntry.parent))
+    )
+    if school_id is not None:
+        query = query.where(col(PayrollReportEntry.schoolId) == school_id)
+
+    return [
+        PayrollMonthTotal(
+            schoolId=row_school_id,
+            parent=parent,
+            employees=employees,
+            entries=entries,
+            total=total,
+        )
+        for row_school_id, parent, employees, entries, total in session.exec(query)
+    ]
@@ -0,0 +1,243 @@
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    MetaData,
+    Select,
+    Table,
+    exists,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlmodel import SQLModel
+
+from centralserver.internals.exceptions import ReportKeyMigrationError
+from centralserver.internals.logger import LoggerFactory
+
+logger = LoggerFactory().get_logger(__name__)
+
+# Number of rows copied from a legacy table at a time
+REPORT_KEY_MIGRATION_BATCH_SIZE = 1000
+# Prefix of the tables that hold the rows of the old schema during the migration
+LEGACY_TABLE_PREFIX = "_legacy_"
+
+
+def get_report_tables() -> list[Table]:
+    """Get the tables of the monthly reports and everything they contain.
+
+    Returns:
+        The report tables, each one after the tables it references.
+    """
+
+    return [
+        table
+        for table in SQLModel.metadata.sorted_tables
+        if table.name == "monthlyReports"
+        or ("schoolId" in table.c and "parent" in table.c)
+    ]
+
+
+def needs_report_key_migration(connection: Connection) -> bool:
+    """Check if the report tables are still keyed by month only.
+
+    Args:
+        connection: The database connection.
+
+    Returns:
+        True if the monthly reports table exists without the school in its
+        primary key.
+    """
+
+    inspector = inspect(connection)
+    if not inspector.has_table("monthlyReports"):
+        return False
+
+    primary_key = inspector.get_pk_constraint("monthlyReports")
+    return "submittedBySchool" not in primary_key["constrained_columns"]
+
+
+def count_orphaned_rows(connection: Connection, names: list[str]) -> dict[str, int]:
+    """Count the rows of the old schema whose month has no monthly report.
+
+    The school of these rows is unknown, so they cannot be migrated.
+
+    Args:
+        connection: The database connection.
+        names: The names of the report tables to check.
+
+    Returns:
+        The number of orphaned rows of each table that has any.
+    """
+
+    metadata = MetaData()
+    monthly_reports = Table("monthlyReports", metadata, autoload_with=connection)
+    orphaned: dict[str, int] = {}
+    for name in names:
+        if name == monthly_reports.name:
+            continue
+
+        table = Table(name, metadata, autoload_with=connection)
+        rows = connection.execute(
+            select(func.count())
+            .select_from(table)
+            .where(~exists().where(monthly_reports.c.id == table.c.parent))
+        ).scalar_one()
+        if rows:
+            orphaned[name] = rows
+
+    return orphaned
+
+
+def move_legacy_table(connection: Connection, name: str) -> Table:
+    """Rename a table of the old schema out of the way of its replacement."""
+
+    legacy_name = f"{LEGACY_TABLE_PREFIX}{name}"
+    table = Table(name, MetaData(), autoload_with=connection)
+    # Index names must be unique in the whole database on SQLite and PostgreSQL.
+    for index in table.indexes:
+        index.drop(connection)
+
+    quote = connection.dialect.identifier_preparer.quote
+    _ = connection.execute(
+        text(f"ALTER TABLE {quote(name)} RENAME TO {quote(legacy_name)}")
+    )
+    if connection.dialect.name == "postgresql":
+        primary_key = inspect(connection).get_pk_constraint(legacy_name)["name"]
+        if primary_key:
+            _ = connection.execute(
+                text(
+                    f"ALTER INDEX {quote(primary_key)} "
+                    f"RENAME TO {quote(LEGACY_TABLE_PREFIX + primary_key)}"
+                )
+            )
+
+    return Table(legacy_name, MetaData(), autoload_with=connection)
+
+
+def _copy_legacy_rows(
+    connection: Connection,
+    table: Table,
+    legacy_table: Table,
+    legacy_monthly_reports: Table,
+    batch_size: int,
+) -> int:
+    """Copy the rows of a legacy table to its new table, a batch at a time.
+
+    The school of each row is the school of the monthly report of its month,
+    because there could only be one monthly report per month.
+
+    Returns:
+        The number of copied rows.
+    """
+
+    columns = [column.name for column in table.columns if column.name in legacy_table.c]
+    query = select(*(legacy_table.c[column] for column in columns))
+    if table.name != "monthlyReports":
+        query = query.add_columns(
+            legacy_monthly_reports.c.submittedBySchool.label("schoolId")
+        ).join(
+            legacy_monthly_reports,
+            legacy_monthly_reports.c.id == legacy_table.c.parent,
+        )
+
+    return copy_rows(connection, query, table, batch_size)
+
+
+def copy_rows(
+    connection: Connection, query: Select[Any], table: Table, batch_size: int
+) -> int:
+    """Insert the rows of a query into a table, a batch at a time.
+
+    Args:
+        connection: The database connection.
+        query: The rows to copy, with columns named after those of the table.
+        table: The table to copy the rows to.
+        batch_size: The number of rows to copy at a time.
+
+    Returns:
+        The number of copied rows.
+    """
+
+    copied = 0
+    rows = connection.execution_options(yield_per=batch_size).execute(query)
+    for batch in rows.mappings().partitions():
+        _ = connection.execute(insert(table), [dict(row) for row in batch])
+        copied += len(batch)
+
+    return copied
+
+
+def migrate_report_keys(
+    engine: Engine, batch_size: int = REPORT_KEY_MIGRATION_BATCH_SIZE
+) -> dict[str, int]:
+    """Rewrite the report tables so that they are keyed by school and month.
+
+    The tables of the old schema are renamed, the new tables are created, and
+    the rows are copied over in batches before the old tables are dropped.
+    Everything is done in one transaction, so on SQLite and PostgreSQL a
+    failed migration leaves the database as it was. MySQL commits each
+    schema change, so back up the database before migrating it.
+
+    Args:
+        engine: The database engine.
+        batch_size: The number of rows to copy at a time.
+
+    Returns:
+        The number of rows copied to each table, or an empty dict if the
+        tables were already migrated.
+
+    Raises:
+        ReportKeyMigrationError: If some rows belong to a month without a
+            monthly report. The database is not changed.
+    """
+
+    with engine.begin() as connection:
+        if not needs_report_key_migration(connection):
+            logger.info("The report tables are already keyed by school and month.")
+            return {}
+
+        inspector = inspect(connection)
+        tables = [
+            table for table in get_report_tables() if inspector.has_table(table.name)
+        ]
+        # Check before changing anything, because MySQL commits schema changes.
+        orphaned = count_orphaned_rows(connection, [table.name for table in tables])
+        if orphaned:
+            for name, rows in orphaned.items():
+                logger.error(
+                    "%s rows of %s belong to a month without a monthly report.",
+                    rows,
+                    name,
+                )
+
+            raise ReportKeyMigrationError(
+                "Some report rows belong to a month without a monthly report, "
+                "so their school is unknown: "
+                + ", ".join(f"{name} ({rows})" for name, rows in orphaned.items())
+                + ". Add their monthly reports or delete them, then migrate again."
+            )
+
+        legacy_tables = {
+            table.name: move_legacy_table(connection, table.name) for table in tables
+        }
+        SQLModel.metadata.create_all(connection, tables=get_report_tables())
+
+        copied: dict[str, int] = {}
+        for table in tables:
+            copied[table.name] = _copy_legacy_rows(
+                connection,
+                table,
+                legacy_tables[table.name],
+                legacy_tables["monthlyReports"],
+                batch_size,
+            )
+            logger.info("Copied %s rows to %s.", copied[table.name], table.name)
+
+        for table in reversed(tables):
+            legacy_tables[table.name].drop(connection)
+
+    return copied
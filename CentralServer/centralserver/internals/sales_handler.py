@@ -0,0 +1,162 @@
+import datetime
+
+from sqlalchemy import ColumnElement
+from sqlmodel import Session, and_, col, func, or_, select
+
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReportEntry,
+    SalesTotal,
+)
+
+
+def _in_range(
+    school_id: int, start: datetime.date, end: datetime.date
+) -> ColumnElement[bool]:
+    """Build a condition that selects the daily entries of a school in a date range.
+
+    Entries are identified by their month (`parent`) and `day`, so the range
+    is compared on both columns to use the primary key index.
+
+    Args:
+        school_id: The ID of the school.
+        start: The first day of the range.
+        end: The last day of the range.
+
+    Returns:
+        The condition for the WHERE clause.
+    """
+
+    start_month, end_month = start.replace(day=1), end.replace(day=1)
+    parent = col(DailyFinancialReportEntry.parent)
+    day = col(DailyFinancialReportEntry.day)
+    return and_(
+        col(DailyFinancialReportEntry.schoolId) == school_id,
+        parent.between(start_month, end_month),
+        or_(parent > start_month, day >= start.day),
+        or_(parent < end_month, day <= end.day),
+    )
+
+
+async def get_daily_entry(
+    session: Session, school_id: int, date: datetime.date
+) -> DailyFinancialReportEntry | None:
+    """Get the sales and purchases of a school on a specific day.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school.
+        date: The day to get the entry of.
+
+    Returns:
+        The daily entry, or None if there is no entry for the day.
+    """
+
+    return session.exec(
+        select(DailyFinancialReportEntry).where(
+            col(DailyFinancialReportEntry.schoolId) == school_id,
+            col(DailyFinancialReportEntry.parent) == date.replace(day=1),
+            col(DailyFinancialReportEntry.day) == date.day,
+        )
+    ).first()
+
+
+async def get_daily_entries(
+    session: Session, school_id: int, start: datetime.date, end: datetime.date
+) -> list[DailyFinancialReportEntry]:
+    """Get the daily entries of a school in a date range.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school.
+        start: The first day of the range.
+        end: The last day of the range.
+
+    Returns:
+        The daily entries in the range, in chronological order.
+    """
+
+    return list(
+        session.exec(
+            select(DailyFinancialReportEntry)
+            .where(_in_range(school_id, start, end))
+            .order_by(
+                col(DailyFinancialReportEntry.parent),
+                col(DailyFinancialReportEntry.day),
+            )
+        ).all()
+    )
+
+
+async def get_sales_total(
+    session: Session, school_id: int, start: datetime.date, end: datetime.date
+) -> SalesTotal:
+    """Get the total sales and purchases of a school in a date range.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school.
+        start: The first day of the range.
+        end: The last day of the range.
+
+    Returns:
+        The totals, computed by the database.
+    """
+
+    sales, purchases, days = session.exec(
+        select(
+            func.coalesce(func.sum(DailyFinancialReportEntry.sales), 0.0),
+            func.coalesce(func.sum(DailyFinancialReportEntry.purchases), 0.0),
+            func.count(),
+        )
+        .select_from(DailyFinancialReportEntry)
+        .where(_in_range(school_id, start, end))
+    ).one()
+    return SalesTotal(
+        start=start,
+        end=end,
+        sales=float(sales),
+        purchases=float(purchases),
+        days=days,
+    )
+
+
+async def get_weekly_total(
+    session: Session, school_id: int, date: datetime.date
+) -> SalesTotal:
+    """Get the total sales and purchases of the week (Monday to Sunday) of a day.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school.
+        date: A day in the week.
+
+    Returns:
+        The totals of the week.
+    """
+
+    start = date - datetime.timedelta(days=date.weekday())
+    return await get_sales_total(
+        session, school_id, start, start + datetime.timedelta(days=6)
+    )
+
+
+async def get_monthly_total(
+    session: Session, school_id: int, year: int, month: int
+) -> SalesTotal:
+    """Get the total sales and purchases of a month.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school.
+        year: The year of the month.
+        month: The month.
+
+    Returns:
+        The totals of the month.
+    """
+
+    start = datetime.date(year, month, 1)
+    next_month = (start + datetime.timedelta(days=31)).replace(day=1)
+    return await get_sales_total(
+        session, school_id, start, next_month - datetime.timedelta(days=1)
+    )
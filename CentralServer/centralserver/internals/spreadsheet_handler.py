@@ -0,0 +1,501 @@
+import csv
+import datetime
+import io
+import re
+import zipfile
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, Literal, Sequence
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from centralserver.internals.exceptions import SpreadsheetFormatError
+
+SpreadsheetFormat = Literal["csv", "xlsx"]
+CellValue = str | float | int | bool | datetime.datetime | datetime.date | None
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+SPREADSHEET_CONTENT_TYPES: dict[SpreadsheetFormat, str] = {
+    "csv": "text/csv",
+    "xlsx": XLSX_CONTENT_TYPE,
+}
+# Size of the chunks of exported spreadsheets
+SPREADSHEET_CHUNK_SIZE = 64 * 1024
+
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_XLSX_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+# Built-in number formats that display dates and times
+_XLSX_DATE_FORMAT_IDS = frozenset({*range(14, 23), 45, 46, 47})
+# Dates are stored as the number of days since this day (1900 date system)
+_XLSX_EPOCH = datetime.datetime(1899, 12, 30)
+_XLSX_COLUMN = re.compile(r"^([A-Z]+)")
+# Characters that are not allowed in XML documents
+_XML_INVALID_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Styles of the cells of exported workbooks, in the order of `cellXfs`
+_XLSX_DATE_STYLE = 1
+_XLSX_DATETIME_STYLE = 2
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_STATIC_PARTS: dict[str, str] = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_DOC_REL_NS}/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_DOC_REL_NS}/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_DOC_REL_NS}/styles" '
+        'Target="styles.xml"/></Relationships>'
+    ),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<styleSheet xmlns="{_XLSX_MAIN_NS}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+        "</border></borders>"
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+        "</cellStyleXfs>"
+        '<cellXfs count="3">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" '
+        'applyNumberFormat="1"/>'
+        '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" '
+        'applyNumberFormat="1"/>'
+        "</cellXfs>"
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+        "</cellStyles></styleSheet>"
+    ),
+}
+
+
+def get_spreadsheet_format(
+    filename: str | None, content_type: str | None = None
+) -> SpreadsheetFormat:
+    """Get the format of an uploaded spreadsheet.
+
+    Args:
+        filename: The name of the uploaded file.
+        content_type: The MIME type of the uploaded file.
+
+    Returns:
+        The format of the spreadsheet.
+
+    Raises:
+        SpreadsheetFormatError: If the file is not a CSV or XLSX file.
+    """
+
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "csv" or content_type == "text/csv":
+        return "csv"
+
+    if extension == "xlsx" or content_type == XLSX_CONTENT_TYPE:
+        return "xlsx"
+
+    raise SpreadsheetFormatError("Only CSV and XLSX files are supported.")
+
+
+def iter_csv_rows(file: BinaryIO) -> Iterator[tuple[int, list[CellValue]]]:
+    """Read the rows of a CSV file one at a time.
+
+    Args:
+        file: The UTF-8 encoded CSV file.
+
+    Yields:
+        The line number and the values of each row.
+
+    Raises:
+        SpreadsheetFormatError: If the file is not a valid CSV file.
+    """
+
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        for row in reader:
+            yield reader.line_num, list(row)
+
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise SpreadsheetFormatError(f"Invalid CSV file: {e}") from e
+
+    finally:
+        _ = text.detach()  # Leave the uploaded file open
+
+
+def _xlsx_text(element: ElementTree.Element) -> str:
+    """Get the text of a string item, ignoring phonetic hints."""
+
+    text = element.find(f"{_XLSX_NS}t")
+    if text is not None:
+        return text.text or ""
+
+    return "".join(
+        run.findtext(f"{_XLSX_NS}t", default="")
+        for run in element.iterfind(f"{_XLSX_NS}r")
+    )
+
+
+def _xlsx_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+
+    strings: list[str] = []
+    with archive.open("xl/sharedStrings.xml") as file:
+        for _, element in ElementTree.iterparse(file):
+            if element.tag == f"{_XLSX_NS}si":
+                strings.append(_xlsx_text(element))
+                element.clear()
+
+    return strings
+
+
+def _xlsx_date_styles(archive: zipfile.ZipFile) -> frozenset[int]:
+    """Get the indices of the cell styles that display dates."""
+
+    if "xl/styles.xml" not in archive.namelist():
+        return frozenset()
+
+    with archive.open("xl/styles.xml") as file:
+        styles = ElementTree.parse(file).getroot()
+
+    date_format_ids = set(_XLSX_DATE_FORMAT_IDS)
+    for number_format in styles.iterfind(f"{_XLSX_NS}numFmts/{_XLSX_NS}numFmt"):
+        # Ignore quoted text and [colors] before looking for date parts
+        code = re.sub(r'"[^"]*"|\[[^\]]*\]', "", number_format.get("formatCode", ""))
+        if re.search(r"[dmyhs]", code, re.IGNORECASE):
+            date_format_ids.add(int(number_format.get("numFmtId", "0")))
+
+    return frozenset(
+        index
+        for index, style in enumerate(
+            styles.iterfind(f"{_XLSX_NS}cellXfs/{_XLSX_NS}xf")
+        )
+        if int(style.get("numFmtId", "0")) in date_format_ids
+    )
+
+
+def _xlsx_first_sheet(archive: zipfile.ZipFile) -> str:
+    """Get the path of the first worksheet in the archive."""
+
+    with archive.open("xl/workbook.xml") as file:
+        sheet = ElementTree.parse(file).find(f"{_XLSX_NS}sheets/{_XLSX_NS}sheet")
+    if sheet is None:
+        raise SpreadsheetFormatError("The workbook has no worksheets.")
+
+    with archive.open("xl/_rels/workbook.xml.rels") as file:
+        relationships = ElementTree.parse(file).getroot()
+    for relationship in relationships.iterfind(f"{_XLSX_PACKAGE_REL_NS}Relationship"):
+        if relationship.get("Id") == sheet.get(f"{_XLSX_REL_NS}id"):
+            target = relationship.get("Target", "")
+            return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+
+    raise SpreadsheetFormatError("The first worksheet of the workbook is missing.")
+
+
+def _xlsx_column_index(reference: str) -> int:
+    """Convert a cell reference (e.g. `AB12`) to a zero-based column index."""
+
+    match = _XLSX_COLUMN.match(reference)
+    if match is None:
+        raise SpreadsheetFormatError(f"Invalid cell reference `{reference}`.")
+
+    index = 0
+    for letter in match.group(1):
+        index = index * 26 + ord(letter) - ord("A") + 1
+
+    return index - 1
+
+
+def _xlsx_cell_value(
+    cell: ElementTree.Element, shared_strings: list[str], date_styles: frozenset[int]
+) -> CellValue:
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{_XLSX_NS}is")
+        return None if inline is None else _xlsx_text(inline)
+
+    value = cell.findtext(f"{_XLSX_NS}v")
+    if value is None:
+        return None
+
+    match cell_type:
+        case "s":
+            return shared_strings[int(value)]
+
+        case "b":
+            return value == "1"
+
+        case "str" | "e":
+            return value
+
+    number = float(value)
+    if int(cell.get("s", "0")) in date_styles:
+        return _XLSX_EPOCH + datetime.timedelta(days=number)
+
+    return int(number) if number.is_integer() else number
+
+
+def iter_xlsx_rows(file: BinaryIO) -> Iterator[tuple[int, list[CellValue]]]:
+    """Read the rows of the first worksheet of an XLSX file one at a time.
+
+    Only the shared strings of the workbook are kept in memory. The rows of
+    the worksheet are parsed as they are read from the archive.
+
+    Args:
+        file: The seekable XLSX file.
+
+    Yields:
+        The row number and the values of each row.
+
+    Raises:
+        SpreadsheetFormatError: If the file is not a valid XLSX file.
+    """
+
+    try:
+        with zipfile.ZipFile(file) as archive:
+            shared_strings = _xlsx_shared_strings(archive)
+            date_styles = _xlsx_date_styles(archive)
+            with archive.open(_xlsx_first_sheet(archive)) as sheet:
+                sheet_data: ElementTree.Element | None = None
+                for event, element in ElementTree.iterparse(
+                    sheet, events=("start", "end")
+                ):
+                    if event == "start":
+                        if element.tag == f"{_XLSX_NS}sheetData":
+                            sheet_data = element
+                        continue
+
+                    if element.tag != f"{_XLSX_NS}row":
+                        continue
+
+                    row: list[CellValue] = []
+                    for cell in element.iterfind(f"{_XLSX_NS}c"):
+                        reference = cell.get("r")
+                        index = (
+                            len(row)
+                            if reference is None
+                            else _xlsx_column_index(reference)
+                        )
+                        row.extend([None] * (index - len(row)))
+                        row.append(_xlsx_cell_value(cell, shared_strings, date_styles))
+
+                    yield int(element.get("r", "0")), row
+                    # Forget the rows that have been read
+                    if sheet_data is not None:
+                        sheet_data.clear()
+
+    except (zipfile.BadZipFile, KeyError, ValueError, ElementTree.ParseError) as e:
+        raise SpreadsheetFormatError(f"Invalid XLSX file: {e}") from e
+
+
+def iter_spreadsheet_records(
+    file: BinaryIO, spreadsheet_format: SpreadsheetFormat
+) -> Iterator[tuple[int, dict[str, CellValue]]]:
+    """Read the rows of a spreadsheet as records, using its first row as headers.
+
+    Empty rows are skipped, and empty cells are left out of their records.
+
+    Args:
+        file: The spreadsheet file.
+        spreadsheet_format: The format of the spreadsheet.
+
+    Yields:
+        The row number and the values of each row, keyed by their header.
+
+    Raises:
+        SpreadsheetFormatError: If the spreadsheet cannot be read.
+    """
+
+    rows = iter_csv_rows(file) if spreadsheet_format == "csv" else iter_xlsx_rows(file)
+    headers: list[str] | None = None
+    for row_number, row in rows:
+        values = [None if value == "" else value for value in row]
+        if all(value is None for value in values):
+            continue
+
+        if headers is None:
+            headers = [str(value or "").strip() for value in values]
+            continue
+
+        yield row_number, {
+            header: value
+            for header, value in zip(headers, values)
+            if header and value is not None
+        }
+
+
+class _ChunkSink:
+    """A write-only stream that keeps what is written until it is taken."""
+
+    def __init__(self) -> None:
+        self.__chunks: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """Keep the written data."""
+
+        self.__chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """Do nothing; the written data is kept until it is taken."""
+
+    def take(self) -> bytes:
+        """Get and forget everything written so far."""
+
+        data = b"".join(self.__chunks)
+        self.__chunks.clear()
+        self.size = 0
+        return data
+
+
+def iter_csv_chunks(
+    headers: Sequence[str], rows: Iterable[Sequence[CellValue]]
+) -> Iterator[bytes]:
+    """Write rows as a UTF-8 encoded CSV file, a chunk at a time.
+
+    Args:
+        headers: The values of the first row.
+        rows: The values of the other rows.
+
+    Yields:
+        Chunks of the CSV file.
+    """
+
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow(row)
+        if text.tell() >= SPREADSHEET_CHUNK_SIZE:
+            yield text.getvalue().encode()
+            _ = text.seek(0)
+            _ = text.truncate()
+
+    yield text.getvalue().encode()
+
+
+def _xlsx_column_name(index: int) -> str:
+    """Convert a zero-based column index to its letters (e.g. 27 to `AB`)."""
+
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(ord("A") + remainder) + name
+
+    return name
+
+
+def _xlsx_cell(reference: str, value: CellValue) -> str:
+    if value is None:
+        return ""
+
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+
+    if isinstance(value, (int, float)):
+        return f'<c r="{reference}"><v>{value!r}</v></c>'
+
+    if isinstance(value, datetime.datetime):
+        serial = (value.replace(tzinfo=None) - _XLSX_EPOCH) / datetime.timedelta(days=1)
+        return f'<c r="{reference}" s="{_XLSX_DATETIME_STYLE}"><v>{serial!r}</v></c>'
+
+    if isinstance(value, datetime.date):
+        serial = (value - _XLSX_EPOCH.date()).days
+        return f'<c r="{reference}" s="{_XLSX_DATE_STYLE}"><v>{serial}</v></c>'
+
+    text = escape(_XML_INVALID_CHARS.sub("", value))
+    return (
+        f'<c r="{reference}" t="inlineStr">'
+        f'<is><t xml:space="preserve">{text}</t></is></c>'
+    )
+
+
+def iter_xlsx_chunks(
+    headers: Sequence[str], rows: Iterable[Sequence[CellValue]]
+) -> Iterator[bytes]:
+    """Write rows as the only worksheet of an XLSX file, a chunk at a time.
+
+    The workbook is compressed as it is written, so only one chunk of it is
+    kept in memory.
+
+    Args:
+        headers: The values of the first row.
+        rows: The values of the other rows.
+
+    Yields:
+        Chunks of the XLSX file.
+    """
+
+    sink = _ChunkSink()
+    # The sink cannot seek, so the archive is written strictly in order.
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:  # type: ignore
+        for name, content in _XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+        archive.writestr(
+            "xl/workbook.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<workbook xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_DOC_REL_NS}">'
+            '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+            "</workbook>",
+        )
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            _ = sheet.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<worksheet xmlns="{_XLSX_MAIN_NS}"><sheetData>'.encode()
+            )
+            for row_number, row in enumerate(chain((headers,), rows), start=1):
+                cells = "".join(
+                    _xlsx_cell(f"{_xlsx_column_name(index)}{row_number}", value)
+                    for index, value in enumerate(row)
+                )
+                _ = sheet.write(f'<row r="{row_number}">{cells}</row>'.encode())
+                if sink.size >= SPREADSHEET_CHUNK_SIZE:
+                    yield sink.take()
+
+            _ = sheet.write(b"</sheetData></worksheet>")
+
+    yield sink.take()
+
+
+def iter_spreadsheet_chunks(
+    headers: Sequence[str],
+    rows: Iterable[Sequence[CellValue]],
+    spreadsheet_format: SpreadsheetFormat,
+) -> Iterator[bytes]:
+    """Write rows as a spreadsheet, a chunk at a time.
+
+    Args:
+        headers: The values of the first row.
+        rows: The values of the other rows.
+        spreadsheet_format: The format of the spreadsheet.
+
+    Yields:
+        Chunks of the spreadsheet.
+    """
+
+    if spreadsheet_format == "csv":
+        return iter_csv_chunks(headers, rows)
+
+    return iter_xlsx_chunks(headers, rows)
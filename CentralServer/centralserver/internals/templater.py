@@ -1,8 +1,96 @@
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Final
 
-from centralserver.internals.config_handler import app_config
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+    select_autoescape,
+)
+
+from centralserver.internals.config_handler import AppConfig, app_config, config_store
+from centralserver.internals.exceptions import EmailTemplateNotFoundError
+
+# Email templates used by the server. Each template has a plain text (`.txt`)
+# and an HTML (`.html`) variant in the templates directory.
+MAIL_TEMPLATES: Final[tuple[str, ...]] = (
+    "email_verification",
+    "invite",
+    "mfa_otp_disabled",
+    "mfa_otp_enabled",
+    "password_recovery",
+    "unusual_login",
+)
+MAIL_TEMPLATE_EXTENSIONS: Final[tuple[str, str]] = ("txt", "html")
 
 templater = Environment(
-    loader=FileSystemLoader(app_config.mailing.templates_dir),
+    loader=FileSystemLoader(
+        app_config.mailing.templates_dir,
+        encoding=app_config.mailing.templates_encoding,
+    ),
     autoescape=select_autoescape(),
+    bytecode_cache=FileSystemBytecodeCache(),
+    # Templates are compiled once; only check for changes when hot reloading.
+    auto_reload=app_config.debug.hot_reload,
 )
+
+
+def precompile_templates() -> int:
+    """Compile every template in the templates directory.
+
+    This also checks that all templates in `MAIL_TEMPLATES` exist so that
+    missing templates are reported when the server starts instead of when
+    an email is sent.
+
+    Returns:
+        The number of compiled templates.
+
+    Raises:
+        EmailTemplateNotFoundError: If a required template is missing.
+    """
+
+    available = set(templater.list_templates())
+    missing = [
+        f"{template}.{extension}"
+        for template in MAIL_TEMPLATES
+        for extension in MAIL_TEMPLATE_EXTENSIONS
+        if f"{template}.{extension}" not in available
+    ]
+    if missing:
+        raise EmailTemplateNotFoundError(
+            f"Missing email templates in {app_config.mailing.templates_dir}: "
+            + ", ".join(missing)
+        )
+
+    try:
+        for template_name in available:
+            _ = templater.get_template(template_name)
+
+    except TemplateNotFound as exc:
+        raise EmailTemplateNotFoundError(
+            f"The template '{exc.name}' was not found in the templates directory."
+        ) from exc
+
+    return len(available)
+
+
+def _apply_config(old_config: AppConfig, new_config: AppConfig) -> None:
+    """Load templates from the new templates directory if it was changed."""
+
+    if (old_config.mailing.templates_dir, old_config.mailing.templates_encoding) == (
+        new_config.mailing.templates_dir,
+        new_config.mailing.templates_encoding,
+    ):
+        return
+
+    templater.loader = FileSystemLoader(
+        new_config.mailing.templates_dir,
+        encoding=new_config.mailing.templates_encoding,
+    )
+    if templater.cache is not None:
+        templater.cache.clear()
+
+    _ = precompile_templates()
+
+
+config_store.subscribe(_apply_config)
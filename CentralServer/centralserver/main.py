@@ -1,37 +1,49 @@
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exception_handlers import http_exception_handler
-from fastapi.middleware.cors import CORSMiddleware
 
 from centralserver import info
 from centralserver.internals.adapters.object_store import get_object_store_handler
-from centralserver.internals.config_handler import app_config
+from centralserver.internals.ai.loader import start_warm_up
+from centralserver.internals.config_handler import app_config, config_store
 from centralserver.internals.db_handler import populate_db
 from centralserver.internals.logger import LoggerFactory, log_app_info
+from centralserver.internals.middleware import (
+    QUERY_COUNT_HEADER,
+    REQUEST_ID_HEADER,
+    MetricsMiddleware,
+    ReloadableCORSMiddleware,
+    RequestContextMiddleware,
+)
+from centralserver.internals.templater import precompile_templates
 from centralserver.routers import (
+    ai_routes,
     auth_routes,
     misc_routes,
     notification_routes,
     reports_routes,
     schools_routes,
     users_routes,
-    ai_routes
 )
 
-logger = LoggerFactory(
-    log_level="DEBUG" if app_config.debug.enabled else "WARN"
-).get_logger(__name__)
+logger = LoggerFactory().get_logger(__name__)
 
 
 async def startup():
     log_app_info(logger)
+    # Fail early if any email template is missing
+    logger.debug("Compiled %d email templates", precompile_templates())
     _ = await populate_db()  # Create the database if it doesn't exist
     # Set up object store if not yet ready
     handler = await get_object_store_handler(app_config.object_store)
     await handler.check()
+    config_store.watch()  # Apply changes to the configuration file
+    if app_config.ai.enabled and app_config.ai.warm_up:
+        start_warm_up()
 
 
 async def shutdown():
     logger.info("Shutting down the application...")
+    config_store.stop_watching()
 
 
 app = FastAPI(
@@ -52,12 +64,30 @@ app.include_router(reports_routes.router)
 app.include_router(misc_routes.router)
 
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=app_config.security.allow_origins,
-    allow_credentials=app_config.security.allow_credentials,
-    allow_methods=app_config.security.allow_methods,
-    allow_headers=app_config.security.allow_headers,
+    ReloadableCORSMiddleware,
+    expose_headers=[REQUEST_ID_HEADER, QUERY_COUNT_HEADER],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestContextMiddleware)
+
+
+def log_request_details(request: Request) -> None:
+    """Log the details of a request that resulted in an error.
+
+    Args:
+        request: The request to log.
+    """
+
+    logger.debug(
+        "Request: %s %s",
+        request.method,
+        request.url,
+        extra={
+            "url": str(request.url),
+            "headers": dict(request.headers),
+            "cookies": request.cookies,
+        },
+    )
 
 
 @app.exception_handler(status.HTTP_400_BAD_REQUEST)
@@ -65,9 +95,7 @@ async def bad_request_error(request: Request, exc: HTTPException):
     """Return a 400 error response."""
 
     logger.warning("Bad Request: %s", exc)
-    logger.debug("Request URL: %s", request.url)
-    logger.debug("Request Headers: %s", request.headers)
-    logger.debug("Request Cookies: %s", request.cookies)
+    log_request_details(request)
 
     return await http_exception_handler(request, exc)
 
@@ -77,9 +105,7 @@ async def unauthorized_error(request: Request, exc: HTTPException):
     """Return a 401 error response."""
 
     logger.warning("Unauthorized: %s", exc)
-    logger.debug("Request URL: %s", request.url)
-    logger.debug("Request Headers: %s", request.headers)
-    logger.debug("Request Cookies: %s", request.cookies)
+    log_request_details(request)
 
     return await http_exception_handler(request, exc)
 
@@ -89,9 +115,7 @@ async def forbidden_error(request: Request, exc: HTTPException):
     """Return a 403 error response."""
 
     logger.warning("Forbidden: %s", exc)
-    logger.debug("Request URL: %s", request.url)
-    logger.debug("Request Headers: %s", request.headers)
-    logger.debug("Request Cookies: %s", request.cookies)
+    log_request_details(request)
 
     return await http_exception_handler(request, exc)
 
@@ -101,9 +125,7 @@ async def not_found_error(request: Request, exc: HTTPException):
     """Return a 404 error response."""
 
     logger.warning("Not Found: %s", exc)
-    logger.debug("Request URL: %s", request.url)
-    logger.debug("Request Headers: %s", request.headers)
-    logger.debug("Request Cookies: %s", request.cookies)
+    log_request_details(request)
 
     return await http_exception_handler(request, exc)
 
@@ -113,8 +135,6 @@ async def internal_server_error(request: Request, exc: HTTPException):
     """Return a 500 error response."""
 
     logger.critical("Internal Server Error: %s", exc, exc_info=True)
-    logger.debug("Request URL: %s", request.url)
-    logger.debug("Request Headers: %s", request.headers)
-    logger.debug("Request Cookies: %s", request.cookies)
+    log_request_details(request)
 
     return await http_exception_handler(request, exc)
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Query, Depends
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Depends, status
 from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
-from centralserver.internals.ai.core import smart_ask
+from centralserver.internals.ai.loader import get_ai_core
+from centralserver.internals.config_handler import app_config
+from centralserver.internals.db_handler import get_db_session
 from centralserver.routers.misc_routes import logged_in_dep
 from centralserver.internals.ai.auth import fetch_user_info
 
@@ -10,11 +14,18 @@ router = APIRouter(prefix="/ai", tags=["AI Assistant"])
 
 @router.post("/ask")
 async def ask_ai(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
     prompt: str = Query(...),
     user_id: str = Query("default"),
-    token: logged_in_dep = Depends(),
-    session: Session = Depends(),
 ):
+    if not app_config.ai.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The AI assistant is disabled.",
+        )
+
+    core = await get_ai_core()
     user_info = await fetch_user_info(token, session)
-    reply = await smart_ask(prompt, user_id, user_info, token, session)
+    reply = await core.smart_ask(prompt, user_id, user_info, token, session)
     return JSONResponse(content={"reply": reply})
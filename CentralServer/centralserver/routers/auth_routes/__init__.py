@@ -27,7 +27,7 @@ from centralserver.internals.auth_handler import (
 from centralserver.internals.config_handler import app_config
 from centralserver.internals.db_handler import get_db_session
 from centralserver.internals.logger import LoggerFactory
-from centralserver.internals.mail_handler import get_template, send_mail
+from centralserver.internals.mail_handler import get_template_pair, send_mail
 from centralserver.internals.models.role import Role
 from centralserver.internals.models.token import DecodedJWTToken, JWTToken
 from centralserver.internals.models.user import User, UserCreate, UserInvite, UserPublic
@@ -325,26 +325,20 @@ async def invite_user(
         invited_user = UserPublic.model_validate(created_user)
 
         logger.debug("Sending invitation email to the new user")
+        text, html = get_template_pair(
+            "invite",
+            app_name=info.Program.name,
+            name=invited_user.nameFirst or invited_user.username,
+            username=invited_user.username,
+            password=genpass,
+            base_url=app_config.connection.base_url,
+        )
         background_tasks.add_task(
             send_mail,
             to_address=new_user.email,
             subject=f"Invitation to {info.Program.name}",
-            text=get_template(
-                "invite.txt",
-                app_name=info.Program.name,
-                name=invited_user.nameFirst or invited_user.username,
-                username=invited_user.username,
-                password=genpass,
-                base_url=app_config.connection.base_url,
-            ),
-            html=get_template(
-                "invite.html",
-                app_name=info.Program.name,
-                name=invited_user.nameFirst or invited_user.username,
-                username=invited_user.username,
-                password=genpass,
-                base_url=app_config.connection.base_url,
-            ),
+            text=text,
+            html=html,
         )
 
         logger.debug("Returning invited user information: %s", invited_user.id)
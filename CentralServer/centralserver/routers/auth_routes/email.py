@@ -14,7 +14,7 @@ from centralserver.internals.config_handler import app_config
 from centralserver.internals.db_handler import get_db_session
 from centralserver.internals.exceptions import EmailTemplateNotFoundError
 from centralserver.internals.logger import LoggerFactory
-from centralserver.internals.mail_handler import get_template, send_mail
+from centralserver.internals.mail_handler import get_template_pair, send_mail
 from centralserver.internals.models.notification import NotificationType
 from centralserver.internals.models.token import (
     DecodedJWTToken,
@@ -98,24 +98,19 @@ async def request_verification_email(
     )
     logger.info("Email verified successfully for user: %s", user.username)
     try:
+        text, html = get_template_pair(
+            "email_verification",
+            name=user.nameFirst or user.username,
+            app_name=info.Program.name,
+            verification_link=recovery_link,
+            expiration_time=app_config.authentication.recovery_token_expire_minutes,
+        )
         background_tasks.add_task(
             send_mail,
             to_address=user.email,
             subject=f"{info.Program.name} | Email Verification Request",
-            text=get_template(
-                "email_verification.txt",
-                name=user.nameFirst or user.username,
-                app_name=info.Program.name,
-                verification_link=recovery_link,
-                expiration_time=app_config.authentication.recovery_token_expire_minutes,
-            ),
-            html=get_template(
-                "email_verification.html",
-                name=user.nameFirst or user.username,
-                app_name=info.Program.name,
-                verification_link=recovery_link,
-                expiration_time=app_config.authentication.recovery_token_expire_minutes,
-            ),
+            text=text,
+            html=html,
         )
 
     except EmailTemplateNotFoundError as e:
@@ -261,24 +256,19 @@ async def request_password_recovery(
     logger.debug("Generated recovery link for user %s: %s", username, recovery_link)
 
     try:
+        text, html = get_template_pair(
+            "password_recovery",
+            name=user.nameFirst or user.username,
+            app_name=info.Program.name,
+            recovery_link=recovery_link,
+            expiration_time=app_config.authentication.recovery_token_expire_minutes,
+        )
         background_tasks.add_task(
             send_mail,
             to_address=user.email,
             subject=f"{info.Program.name} | Password Recovery Request",
-            text=get_template(
-                "password_recovery.txt",
-                name=user.nameFirst or user.username,
-                app_name=info.Program.name,
-                recovery_link=recovery_link,
-                expiration_time=app_config.authentication.recovery_token_expire_minutes,
-            ),
-            html=get_template(
-                "password_recovery.html",
-                name=user.nameFirst or user.username,
-                app_name=info.Program.name,
-                recovery_link=recovery_link,
-                expiration_time=app_config.authentication.recovery_token_expire_minutes,
-            ),
+            text=text,
+            html=html,
         )
 
     except EmailTemplateNotFoundError:
@@ -15,7 +15,7 @@ from centralserver.internals.config_handler import app_config
 from centralserver.internals.db_handler import get_db_session
 from centralserver.internals.exceptions import EmailTemplateNotFoundError
 from centralserver.internals.logger import LoggerFactory
-from centralserver.internals.mail_handler import get_template, send_mail
+from centralserver.internals.mail_handler import get_template_pair, send_mail
 from centralserver.internals.models.notification import NotificationType
 from centralserver.internals.models.token import (
     DecodedJWTToken,
@@ -114,20 +114,17 @@ async def verify_mfa_otp(
 
     try:
         if user.email:
+            text, html = get_template_pair(
+                "mfa_otp_enabled",
+                name=user.nameFirst or user.username,
+                app_name=info.Program.name,
+            )
             background_tasks.add_task(
                 send_mail,
                 to_address=user.email,
                 subject=f"{info.Program.name} | Two-Factor Authentication Enabled",
-                text=get_template(
-                    "mfa_otp_enabled.txt",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
-                html=get_template(
-                    "mfa_otp_enabled.html",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
+                text=text,
+                html=html,
             )
 
     except EmailTemplateNotFoundError:
@@ -286,20 +283,17 @@ async def mfa_otp_recovery(
 
     try:
         if user.email:
+            text, html = get_template_pair(
+                "mfa_otp_disabled",
+                name=user.nameFirst or user.username,
+                app_name=info.Program.name,
+            )
             background_tasks.add_task(
                 send_mail,
                 to_address=user.email,
                 subject=f"{info.Program.name} | Two-Factor Authentication Disabled",
-                text=get_template(
-                    "mfa_otp_disabled.txt",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
-                html=get_template(
-                    "mfa_otp_disabled.html",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
+                text=text,
+                html=html,
             )
 
     except EmailTemplateNotFoundError:
@@ -366,20 +360,17 @@ async def disable_mfa_otp(
 
     try:
         if user.email:
+            text, html = get_template_pair(
+                "mfa_otp_disabled",
+                name=user.nameFirst or user.username,
+                app_name=info.Program.name,
+            )
             background_tasks.add_task(
                 send_mail,
                 to_address=user.email,
                 subject=f"{info.Program.name} | Two-Factor Authentication Disabled",
-                text=get_template(
-                    "mfa_otp_disabled.txt",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
-                html=get_template(
-                    "mfa_otp_disabled.html",
-                    name=user.nameFirst or user.username,
-                    app_name=info.Program.name,
-                ),
+                text=text,
+                html=html,
             )
 
     except EmailTemplateNotFoundError:
@@ -2,15 +2,21 @@ import json
 from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from sqlmodel import Session
 
-from centralserver.info import FORBIDDEN_CONFIG_KEYS
+from centralserver.info import FORBIDDEN_CONFIG_KEYS, RESTART_REQUIRED_CONFIG_SECTIONS
 from centralserver.internals.auth_handler import (
     verify_access_token,
     verify_user_permission,
 )
-from centralserver.internals.config_handler import app_config
+from centralserver.internals.config_handler import (
+    app_config,
+    config_store,
+    read_config,
+)
 from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY
 from centralserver.internals.models.settings import ConfigUpdateRequest
 from centralserver.internals.models.token import DecodedJWTToken
 
@@ -26,6 +32,22 @@ async def root() -> dict[Literal["message"], Literal["Healthy"]]:
     return {"message": "Healthy"}
 
 
+@router.get("/admin/metrics", response_class=PlainTextResponse)
+async def get_server_metrics(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+) -> PlainTextResponse:
+    """Get the metrics of this server process in the Prometheus text format."""
+
+    if not await verify_user_permission("site:manage", session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access server metrics.",
+        )
+
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @router.get("/admin/config")
 async def get_server_config(
     token: logged_in_dep,
@@ -136,13 +158,31 @@ async def update_server_config(
         for section, updates in safe_updates.items():
             current_config[section] = updates
 
-        # Write back to file
+        # Do not write a configuration that cannot be loaded
+        try:
+            _ = read_config(app_config.filepath, app_config.encoding, current_config)
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid configuration: {str(e)}",
+            ) from e
+
+        # Write back to file and apply the changes
         with open(app_config.filepath, "w", encoding=app_config.encoding) as f:
             json.dump(current_config, f, indent=4)
 
-        return {
-            "message": "Configuration updated successfully. A server restart is required to apply all changes."
-        }
+        _ = config_store.reload()
+
+        if RESTART_REQUIRED_CONFIG_SECTIONS.intersection(safe_updates):
+            return {
+                "message": "Configuration updated successfully. A server restart is required to apply the database settings."
+            }
+
+        return {"message": "Configuration updated successfully."}
+
+    except HTTPException:
+        raise
 
     except Exception as e:
         raise HTTPException(
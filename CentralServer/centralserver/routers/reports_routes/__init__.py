@@ -8,7 +8,9 @@ from centralserver.internals.models.token import DecodedJWTToken
 from centralserver.routers.reports_routes.attachments import (
     router as attachments_router,
 )
+from centralserver.routers.reports_routes.bundle import router as bundle_router
 from centralserver.routers.reports_routes.daily import router as daily_router
+from centralserver.routers.reports_routes.exports import router as exports_router
 from centralserver.routers.reports_routes.liquidation import (
     router as liquidation_router,
 )
@@ -28,3 +30,5 @@ router.include_router(daily_router, tags=["Daily Reports"])
 router.include_router(payroll_router, tags=["Payroll Reports"])
 router.include_router(liquidation_router, tags=["Liquidation Reports"])
 router.include_router(attachments_router, tags=["Report Attachments"])
+router.include_router(exports_router, tags=["Report Exports"])
+router.include_router(bundle_router, tags=["Report Bundles"])
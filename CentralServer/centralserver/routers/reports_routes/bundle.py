@@ -0,0 +1,265 @@
+import datetime
+from typing import Annotated, Any, Literal, get_args
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from centralserver.internals.auth_handler import (
+    get_user,
+    verify_access_token,
+    verify_user_permission,
+)
+from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+    SalesTotal,
+)
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.models.reports.payroll_report import (
+    PayrollReport,
+    PayrollReportEntry,
+    PayrollReportSummary,
+)
+from centralserver.internals.models.reports.report_status_manager import (
+    ReportStatusManager,
+)
+from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.models.user import User, UserSimple
+from centralserver.internals.payroll_handler import get_payroll_summary
+from centralserver.internals.sales_handler import get_monthly_total
+from centralserver.routers.reports_routes.liquidation import (
+    ENTRY_MAPPINGS,
+    LIQUIDATION_CATEGORIES,
+    LiquidationReportResponse,
+    convert_to_response,
+)
+
+logger = LoggerFactory().get_logger(__name__)
+
+router = APIRouter(prefix="/bundle")
+logged_in_dep = Annotated[DecodedJWTToken, Depends(verify_access_token)]
+
+BundleField = Literal[
+    "report",
+    "transitions",
+    "daily",
+    "daily_entries",
+    "daily_summary",
+    "payroll",
+    "payroll_entries",
+    "payroll_summary",
+    "liquidation",
+    "signatories",
+]
+BUNDLE_FIELDS: tuple[BundleField, ...] = get_args(BundleField)
+
+# The relationship of the monthly report to each of its component reports
+REPORT_RELATIONSHIPS: dict[Any, str] = {
+    relationship.mapper.class_: relationship.key
+    for relationship in inspect(MonthlyReport).relationships
+}
+
+
+class MonthlyReportBundle(BaseModel):
+    """A monthly report and its component reports, as requested.
+
+    Sections that were not requested are left out of the response.
+    """
+
+    report: MonthlyReport | None = None
+    transitions: dict[str, dict[str, str | list[str]]] | None = None
+    daily: DailyFinancialReport | None = None
+    daily_entries: list[DailyFinancialReportEntry] | None = None
+    daily_summary: SalesTotal | None = None
+    payroll: PayrollReport | None = None
+    payroll_entries: list[PayrollReportEntry] | None = None
+    payroll_summary: PayrollReportSummary | None = None
+    liquidation: dict[str, LiquidationReportResponse] | None = None
+    signatories: list[UserSimple] | None = None
+
+
+def _get_load_options(fields: set[BundleField]) -> list[Any]:
+    """Build the options that load the component reports of the requested
+    sections with the monthly report, one query per relationship."""
+
+    options: list[Any] = []
+    if fields & {"daily", "daily_entries", "transitions"}:
+        daily = selectinload(MonthlyReport.daily_financial_report)  # type: ignore
+        if "daily_entries" in fields:
+            daily = daily.selectinload(DailyFinancialReport.entries)  # type: ignore
+        options.append(daily)
+
+    if fields & {"payroll", "payroll_entries", "transitions"}:
+        payroll = selectinload(MonthlyReport.payroll_report)  # type: ignore
+        if "payroll_entries" in fields:
+            payroll = payroll.selectinload(PayrollReport.entries)  # type: ignore
+        options.append(payroll)
+
+    if fields & {"liquidation", "transitions"}:
+        for config in LIQUIDATION_CATEGORIES.values():
+            model = config["model"]
+            report = selectinload(getattr(MonthlyReport, REPORT_RELATIONSHIPS[model]))
+            options.append(report)
+            if "liquidation" in fields:
+                options.append(report.selectinload(model.entries))
+                options.append(
+                    report.selectinload(
+                        getattr(
+                            model, ENTRY_MAPPINGS[config["entry_model"]].certified_by
+                        )
+                    )
+                )
+
+    return options
+
+
+@router.get(
+    "/{school_id}/{year}/{month}",
+    response_model=MonthlyReportBundle,
+    response_model_exclude_unset=True,
+)
+async def get_school_monthly_report_bundle(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    fields: Annotated[list[BundleField] | None, Query()] = None,
+) -> dict[str, Any]:
+    """Get a monthly report of a school with all of its component reports.
+
+    The monthly report and the component reports are loaded together, so a
+    client opening a month needs only one request.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school of the report.
+        year: The year of the report.
+        month: The month of the report.
+        fields: The sections to include, or None to include all of them.
+            Signatories are only included if the user can list users.
+
+    Returns:
+        The requested sections of the monthly report.
+
+    Raises:
+        HTTPException: If the user is not found, lacks permission, or the report is not found.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:read" if user.schoolId == school_id else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view monthly reports.",
+        )
+
+    selected: set[BundleField] = set(fields or BUNDLE_FIELDS)
+    logger.debug(
+        "user `%s` requesting the %s of monthly report of school %s for %s-%s.",
+        token.id,
+        ", ".join(sorted(selected)),
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    report = session.exec(
+        select(MonthlyReport)
+        .where(
+            MonthlyReport.submittedBySchool == school_id,
+            MonthlyReport.id == report_date,
+        )
+        .options(*_get_load_options(selected))
+    ).one_or_none()
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Monthly report not found.",
+        )
+
+    if not ReportStatusManager.check_view_permission(user, report):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You do not have permission to view reports with '{report.reportStatus.value}' status.",
+        )
+
+    bundle = MonthlyReportBundle()
+    if "report" in selected:
+        bundle.report = report
+
+    if "transitions" in selected:
+        components: dict[str, Any] = {
+            "monthly": report,
+            "daily": report.daily_financial_report,
+            "payroll": report.payroll_report,
+            **{
+                category: getattr(report, REPORT_RELATIONSHIPS[config["model"]])
+                for category, config in LIQUIDATION_CATEGORIES.items()
+            },
+        }
+        bundle.transitions = {
+            name: ReportStatusManager.get_valid_transitions_response(user, component)
+            for name, component in components.items()
+            if component is not None and component.reportStatus is not None
+        }
+
+    if "daily" in selected:
+        bundle.daily = report.daily_financial_report
+    if "daily_entries" in selected:
+        daily_report = report.daily_financial_report
+        bundle.daily_entries = list(daily_report.entries) if daily_report else []
+    if "daily_summary" in selected:
+        bundle.daily_summary = await get_monthly_total(session, school_id, year, month)
+
+    if "payroll" in selected:
+        bundle.payroll = report.payroll_report
+    if "payroll_entries" in selected:
+        payroll_report = report.payroll_report
+        bundle.payroll_entries = list(payroll_report.entries) if payroll_report else []
+    if "payroll_summary" in selected:
+        bundle.payroll_summary = await get_payroll_summary(
+            session, school_id, report_date
+        )
+
+    if "liquidation" in selected:
+        bundle.liquidation = {}
+        for category, config in LIQUIDATION_CATEGORIES.items():
+            liquidation_report = getattr(report, REPORT_RELATIONSHIPS[config["model"]])
+            if liquidation_report is not None:
+                bundle.liquidation[category] = convert_to_response(
+                    liquidation_report, category, config
+                )
+
+    if "signatories" in selected and await verify_user_permission(
+        "users:global:simple", session, token
+    ):
+        bundle.signatories = [
+            UserSimple.model_validate(signatory)
+            for signatory in session.exec(
+                select(User).where(
+                    User.schoolId == school_id,
+                    User.deactivated == False,  # pylint: disable=C0121
+                )
+            )
+        ]
+
+    # Reports loaded from the database have no fields marked as set, so only
+    # leave out the sections that were not set instead of excluding unset
+    # fields of the whole bundle.
+    return bundle.model_dump(include=bundle.model_fields_set)
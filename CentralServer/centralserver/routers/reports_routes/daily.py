@@ -1,8 +1,10 @@
 # pylint: disable=C0302
+import asyncio
+import calendar
 import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, select
 
@@ -11,10 +13,14 @@ from centralserver.internals.auth_handler import (
     verify_access_token,
     verify_user_permission,
 )
-from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.db_handler import get_db_session, upsert
+from centralserver.internals.exceptions import SpreadsheetFormatError
+from centralserver.internals.import_handler import import_records
 from centralserver.internals.logger import LoggerFactory
 from centralserver.internals.models.reports.daily_financial_report import (
+    DailyEntriesUpsertResponse,
     DailyEntryData,
+    DailyEntryUpsertResult,
     DailyFinancialReport,
     DailyFinancialReportEntry,
 )
@@ -22,6 +28,7 @@ from centralserver.internals.models.reports.monthly_report import (
     MonthlyReport,
     ReportStatus,
 )
+from centralserver.internals.models.reports.report_import import ImportResult
 from centralserver.internals.models.reports.report_status_manager import (
     ReportStatusManager,
 )
@@ -30,6 +37,11 @@ from centralserver.internals.models.reports.status_change_request import (
 )
 from centralserver.internals.models.school import School
 from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.sales_handler import get_monthly_total
+from centralserver.internals.spreadsheet_handler import (
+    get_spreadsheet_format,
+    iter_spreadsheet_records,
+)
 
 logger = LoggerFactory().get_logger(__name__)
 
@@ -42,6 +54,75 @@ async def get_school_assigned_noted_by(school_id: int, session: Session) -> str
     return None
 
 
+async def _get_draft_daily_report(
+    session: Session, user_id: str, school_id: int, report_date: datetime.date
+) -> MonthlyReport:
+    """Get the monthly report of a daily report whose entries can be written.
+
+    The monthly and daily reports are created if they do not exist yet.
+
+    Args:
+        session: The database session.
+        user_id: The ID of the user who writes the entries.
+        school_id: The ID of the school of the report.
+        report_date: The first day of the month of the report.
+
+    Returns:
+        The monthly report.
+
+    Raises:
+        HTTPException: If the daily report is no longer a draft.
+    """
+
+    # Check if the monthly report exists, create if not
+    monthly_report = session.exec(
+        select(MonthlyReport).where(
+            MonthlyReport.id == report_date,
+            MonthlyReport.submittedBySchool == school_id,
+        )
+    ).one_or_none()
+
+    if monthly_report is None:
+        # Get the school's assigned noted by user
+        noted_by = await get_school_assigned_noted_by(school_id, session)
+
+        monthly_report = MonthlyReport(
+            id=report_date,
+            name=f"Daily Report for {report_date.strftime('%B %Y')}",
+            submittedBySchool=school_id,
+            reportStatus=ReportStatus.DRAFT,
+            preparedBy=user_id,
+            notedBy=noted_by,
+        )
+        session.add(monthly_report)
+
+    # Check if the daily financial report exists, create if not
+    daily_report = session.exec(
+        select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
+            DailyFinancialReport.parent == report_date,
+        )
+    ).one_or_none()
+
+    if daily_report is None:
+        daily_report = DailyFinancialReport(
+            schoolId=school_id,
+            parent=report_date,
+            reportStatus=ReportStatus.DRAFT,
+            preparedBy=user_id,
+            notedBy=monthly_report.notedBy,
+        )
+        session.add(daily_report)
+
+    elif daily_report.reportStatus != ReportStatus.DRAFT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot update entries in a submitted report.",
+        )
+
+    return monthly_report
+
+
 router = APIRouter(prefix="/daily")
 logged_in_dep = Annotated[DecodedJWTToken, Depends(verify_access_token)]
 
@@ -261,7 +342,8 @@ async def create_school_daily_report(
     # Check if daily report already exists
     existing_daily_report = session.exec(
         select(DailyFinancialReport).where(
-            DailyFinancialReport.parent == selected_monthly_report.id
+            DailyFinancialReport.schoolId == school_id,
+            DailyFinancialReport.parent == selected_monthly_report.id,
         )
     ).one_or_none()
 
@@ -275,6 +357,7 @@ async def create_school_daily_report(
     else:
         # Create new daily report
         new_daily_report = DailyFinancialReport(
+            schoolId=school_id,
             parent=selected_monthly_report.id,
             reportStatus=ReportStatus.DRAFT,
             preparedBy=user.id,
@@ -355,7 +438,8 @@ async def update_school_daily_report_entry_legacy(
 
     daily_report = session.exec(
         select(DailyFinancialReport).where(
-            DailyFinancialReport.parent == selected_monthly_report.id
+            DailyFinancialReport.schoolId == school_id,
+            DailyFinancialReport.parent == selected_monthly_report.id,
         )
     ).one_or_none()
     if daily_report is None:
@@ -366,12 +450,14 @@ async def update_school_daily_report_entry_legacy(
 
     entry = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent == daily_report.parent,
             DailyFinancialReportEntry.day == day,
         )
     ).one_or_none()
     if entry is None:
         entry = DailyFinancialReportEntry(
+            schoolId=school_id,
             parent=daily_report.parent,
             day=day,
             sales=sales,
@@ -436,7 +522,8 @@ async def delete_school_daily_report(
 
     daily_report = session.exec(
         select(DailyFinancialReport).where(
-            DailyFinancialReport.parent == selected_monthly_report.id
+            DailyFinancialReport.schoolId == school_id,
+            DailyFinancialReport.parent == selected_monthly_report.id,
         )
     ).one_or_none()
     if daily_report is None:
@@ -551,6 +638,7 @@ async def get_school_daily_financial_report_with_entries(
     )
     report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
             DailyFinancialReport.parent_report.submittedBySchool == school_id,
         )
@@ -602,6 +690,7 @@ async def create_school_daily_financial_report(
 
     report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
             DailyFinancialReport.parent_report.submittedBySchool == school_id,
         )
@@ -635,6 +724,7 @@ async def create_school_daily_financial_report(
     noted_by = await get_school_assigned_noted_by(school_id, session)
 
     report = DailyFinancialReport(
+        schoolId=school_id,
         parent=datetime.date(year=year, month=month, day=1),
         preparedBy=user.id,
         notedBy=noted_by,
@@ -741,6 +831,7 @@ async def create_daily_sales_and_purchases_entry(
     # Check if the daily financial report exists, create if not
     daily_report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
         )
     ).one_or_none()
@@ -750,6 +841,7 @@ async def create_daily_sales_and_purchases_entry(
         noted_by = await get_school_assigned_noted_by(school_id, session)
 
         daily_report = DailyFinancialReport(
+            schoolId=school_id,
             parent=datetime.date(year=year, month=month, day=1),
             reportStatus=ReportStatus.DRAFT,
             preparedBy=user.id,
@@ -760,6 +852,7 @@ async def create_daily_sales_and_purchases_entry(
     # Check if entry already exists for this day
     existing_entry = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
             DailyFinancialReportEntry.day == day,
@@ -774,6 +867,7 @@ async def create_daily_sales_and_purchases_entry(
 
     # Create new entry
     new_entry = DailyFinancialReportEntry(
+        schoolId=school_id,
         parent=datetime.date(year=year, month=month, day=1),
         day=day,
         sales=sales,
@@ -872,6 +966,7 @@ async def update_daily_sales_and_purchases_entry(
     # Verify the daily financial report exists
     daily_report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
         )
     ).one_or_none()
@@ -892,6 +987,7 @@ async def update_daily_sales_and_purchases_entry(
     # Find the existing entry
     entry = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
             DailyFinancialReportEntry.day == day,
@@ -986,6 +1082,7 @@ async def delete_daily_sales_and_purchases_entry(
     # Verify the daily financial report exists
     daily_report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
         )
     ).one_or_none()
@@ -1006,6 +1103,7 @@ async def delete_daily_sales_and_purchases_entry(
     # Find the existing entry
     entry = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
             DailyFinancialReportEntry.day == day,
@@ -1105,6 +1203,7 @@ async def create_bulk_daily_sales_and_purchases_entries(
     # Check if the daily financial report exists, create if not
     daily_report = session.exec(
         select(DailyFinancialReport).where(
+            DailyFinancialReport.schoolId == school_id,
             DailyFinancialReport.parent == datetime.date(year=year, month=month, day=1),
         )
     ).one_or_none()
@@ -1114,6 +1213,7 @@ async def create_bulk_daily_sales_and_purchases_entries(
         noted_by = await get_school_assigned_noted_by(school_id, session)
 
         daily_report = DailyFinancialReport(
+            schoolId=school_id,
             parent=datetime.date(year=year, month=month, day=1),
             reportStatus=ReportStatus.DRAFT,
             preparedBy=user.id,
@@ -1124,6 +1224,7 @@ async def create_bulk_daily_sales_and_purchases_entries(
     # Check for existing entries
     existing_days = session.exec(
         select(DailyFinancialReportEntry.day).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
         )
@@ -1141,6 +1242,7 @@ async def create_bulk_daily_sales_and_purchases_entries(
             )
 
         new_entry = DailyFinancialReportEntry(
+            schoolId=school_id,
             parent=datetime.date(year=year, month=month, day=1),
             day=day,
             sales=entry_data.sales,
@@ -1158,6 +1260,232 @@ async def create_bulk_daily_sales_and_purchases_entries(
     return created_entries
 
 
+@router.put("/{school_id}/{year}/{month}/entries")
+async def upsert_daily_sales_and_purchases_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    entries: list[DailyEntryData],
+) -> DailyEntriesUpsertResponse:
+    """Create or update many daily sales and purchases entries at once.
+
+    All entries are written with one statement. Days that already have an
+    entry are updated, and other days are created.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to write entries for.
+        year: The year of the report.
+        month: The month of the report.
+        entries: List of entries with 'day', 'sales', and 'purchases' fields.
+
+    Returns:
+        Whether each entry was created or updated, and the totals of the month.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to update daily report entries.",
+        )
+
+    if not entries:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No entries provided.",
+        )
+
+    days_in_month = calendar.monthrange(year, month)[1]
+    invalid_days = sorted({e.day for e in entries if e.day > days_in_month})
+    if invalid_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Days {invalid_days} are not in {year}-{month:02d}.",
+        )
+
+    if len({e.day for e in entries}) != len(entries):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each day can only be provided once.",
+        )
+
+    logger.debug(
+        "user `%s` upserting %s daily entries for school %s for %s-%s.",
+        token.id,
+        len(entries),
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    monthly_report = await _get_draft_daily_report(
+        session, user.id, school_id, report_date
+    )
+
+    existing_days = set(
+        session.exec(
+            select(DailyFinancialReportEntry.day).where(
+                DailyFinancialReportEntry.schoolId == school_id,
+                DailyFinancialReportEntry.parent == report_date,
+            )
+        ).all()
+    )
+
+    session.flush()  # Write the parent reports before their entries
+    upsert(
+        session,
+        DailyFinancialReportEntry.__table__,  # type: ignore
+        [
+            {
+                "schoolId": school_id,
+                "parent": report_date,
+                "day": e.day,
+                "sales": e.sales,
+                "purchases": e.purchases,
+            }
+            for e in entries
+        ],
+        update_columns=["sales", "purchases"],
+    )
+
+    # Compute the totals in the same transaction as the upsert
+    total = await get_monthly_total(session, school_id, year, month)
+    monthly_report.lastModified = datetime.datetime.now()
+    session.add(monthly_report)
+    session.commit()
+
+    return DailyEntriesUpsertResponse(
+        entries=[
+            DailyEntryUpsertResult(
+                day=e.day,
+                sales=e.sales,
+                purchases=e.purchases,
+                status="updated" if e.day in existing_days else "created",
+            )
+            for e in sorted(entries, key=lambda e: e.day)
+        ],
+        total=total,
+    )
+
+
+@router.post("/{school_id}/{year}/{month}/entries/import")
+async def import_daily_sales_and_purchases_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    file: UploadFile = File(...),
+) -> ImportResult:
+    """Import daily sales and purchases entries from a CSV or XLSX file.
+
+    The first row of the file must have the `day`, `sales` and `purchases`
+    headers. The file is read and written in batches, days that already have
+    an entry are updated, and invalid rows are skipped and reported.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to import entries for.
+        year: The year of the report.
+        month: The month of the report.
+        file: The CSV or XLSX file to import.
+
+    Returns:
+        The number of imported and failed rows, and the errors of failed rows.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to import daily report entries.",
+        )
+
+    try:
+        spreadsheet_format = get_spreadsheet_format(file.filename, file.content_type)
+
+    except SpreadsheetFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        ) from e
+
+    logger.debug(
+        "user `%s` importing daily entries from `%s` for school %s for %s-%s.",
+        token.id,
+        file.filename,
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    monthly_report = await _get_draft_daily_report(
+        session, user.id, school_id, report_date
+    )
+    session.flush()  # Write the parent reports before their entries
+
+    days_in_month = calendar.monthrange(year, month)[1]
+
+    def to_row(entry: DailyEntryData) -> dict[str, Any]:
+        if entry.day > days_in_month:
+            raise ValueError(f"Day {entry.day} is not in {year}-{month:02d}.")
+
+        return {
+            "schoolId": school_id,
+            "parent": report_date,
+            "day": entry.day,
+            "sales": entry.sales,
+            "purchases": entry.purchases,
+        }
+
+    try:
+        result = await asyncio.to_thread(
+            import_records,
+            session,
+            iter_spreadsheet_records(file.file, spreadsheet_format),
+            DailyEntryData,
+            to_row,
+            DailyFinancialReportEntry.__table__,  # type: ignore
+            ["sales", "purchases"],
+        )
+
+    except SpreadsheetFormatError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    monthly_report.lastModified = datetime.datetime.now()
+    session.add(monthly_report)
+    session.commit()
+
+    return result
+
+
 @router.get("/{school_id}/{year}/{month}/summary")
 async def get_daily_sales_and_purchases_summary(
     token: logged_in_dep,
@@ -1229,6 +1557,7 @@ async def get_daily_sales_and_purchases_summary(
     # Get all entries for the month
     entries = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
         )
@@ -1457,6 +1786,7 @@ async def get_daily_sales_and_purchases_summary_filtered(
     # Get all entries for the month (since the monthly report passed the filter)
     entries = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
         )
@@ -1605,6 +1935,7 @@ async def get_daily_sales_and_purchases_entry(
     # Find the entry for the specific day
     entry = session.exec(
         select(DailyFinancialReportEntry).where(
+            DailyFinancialReportEntry.schoolId == school_id,
             DailyFinancialReportEntry.parent
             == datetime.date(year=year, month=month, day=1),
             DailyFinancialReportEntry.day == day,
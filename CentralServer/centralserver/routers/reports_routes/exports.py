@@ -0,0 +1,253 @@
+import datetime
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from centralserver.internals.auth_handler import (
+    get_user,
+    verify_access_token,
+    verify_user_permission,
+)
+from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.export_handler import (
+    get_cached_export,
+    get_export_cache_name,
+    get_export_columns,
+    get_export_periods,
+    iter_export_rows,
+    stream_and_cache_export,
+)
+from centralserver.internals.logger import LoggerFactory
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.payroll_report import (
+    PayrollReport,
+    PayrollReportEntry,
+)
+from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.spreadsheet_handler import (
+    SPREADSHEET_CONTENT_TYPES,
+    SpreadsheetFormat,
+    iter_spreadsheet_chunks,
+)
+from centralserver.routers.reports_routes.liquidation import LIQUIDATION_CATEGORIES
+
+logger = LoggerFactory().get_logger(__name__)
+
+router = APIRouter(prefix="/exports")
+logged_in_dep = Annotated[DecodedJWTToken, Depends(verify_access_token)]
+format_query = Annotated[SpreadsheetFormat, Query(alias="format")]
+
+# The report and entry models of each type of report that can be exported
+EXPORT_REPORT_TYPES: dict[str, tuple[Any, Any]] = {
+    "daily": (DailyFinancialReport, DailyFinancialReportEntry),
+    "payroll": (PayrollReport, PayrollReportEntry),
+    **{
+        category: (config["model"], config["entry_model"])
+        for category, config in LIQUIDATION_CATEGORIES.items()
+    },
+}
+
+
+async def _export_report(
+    token: DecodedJWTToken,
+    session: Session,
+    report_type: str,
+    school_id: int | None,
+    start: datetime.date,
+    end: datetime.date,
+    spreadsheet_format: SpreadsheetFormat,
+) -> Response:
+    """Export the entries of a type of report over a range of months.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        report_type: `daily`, `payroll`, or a liquidation report category.
+        school_id: The school to export, or None to export all schools.
+        start: A day in the first month to export.
+        end: A day in the last month to export.
+        spreadsheet_format: The format of the export.
+
+    Returns:
+        The export, streamed from the database or from its cached copy.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:read"
+        if school_id is not None and user.schoolId == school_id
+        else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to export these reports.",
+        )
+
+    if report_type not in EXPORT_REPORT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid report type. Must be one of: {', '.join(EXPORT_REPORT_TYPES)}",
+        )
+
+    start, end = start.replace(day=1), end.replace(day=1)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The start of the range must not be after its end.",
+        )
+
+    logger.debug(
+        "user `%s` exporting %s reports of school %s from %s to %s as %s.",
+        token.id,
+        report_type,
+        school_id if school_id is not None else "(all)",
+        start,
+        end,
+        spreadsheet_format,
+    )
+
+    report_model, entry_model = EXPORT_REPORT_TYPES[report_type]
+    filename = (
+        f"{report_type}_{school_id if school_id is not None else 'all'}_"
+        f"{start:%Y-%m}_{end:%Y-%m}.{spreadsheet_format}"
+    )
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    media_type = SPREADSHEET_CONTENT_TYPES[spreadsheet_format]
+
+    cache_name = get_export_cache_name(
+        f"{report_type}:{school_id}:{start}:{end}",
+        spreadsheet_format,
+        get_export_periods(session, report_model, school_id, start, end),
+    )
+    if cache_name is not None:
+        cached = await get_cached_export(cache_name)
+        if cached is not None:
+            logger.debug("Serving cached report export `%s`.", cache_name)
+            return Response(content=cached, media_type=media_type, headers=headers)
+
+    columns = get_export_columns(entry_model)
+    chunks = iter_spreadsheet_chunks(
+        ["school", "month", *columns],
+        iter_export_rows(entry_model, list(columns.values()), school_id, start, end),
+        spreadsheet_format,
+    )
+    return StreamingResponse(
+        stream_and_cache_export(chunks, cache_name),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+@router.get("/{report_type}")
+async def export_reports(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    report_type: str,
+    start: datetime.date,
+    end: datetime.date,
+    school_id: int | None = None,
+    spreadsheet_format: format_query = "csv",
+) -> Response:
+    """Export the entries of a type of report over a range of months.
+
+    Leave out the school to export the reports of every school in the division.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        report_type: `daily`, `payroll`, or a liquidation report category.
+        start: A day in the first month to export.
+        end: A day in the last month to export.
+        school_id: The school to export, or None to export all schools.
+        spreadsheet_format: The format of the export (`csv` or `xlsx`).
+
+    Returns:
+        A CSV or XLSX file with one row per entry.
+    """
+
+    return await _export_report(
+        token, session, report_type, school_id, start, end, spreadsheet_format
+    )
+
+
+@router.get("/{report_type}/{school_id}/{year}")
+async def export_school_year_reports(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    report_type: str,
+    school_id: int,
+    year: int,
+    spreadsheet_format: format_query = "csv",
+) -> Response:
+    """Export the entries of a type of report of a school for a whole year.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        report_type: `daily`, `payroll`, or a liquidation report category.
+        school_id: The school to export.
+        year: The year to export.
+        spreadsheet_format: The format of the export (`csv` or `xlsx`).
+
+    Returns:
+        A CSV or XLSX file with one row per entry.
+    """
+
+    return await _export_report(
+        token,
+        session,
+        report_type,
+        school_id,
+        datetime.date(year=year, month=1, day=1),
+        datetime.date(year=year, month=12, day=1),
+        spreadsheet_format,
+    )
+
+
+@router.get("/{report_type}/{school_id}/{year}/{month}")
+async def export_school_month_reports(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    report_type: str,
+    school_id: int,
+    year: int,
+    month: int,
+    spreadsheet_format: format_query = "csv",
+) -> Response:
+    """Export the entries of a type of report of a school for a month.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        report_type: `daily`, `payroll`, or a liquidation report category.
+        school_id: The school to export.
+        year: The year of the report.
+        month: The month of the report.
+        spreadsheet_format: The format of the export (`csv` or `xlsx`).
+
+    Returns:
+        A CSV or XLSX file with one row per entry.
+    """
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    return await _export_report(
+        token,
+        session,
+        report_type,
+        school_id,
+        report_date,
+        report_date,
+        spreadsheet_format,
+    )
@@ -1,9 +1,25 @@
 # pylint: disable=C0302
+import asyncio
 import datetime
-from typing import Annotated, Any, Dict, Union
+from dataclasses import dataclass
+from functools import partial
+from itertools import batched
+from operator import attrgetter
+from typing import Annotated, Any, Callable, Dict, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from pydantic import BaseModel, Field
+from sqlalchemy import (
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, select
 
@@ -13,6 +29,8 @@ from centralserver.internals.auth_handler import (
     verify_user_permission,
 )
 from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.exceptions import SpreadsheetFormatError
+from centralserver.internals.import_handler import import_records
 from centralserver.internals.logger import LoggerFactory
 from centralserver.internals.models.reports.lr_administrative_expenses import (
     AdministrativeExpenseEntry,
@@ -58,6 +76,7 @@ from centralserver.internals.models.reports.monthly_report import (
     MonthlyReport,
     ReportStatus,
 )
+from centralserver.internals.models.reports.report_import import ImportResult
 from centralserver.internals.models.reports.report_status_manager import (
     ReportStatusManager,
 )
@@ -66,6 +85,10 @@ from centralserver.internals.models.reports.status_change_request import (
 )
 from centralserver.internals.models.school import School
 from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.spreadsheet_handler import (
+    get_spreadsheet_format,
+    iter_spreadsheet_records,
+)
 
 logger = LoggerFactory().get_logger(__name__)
 
@@ -81,6 +104,9 @@ async def get_school_assigned_noted_by(school_id: int, session: Session) -> str
 router = APIRouter(prefix="/liquidation")
 logged_in_dep = Annotated[DecodedJWTToken, Depends(verify_access_token)]
 
+# Number of entries written per statement when entries are changed
+ENTRY_WRITE_BATCH_SIZE = 500
+
 # Category mapping
 LIQUIDATION_CATEGORIES: Dict[str, Dict[str, Any]] = {
     "operating_expenses": {
@@ -178,6 +204,46 @@ class LiquidationReportCreateRequest(BaseModel):
     certifiedBy: list[str] = []
 
 
+class LiquidationReportEntryKey(BaseModel):
+    """The date and particulars that identify a liquidation report entry."""
+
+    date: datetime.datetime
+    particulars: str
+
+
+class LiquidationReportEntriesPatchRequest(BaseModel):
+    """Request model for changing some liquidation report entries."""
+
+    entries: list[LiquidationReportEntryData] = []  # Entries to add or update
+    deleted: list[LiquidationReportEntryKey] = []  # Entries to delete
+
+
+class LiquidationReportEntriesChanges(BaseModel):
+    """The number of entries written by a change of liquidation report entries."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+class LiquidationCategorySummary(BaseModel):
+    """The totals of a liquidation report category for a month."""
+
+    category: str
+    name: str
+    reportStatus: str | None = None  # None if the report does not exist
+    entries: int = 0
+    totalAmount: float = 0.0
+
+
+class LiquidationReportSummaryResponse(BaseModel):
+    """Response model for the totals of all liquidation reports of a month."""
+
+    parent: datetime.date
+    categories: list[LiquidationCategorySummary] = []
+    totalAmount: float = 0.0
+
+
 class LiquidationReportResponse(BaseModel):
     """Response model for liquidation reports."""
 
@@ -203,40 +269,262 @@ def _validate_category(category: str) -> dict[str, Any]:
     return LIQUIDATION_CATEGORIES[category]
 
 
-def _get_field_value(obj: Any, *field_names: str, default: Any = None) -> Any:
-    """Get field value from object, trying multiple field name variations."""
-    for field_name in field_names:
-        if hasattr(obj, field_name):
-            return getattr(obj, field_name)
-    return default
+@dataclass(frozen=True, slots=True)
+class _EntryMapping:
+    """The mapping between entry data and the columns of a category's entries.
+
+    The column names differ between categories (e.g. `receipt` and
+    `receiptNumber`), so they are looked up once, when the module is loaded.
+    """
+
+    price: str  # `amount`, `unitPrice` or `unit_price`
+    certified_by: str  # `certified_by` or `audited_by`
+    to_data: Callable[[Any], LiquidationReportEntryData]
+    to_row: Callable[[int, datetime.date, LiquidationReportEntryData], dict[str, Any]]
+
 
+def _compile_entry_mapping(model: Any, entry_model: Any) -> _EntryMapping:
+    """Build the functions that convert a category's entries to and from data."""
+    columns = entry_model.__table__.columns
+    price = next(
+        name for name in ("amount", "unitPrice", "unit_price") if name in columns
+    )
+    receipt = next(
+        (name for name in ("receiptNumber", "receipt") if name in columns), None
+    )
+
+    # The entry data fields of the category's columns, except the price
+    fields = {
+        column: field
+        for field, column in (
+            ("receiptNumber", receipt),
+            ("quantity", "quantity"),
+            ("unit", "unit"),
+            ("receipt_attachment_urns", "receipt_attachment_urns"),
+        )
+        if column is not None and column in columns
+    }
+    data_fields = (
+        "date",
+        "particulars",
+        "amount" if price == "amount" else "unitPrice",
+        *fields.values(),
+    )
+    get_values = attrgetter("date", "particulars", price, *fields)
+    construct = LiquidationReportEntryData.model_construct
+
+    def to_data(entry: Any) -> LiquidationReportEntryData:
+        # The values are read from the database, so they are not validated again.
+        return construct(**dict(zip(data_fields, get_values(entry))))
+
+    # Entries without a price of their own use the other one.
+    get_prices = attrgetter(
+        *(("amount", "unitPrice") if price == "amount" else ("unitPrice", "amount"))
+    )
+    row_columns = ("date", "particulars", *fields)
+    get_data = attrgetter("date", "particulars", *fields.values())
+    absent = dict.fromkeys(
+        column.name
+        for column in columns
+        if column.name
+        not in {"schoolId", "parent", "date", "particulars", price, *fields}
+    )
+
+    def to_row(
+        school_id: int,
+        parent_date: datetime.date,
+        entry_data: LiquidationReportEntryData,
+    ) -> dict[str, Any]:
+        first_price, second_price = get_prices(entry_data)
+        return {
+            "schoolId": school_id,
+            "parent": parent_date,
+            **dict(zip(row_columns, get_data(entry_data))),
+            price: first_price or second_price or 0.0,
+            **absent,
+        }
+
+    return _EntryMapping(
+        price=price,
+        certified_by="certified_by" if hasattr(model, "certified_by") else "audited_by",
+        to_data=to_data,
+        to_row=to_row,
+    )
 
-def _calculate_total_amount(entries: list[Any], has_qty_unit: bool) -> float:
+
+# The entry mapping of each category, keyed by its entry model
+ENTRY_MAPPINGS: dict[Any, _EntryMapping] = {
+    config["entry_model"]: _compile_entry_mapping(
+        config["model"], config["entry_model"]
+    )
+    for config in LIQUIDATION_CATEGORIES.values()
+}
+
+
+def _calculate_total_amount(
+    entries: list[LiquidationReportEntryData], has_qty_unit: bool
+) -> float:
     """Calculate total amount from entries."""
     total = 0.0
     for entry in entries:
-        if has_qty_unit and hasattr(entry, "quantity") and entry.quantity:
+        if has_qty_unit and entry.quantity:
             # For entries with quantity and unit price
-            unit_price = getattr(entry, "unitPrice", 0.0) or getattr(
-                entry, "amount", 0.0
-            )
-            total += entry.quantity * unit_price
+            total += entry.quantity * (entry.unitPrice or entry.amount or 0.0)
         else:
             # For entries with direct amount or unit price
-            amount = getattr(entry, "amount", None) or getattr(entry, "unitPrice", 0.0)
-            total += amount
+            total += entry.amount or entry.unitPrice or 0.0
     return total
 
 
+def _get_entry_rows(
+    session: Session, entry_model: Any, school_id: int, parent_date: datetime.date
+) -> dict[tuple[Any, ...], dict[str, Any]]:
+    """Get the column values of a report's entries, keyed by date and particulars."""
+    table = entry_model.__table__
+    return {
+        (row["date"], row["particulars"]): dict(row)
+        for row in session.exec(
+            table.select().where(
+                table.c.schoolId == school_id, table.c.parent == parent_date
+            )
+        ).mappings()
+    }
+
+
+def _to_entry_rows(
+    entry_model: Any,
+    school_id: int,
+    parent_date: datetime.date,
+    entries: list[LiquidationReportEntryData],
+) -> dict[tuple[Any, ...], dict[str, Any]]:
+    """Convert entries to full rows of an entry model, keyed by date and particulars."""
+    to_row = ENTRY_MAPPINGS[entry_model].to_row
+    rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for entry_data in entries:
+        key = (entry_data.date, entry_data.particulars)
+        if key in rows:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Duplicate entry for {entry_data.particulars} on {entry_data.date}.",
+            )
+
+        rows[key] = to_row(school_id, parent_date, entry_data)
+
+    return rows
+
+
+def _write_entry_changes(
+    session: Session,
+    entry_model: Any,
+    school_id: int,
+    parent_date: datetime.date,
+    existing: dict[tuple[Any, ...], dict[str, Any]],
+    changed: dict[tuple[Any, ...], dict[str, Any]],
+    deleted: set[tuple[Any, ...]],
+) -> LiquidationReportEntriesChanges:
+    """Write only the entries that changed, in batches.
+
+    Args:
+        session: The database session.
+        entry_model: The entry model of the report's category.
+        school_id: The ID of the school of the report.
+        parent_date: The date of the report.
+        existing: The rows that are in the database.
+        changed: The rows to add or update. Rows that are unchanged are skipped.
+        deleted: The keys of the rows to delete.
+
+    Returns:
+        The number of inserted, updated and deleted entries.
+    """
+    table = entry_model.__table__
+    inserts = [row for key, row in changed.items() if key not in existing]
+    updates = [
+        row for key, row in changed.items() if key in existing and existing[key] != row
+    ]
+    deletes = [key for key in deleted if key in existing]
+
+    for batch in batched(deletes, ENTRY_WRITE_BATCH_SIZE):
+        _ = session.exec(
+            delete(table).where(
+                table.c.schoolId == school_id,
+                table.c.parent == parent_date,
+                tuple_(table.c.date, table.c.particulars).in_(batch),
+            )
+        )
+    for batch in batched(inserts, ENTRY_WRITE_BATCH_SIZE):
+        _ = session.exec(insert(table).values(batch))
+    for batch in batched(updates, ENTRY_WRITE_BATCH_SIZE):
+        # Bulk update by primary key, sent as one executemany per batch
+        _ = session.exec(update(entry_model), params=list(batch))
+
+    return LiquidationReportEntriesChanges(
+        inserted=len(inserts), updated=len(updates), deleted=len(deletes)
+    )
+
+
+def _total_amount_expression(entry_model: Any, has_qty_unit: bool) -> Any:
+    """Get the SQL expression of an entry's amount, like `_calculate_total_amount`."""
+    columns = entry_model.__table__.columns
+    price = columns[ENTRY_MAPPINGS[entry_model].price]
+    if not has_qty_unit or "quantity" not in columns:
+        return price
+
+    quantity = columns["quantity"]
+    return case(
+        (and_(quantity.is_not(None), quantity != 0), quantity * price),
+        else_=price,
+    )
+
+
+def _summary_query(school_id: int, parent_date: datetime.date) -> Any:
+    """Get the entry count and total amount of every category in one query."""
+    return union_all(
+        *(
+            select(
+                literal(category).label("category"),
+                config["model"].reportStatus.label("reportStatus"),
+                func.count(config["entry_model"].parent).label("entries"),
+                func.coalesce(
+                    func.sum(
+                        _total_amount_expression(
+                            config["entry_model"], config["has_qty_unit"]
+                        )
+                    ),
+                    0.0,
+                ).label("totalAmount"),
+            )
+            .select_from(config["model"])
+            .outerjoin(
+                config["entry_model"],
+                and_(
+                    config["entry_model"].schoolId == config["model"].schoolId,
+                    config["entry_model"].parent == config["model"].parent,
+                ),
+            )
+            .where(
+                config["model"].schoolId == school_id,
+                config["model"].parent == parent_date,
+            )
+            .group_by(config["model"].parent, config["model"].reportStatus)
+            for category, config in LIQUIDATION_CATEGORIES.items()
+        )
+    )
+
+
 def _get_liquidation_report(
-    session: Session, category_config: dict[str, Any], parent_date: datetime.date
+    session: Session,
+    category_config: dict[str, Any],
+    school_id: int,
+    parent_date: datetime.date,
 ) -> Any:
     """Get liquidation report by category and parent date."""
     model = category_config["model"]
-    return session.exec(select(model).where(model.parent == parent_date)).one_or_none()
+    return session.exec(
+        select(model).where(model.schoolId == school_id, model.parent == parent_date)
+    ).one_or_none()
 
 
-def _convert_to_response(
+def convert_to_response(
     report: Any, category: str, category_config: dict[str, Any]
 ) -> LiquidationReportResponse:
     """Convert database model to response model."""
@@ -251,67 +539,108 @@ def _convert_to_response(
             totalAmount=0.0,
         )
 
-    # Convert entries
-    entries: list[LiquidationReportEntryData] = []
-    for entry in report.entries:
-        entry_data = LiquidationReportEntryData(
-            date=entry.date,
-            particulars=entry.particulars,
-        )
+    mapping = ENTRY_MAPPINGS[category_config["entry_model"]]
+    entries = [mapping.to_data(entry) for entry in report.entries]
+    certified_by = [cert.user for cert in getattr(report, mapping.certified_by)]
 
-        # Set amount or unitPrice based on the entry type
-        if hasattr(entry, "amount"):
-            entry_data.amount = entry.amount
-        else:
-            entry_data.unitPrice = _get_field_value(
-                entry, "unitPrice", "unit_price", default=0.0
-            )
+    return LiquidationReportResponse(
+        category=category,
+        parent=report.parent,
+        reportStatus=report.reportStatus,
+        notedBy=report.notedBy,
+        preparedBy=report.preparedBy,
+        teacherInCharge=report.teacherInCharge,
+        memo=report.memo,
+        entries=entries,
+        certifiedBy=certified_by,
+        totalAmount=_calculate_total_amount(entries, category_config["has_qty_unit"]),
+    )
 
-        # Add receipt number if applicable
-        receipt_num = _get_field_value(entry, "receiptNumber", "receipt")
-        if receipt_num:
-            entry_data.receiptNumber = receipt_num
 
-        # Add quantity and unit if applicable
-        quantity = _get_field_value(entry, "quantity")
-        if quantity is not None:
-            entry_data.quantity = quantity
+@router.get("/{school_id}/{year}/{month}/summary")
+async def get_liquidation_reports_summary(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+) -> LiquidationReportSummaryResponse:
+    """Get the entry count and total amount of every liquidation report of a month.
 
-        unit = _get_field_value(entry, "unit")
-        if unit is not None:
-            entry_data.unit = unit
+    The totals are computed by the database in one query, without loading
+    the entries of any report.
 
-        # Add receipt attachment URNs if available
-        receipt_attachment_urns = _get_field_value(entry, "receipt_attachment_urns")
-        if receipt_attachment_urns is not None:
-            entry_data.receipt_attachment_urns = receipt_attachment_urns
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to get the reports for.
+        year: The year of the reports.
+        month: The month of the reports.
 
-        entries.append(entry_data)
+    Returns:
+        The totals of each category, and the total of all categories.
+    """
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
 
-    # Get certified by users
-    certified_by: list[str] = []
-    certified_by_attr = _get_field_value(report, "certified_by", "audited_by")
-    if certified_by_attr:
-        certified_by = [cert.user for cert in certified_by_attr]
+    required_permission = (
+        "reports:local:read" if user.schoolId == school_id else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view liquidation reports.",
+        )
 
-    # Get report signatories
-    noted_by = _get_field_value(report, "notedBy", "notedby")
-    prepared_by = _get_field_value(report, "preparedBy", "preparedby")
-    teacher_in_charge = _get_field_value(report, "teacherInCharge")
-    report_status = _get_field_value(report, "reportStatus")
-    memo = _get_field_value(report, "memo")
+    logger.debug(
+        "user `%s` requesting liquidation reports summary of school %s for %s-%s.",
+        token.id,
+        school_id,
+        year,
+        month,
+    )
 
-    return LiquidationReportResponse(
-        category=category,
-        parent=report.parent,
-        reportStatus=report_status,
-        notedBy=noted_by,
-        preparedBy=prepared_by,
-        teacherInCharge=teacher_in_charge,
-        memo=memo,
-        entries=entries,
-        certifiedBy=certified_by,
-        totalAmount=_calculate_total_amount(entries, category_config["has_qty_unit"]),
+    parent_date = datetime.date(year=year, month=month, day=1)
+    selected_monthly_report = session.exec(
+        select(MonthlyReport).where(
+            MonthlyReport.id == parent_date,
+            MonthlyReport.submittedBySchool == school_id,
+        )
+    ).one_or_none()
+
+    if selected_monthly_report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Monthly report not found.",
+        )
+
+    totals = {
+        row.category: row
+        for row in session.exec(_summary_query(school_id, parent_date))
+    }
+    categories = [
+        LiquidationCategorySummary(
+            category=category,
+            name=config["name"],
+            reportStatus=(
+                totals[category].reportStatus.value
+                if category in totals and totals[category].reportStatus
+                else None
+            ),
+            entries=totals[category].entries if category in totals else 0,
+            totalAmount=totals[category].totalAmount if category in totals else 0.0,
+        )
+        for category, config in LIQUIDATION_CATEGORIES.items()
+    ]
+
+    return LiquidationReportSummaryResponse(
+        parent=parent_date,
+        categories=categories,
+        totalAmount=sum(summary.totalAmount for summary in categories),
     )
 
 
@@ -373,8 +702,10 @@ async def get_liquidation_report(
             )
         ).one()
 
-        report = _get_liquidation_report(session, category_config, parent_date)
-        return _convert_to_response(report, category, category_config)
+        report = _get_liquidation_report(
+            session, category_config, school_id, parent_date
+        )
+        return convert_to_response(report, category, category_config)
 
     except NoResultFound as e:
         logger.warning(
@@ -448,11 +779,13 @@ async def get_liquidation_report_entries(
             )
         ).one()
 
-        report = _get_liquidation_report(session, category_config, parent_date)
+        report = _get_liquidation_report(
+            session, category_config, school_id, parent_date
+        )
         if not report:
             return []
 
-        response = _convert_to_response(report, category, category_config)
+        response = convert_to_response(report, category, category_config)
         return response.entries
 
     except NoResultFound as e:
@@ -542,6 +875,7 @@ async def create_or_update_liquidation_report(
     # Create liquidation report data
     model = category_config["model"]
     report_data: Dict[str, Any] = {
+        "schoolId": school_id,
         "parent": parent_date,
         "preparedBy": request_data.preparedBy or user.id,
         "notedBy": noted_by,
@@ -550,7 +884,9 @@ async def create_or_update_liquidation_report(
     }
 
     # Delete existing report if it exists
-    existing_report = _get_liquidation_report(session, category_config, parent_date)
+    existing_report = _get_liquidation_report(
+        session, category_config, school_id, parent_date
+    )
     if existing_report:
         session.delete(existing_report)
 
@@ -561,82 +897,24 @@ async def create_or_update_liquidation_report(
 
     # Add entries
     entry_model = category_config["entry_model"]
+    to_row = ENTRY_MAPPINGS[entry_model].to_row
     for entry_data in request_data.entries:
-        entry_dict: Dict[str, Any] = {
-            "parent": parent_date,
-            "date": entry_data.date,
-            "particulars": entry_data.particulars,
-        }
-
-        # Add receipt attachment URNs if available
-        if (
-            hasattr(entry_data, "receipt_attachment_urns")
-            and entry_data.receipt_attachment_urns
-        ):
-            entry_dict["receipt_attachment_urns"] = entry_data.receipt_attachment_urns
-
-        # Handle receipt number field variations based on model type
-        if entry_data.receiptNumber:
-            entry_model_name = (
-                entry_model.__name__
-                if hasattr(entry_model, "__name__")
-                else str(entry_model)
-            )
-            if (
-                "OperatingExpense" in entry_model_name
-                or "AdministrativeExpense" in entry_model_name
-            ):
-                # These don't have receipt fields
-                pass
-            elif "ClinicFund" in entry_model_name:
-                entry_dict["receiptNumber"] = entry_data.receiptNumber
-            else:
-                entry_dict["receipt"] = entry_data.receiptNumber
-
-        # Handle quantity and unit
-        if entry_data.quantity is not None:
-            entry_dict["quantity"] = entry_data.quantity
-        if entry_data.unit is not None:
-            entry_dict["unit"] = entry_data.unit
-
-        # Handle unit price field variations based on model type
-        entry_model_name = (
-            entry_model.__name__
-            if hasattr(entry_model, "__name__")
-            else str(entry_model)
-        )
-
-        # Handle amount vs unitPrice based on model type
-        if (
-            "SupplementaryFeedingFund" in entry_model_name
-            or "ClinicFund" in entry_model_name
-        ):
-            # Use amount field for supplementary feeding fund and clinic fund
-            amount_value = entry_data.amount or entry_data.unitPrice or 0.0
-            entry_dict["amount"] = amount_value
-        elif (
-            "OperatingExpense" in entry_model_name
-            or "AdministrativeExpense" in entry_model_name
-            or "HEFund" in entry_model_name
-        ):
-            entry_dict["unit_price"] = entry_data.unitPrice or entry_data.amount or 0.0
-        else:
-            entry_dict["unitPrice"] = entry_data.unitPrice or entry_data.amount or 0.0
-
-        entry = entry_model(**entry_dict)
+        entry = entry_model(**to_row(school_id, parent_date, entry_data))
         session.add(entry)
 
     # Add certified by entries
     certified_model = category_config["certified_model"]
     for user_id in request_data.certifiedBy:
-        certified_entry = certified_model(parent=parent_date, user=user_id)
+        certified_entry = certified_model(
+            schoolId=school_id, parent=parent_date, user=user_id
+        )
         session.add(certified_entry)
 
     session.commit()
     session.refresh(new_report)
     session.refresh(selected_monthly_report)
 
-    return _convert_to_response(new_report, category, category_config)
+    return convert_to_response(new_report, category, category_config)
 
 
 @router.put("/{school_id}/{year}/{month}/{category}/entries")
@@ -707,84 +985,264 @@ async def update_liquidation_report_entries(
         )
 
     # Verify liquidation report exists
-    report = _get_liquidation_report(session, category_config, parent_date)
+    report = _get_liquidation_report(session, category_config, school_id, parent_date)
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Liquidation report not found.",
         )
 
-    # Delete existing entries
+    # Only write the entries that were added, changed or removed
     entry_model = category_config["entry_model"]
-    existing_entries = session.exec(
-        select(entry_model).where(entry_model.parent == parent_date)
-    ).all()
-    for entry in existing_entries:
-        session.delete(entry)
+    existing = _get_entry_rows(session, entry_model, school_id, parent_date)
+    submitted = _to_entry_rows(entry_model, school_id, parent_date, entries)
+    changes = _write_entry_changes(
+        session,
+        entry_model,
+        school_id,
+        parent_date,
+        existing,
+        submitted,
+        set(existing) - set(submitted),
+    )
+    session.commit()
 
-    # Add new entries
-    for entry_data in entries:
-        entry_dict: Dict[str, Any] = {
-            "parent": parent_date,
-            "date": entry_data.date,
-            "particulars": entry_data.particulars,
-        }
+    logger.debug(
+        "liquidation report entries (%s) of school %s for %s-%s: %s",
+        category,
+        school_id,
+        year,
+        month,
+        changes,
+    )
 
-        # Handle receipt number field variations based on model type
-        if entry_data.receiptNumber:
-            entry_model_name = (
-                entry_model.__name__
-                if hasattr(entry_model, "__name__")
-                else str(entry_model)
-            )
-            if (
-                "OperatingExpense" in entry_model_name
-                or "AdministrativeExpense" in entry_model_name
-            ):
-                # These don't have receipt fields
-                pass
-            elif "ClinicFund" in entry_model_name:
-                entry_dict["receiptNumber"] = entry_data.receiptNumber
-            else:
-                entry_dict["receipt"] = entry_data.receiptNumber
-
-        # Handle quantity and unit
-        if entry_data.quantity is not None:
-            entry_dict["quantity"] = entry_data.quantity
-        if entry_data.unit is not None:
-            entry_dict["unit"] = entry_data.unit
-
-        # Handle unit price field variations based on model type
-        entry_model_name = (
-            entry_model.__name__
-            if hasattr(entry_model, "__name__")
-            else str(entry_model)
+    # Return updated entries
+    return entries
+
+
+@router.patch("/{school_id}/{year}/{month}/{category}/entries")
+async def patch_liquidation_report_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    category: str,
+    changes: LiquidationReportEntriesPatchRequest,
+) -> LiquidationReportEntriesChanges:
+    """Add, update or delete some liquidation report entries.
+
+    Unlike replacing all entries, only the entries in the request are
+    written. Entries are identified by their date and particulars.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to update entries for.
+        year: The year of the report.
+        month: The month of the report.
+        category: The liquidation report category.
+        changes: The entries to add or update, and the entries to delete.
+
+    Returns:
+        The number of inserted, updated and deleted entries.
+    """
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
         )
 
-        # Handle amount vs unitPrice based on model type
-        if (
-            "SupplementaryFeedingFund" in entry_model_name
-            or "ClinicFund" in entry_model_name
-        ):
-            # Use amount field for supplementary feeding fund and clinic fund
-            amount_value = entry_data.amount or entry_data.unitPrice or 0.0
-            entry_dict["amount"] = amount_value
-        elif (
-            "OperatingExpense" in entry_model_name
-            or "AdministrativeExpense" in entry_model_name
-            or "HEFund" in entry_model_name
-        ):
-            entry_dict["unit_price"] = entry_data.unitPrice or entry_data.amount or 0.0
-        else:
-            entry_dict["unitPrice"] = entry_data.unitPrice or entry_data.amount or 0.0
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to update liquidation report entries.",
+        )
 
-        entry = entry_model(**entry_dict)
-        session.add(entry)
+    category_config = _validate_category(category)
+
+    logger.debug(
+        "user `%s` patching liquidation report entries (%s) of school %s for %s-%s.",
+        token.id,
+        category,
+        school_id,
+        year,
+        month,
+    )
+
+    parent_date = datetime.date(year=year, month=month, day=1)
+
+    # Verify monthly report exists
+    selected_monthly_report = session.exec(
+        select(MonthlyReport).where(
+            MonthlyReport.id == parent_date,
+            MonthlyReport.submittedBySchool == school_id,
+        )
+    ).one_or_none()
+
+    if selected_monthly_report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Monthly report not found.",
+        )
+
+    # Verify liquidation report exists
+    report = _get_liquidation_report(session, category_config, school_id, parent_date)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Liquidation report not found.",
+        )
 
+    entry_model = category_config["entry_model"]
+    changed = _to_entry_rows(entry_model, school_id, parent_date, changes.entries)
+    deleted = {(key.date, key.particulars) for key in changes.deleted}
+    if deleted & set(changed):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="An entry cannot be both updated and deleted.",
+        )
+
+    result = _write_entry_changes(
+        session,
+        entry_model,
+        school_id,
+        parent_date,
+        _get_entry_rows(session, entry_model, school_id, parent_date),
+        changed,
+        deleted,
+    )
     session.commit()
 
-    # Return updated entries
-    return entries
+    return result
+
+
+@router.post("/{school_id}/{year}/{month}/{category}/entries/import")
+async def import_liquidation_report_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    category: str,
+    file: UploadFile = File(...),
+) -> ImportResult:
+    """Import liquidation report entries from a CSV or XLSX file.
+
+    The first row of the file must have the headers of the entry fields
+    (e.g. `date`, `particulars`, `quantity`, `unit`, `unitPrice`). The file is
+    read and written in batches, entries with the same date and particulars
+    are updated, and invalid rows are skipped and reported.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to import entries for.
+        year: The year of the report.
+        month: The month of the report.
+        category: The liquidation report category.
+        file: The CSV or XLSX file to import.
+
+    Returns:
+        The number of imported and failed rows, and the errors of failed rows.
+    """
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to import liquidation report entries.",
+        )
+
+    category_config = _validate_category(category)
+
+    try:
+        spreadsheet_format = get_spreadsheet_format(file.filename, file.content_type)
+
+    except SpreadsheetFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        ) from e
+
+    logger.debug(
+        "user `%s` importing liquidation report entries (%s) from `%s` "
+        "of school %s for %s-%s.",
+        token.id,
+        category,
+        file.filename,
+        school_id,
+        year,
+        month,
+    )
+
+    parent_date = datetime.date(year=year, month=month, day=1)
+
+    # Verify monthly report exists
+    selected_monthly_report = session.exec(
+        select(MonthlyReport).where(
+            MonthlyReport.id == parent_date,
+            MonthlyReport.submittedBySchool == school_id,
+        )
+    ).one_or_none()
+
+    if selected_monthly_report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Monthly report not found.",
+        )
+
+    # Verify liquidation report exists
+    report = _get_liquidation_report(session, category_config, school_id, parent_date)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Liquidation report not found.",
+        )
+
+    if report.reportStatus != ReportStatus.DRAFT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot update entries in a submitted report.",
+        )
+
+    entry_model = category_config["entry_model"]
+    entry_table = entry_model.__table__
+    try:
+        result = await asyncio.to_thread(
+            import_records,
+            session,
+            iter_spreadsheet_records(file.file, spreadsheet_format),
+            LiquidationReportEntryData,
+            partial(ENTRY_MAPPINGS[entry_model].to_row, school_id, parent_date),
+            entry_table,
+            # Keep the attachments of entries that are imported again
+            [
+                column.name
+                for column in entry_table.columns
+                if not column.primary_key and column.name != "receipt_attachment_urns"
+            ],
+        )
+
+    except SpreadsheetFormatError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    session.commit()
+    return result
 
 
 @router.delete("/{school_id}/{year}/{month}/{category}")
@@ -850,7 +1308,7 @@ async def delete_liquidation_report(
         )
 
     # Delete liquidation report if it exists
-    report = _get_liquidation_report(session, category_config, parent_date)
+    report = _get_liquidation_report(session, category_config, school_id, parent_date)
     if report:
         session.delete(report)
         session.commit()
@@ -952,7 +1410,9 @@ async def change_liquidation_report_status(
     # Get the specific liquidation report
     parent_date = datetime.date(year=year, month=month, day=1)
     category_config = LIQUIDATION_CATEGORIES[category]
-    liquidation_report = _get_liquidation_report(session, category_config, parent_date)
+    liquidation_report = _get_liquidation_report(
+        session, category_config, school_id, parent_date
+    )
 
     if liquidation_report is None:
         raise HTTPException(
@@ -1028,7 +1488,9 @@ async def get_liquidation_valid_status_transitions(
     # Get the specific liquidation report
     parent_date = datetime.date(year=year, month=month, day=1)
     category_config = LIQUIDATION_CATEGORIES[category]
-    liquidation_report = _get_liquidation_report(session, category_config, parent_date)
+    liquidation_report = _get_liquidation_report(
+        session, category_config, school_id, parent_date
+    )
 
     if liquidation_report is None:
         raise HTTPException(
@@ -1,29 +1,47 @@
 # pylint: disable=C0302
+import asyncio
 import datetime
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from sqlalchemy import delete, update
 from sqlalchemy.exc import NoResultFound
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from centralserver.internals.auth_handler import (
     get_user,
     verify_access_token,
     verify_user_permission,
 )
-from centralserver.internals.db_handler import get_db_session
+from centralserver.internals.db_handler import get_db_session, upsert
+from centralserver.internals.exceptions import SpreadsheetFormatError
+from centralserver.internals.import_handler import import_records
 from centralserver.internals.logger import LoggerFactory
 from centralserver.internals.models.reports.monthly_report import (
     MonthlyReport,
     ReportStatus,
 )
 from centralserver.internals.models.reports.payroll_report import (
+    PayrollEntriesBulkResponse,
+    PayrollEntryBatchUpdateRequest,
+    PayrollEntryBulkResult,
     PayrollEntryRequest,
     PayrollEntryUpdateRequest,
+    PayrollMonthTotal,
     PayrollReport,
     PayrollReportEntry,
+    PayrollReportSummary,
     PayrollReportUpdateRequest,
 )
+from centralserver.internals.models.reports.report_import import ImportResult
 from centralserver.internals.models.reports.report_status_manager import (
     ReportStatusManager,
 )
@@ -32,6 +50,15 @@ from centralserver.internals.models.reports.status_change_request import (
 )
 from centralserver.internals.models.school import School
 from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.payroll_handler import (
+    PAYROLL_DAY_COLUMNS,
+    get_payroll_summary,
+    get_payroll_totals,
+)
+from centralserver.internals.spreadsheet_handler import (
+    get_spreadsheet_format,
+    iter_spreadsheet_records,
+)
 
 logger = LoggerFactory().get_logger(__name__)
 
@@ -44,10 +71,133 @@ async def get_school_assigned_noted_by(school_id: int, session: Session) -> str
     return None
 
 
+async def _get_draft_payroll_report(
+    session: Session, user_id: str, school_id: int, report_date: datetime.date
+) -> PayrollReport:
+    """Get a payroll report whose entries can be written.
+
+    The monthly and payroll reports are created if they do not exist yet.
+
+    Args:
+        session: The database session.
+        user_id: The ID of the user who writes the entries.
+        school_id: The ID of the school of the report.
+        report_date: The first day of the month of the report.
+
+    Returns:
+        The payroll report.
+
+    Raises:
+        HTTPException: If the payroll report is no longer a draft.
+    """
+
+    # Check if the monthly report exists, create if not
+    monthly_report = session.exec(
+        select(MonthlyReport).where(
+            MonthlyReport.id == report_date,
+            MonthlyReport.submittedBySchool == school_id,
+        )
+    ).one_or_none()
+
+    if monthly_report is None:
+        monthly_report = MonthlyReport(
+            id=report_date,
+            name=f"Monthly Report for {report_date.strftime('%B %Y')}",
+            submittedBySchool=school_id,
+            reportStatus=ReportStatus.DRAFT,
+            preparedBy=user_id,
+        )
+        session.add(monthly_report)
+
+    # Check if the payroll report exists, create if not
+    payroll_report = session.exec(
+        select(PayrollReport).where(
+            PayrollReport.schoolId == school_id, PayrollReport.parent == report_date
+        )
+    ).one_or_none()
+
+    if payroll_report is None:
+        payroll_report = PayrollReport(
+            schoolId=school_id,
+            parent=report_date,
+            preparedBy=user_id,
+            notedBy=await get_school_assigned_noted_by(school_id, session),
+        )
+        session.add(payroll_report)
+
+    elif payroll_report.reportStatus != ReportStatus.DRAFT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot update entries in a submitted report.",
+        )
+
+    return payroll_report
+
+
 router = APIRouter(prefix="/payroll")
 logged_in_dep = Annotated[DecodedJWTToken, Depends(verify_access_token)]
 
 
+@router.get("/summary")
+async def get_payroll_reports_totals(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    start: datetime.date,
+    end: datetime.date,
+    school_id: int | None = None,
+) -> list[PayrollMonthTotal]:
+    """Get the payroll totals of every school and month in a range.
+
+    Leave out the school to get the totals of every school in the division.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        start: A day in the first month of the range.
+        end: A day in the last month of the range.
+        school_id: The school to get the totals of, or None for all schools.
+
+    Returns:
+        The totals of each school and month with payroll entries.
+
+    Raises:
+        HTTPException: If the user is not found, lacks permission, or the range is invalid.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:read"
+        if school_id is not None and user.schoolId == school_id
+        else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view payroll reports.",
+        )
+
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The start of the range must not be after its end.",
+        )
+
+    logger.debug(
+        "user `%s` requesting payroll totals of school %s from %s to %s.",
+        token.id,
+        school_id if school_id is not None else "(all)",
+        start,
+        end,
+    )
+    return await get_payroll_totals(session, start, end, school_id)
+
+
 @router.get("/{school_id}/{year}/{month}")
 async def get_school_payroll_report(
     token: logged_in_dep,
@@ -196,6 +346,64 @@ async def get_school_payroll_report_entries(
     return list(payroll_report.entries)
 
 
+@router.get("/{school_id}/{year}/{month}/summary")
+async def get_school_payroll_report_summary(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+) -> PayrollReportSummary:
+    """Get the totals of a payroll report by employee, by week, and overall.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school of the report.
+        year: The year of the report.
+        month: The month of the report.
+
+    Returns:
+        The totals of the payroll report.
+
+    Raises:
+        HTTPException: If the user is not found, lacks permission, or the report is not found.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:read" if user.schoolId == school_id else "reports:global:read"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view payroll reports.",
+        )
+
+    logger.debug(
+        "user `%s` requesting payroll report summary of school %s for %s-%s.",
+        token.id,
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    if session.get(PayrollReport, (school_id, report_date)) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Payroll report not found.",
+        )
+
+    return await get_payroll_summary(session, school_id, report_date)
+
+
 @router.patch("/{school_id}/{year}/{month}")
 async def create_school_payroll_report(
     token: logged_in_dep,
@@ -270,11 +478,15 @@ async def create_school_payroll_report(
 
     # Check if payroll report already exists for this monthly report
     existing_payroll_report = session.exec(
-        select(PayrollReport).where(PayrollReport.parent == selected_monthly_report.id)
+        select(PayrollReport).where(
+            PayrollReport.schoolId == school_id,
+            PayrollReport.parent == selected_monthly_report.id,
+        )
     ).one_or_none()
 
     if existing_payroll_report is None:
         new_payroll_report = PayrollReport(
+            schoolId=school_id,
             parent=selected_monthly_report.id,
             preparedBy=user.id,  # Required field - always set to current user
             notedBy=noted_by,  # Nullable field - can be None
@@ -368,6 +580,7 @@ async def create_payroll_report_entry(
     # Check if entry already exists (composite primary key: parent, weekNumber, employee_name)
     existing_entry = session.exec(
         select(PayrollReportEntry).where(
+            PayrollReportEntry.schoolId == school_id,
             PayrollReportEntry.parent == payroll_report.parent,
             PayrollReportEntry.weekNumber == entry_data.week_number,
             PayrollReportEntry.employeeName == entry_data.employee_name,
@@ -381,6 +594,7 @@ async def create_payroll_report_entry(
         )
 
     new_entry = PayrollReportEntry(
+        schoolId=school_id,
         parent=payroll_report.parent,
         weekNumber=entry_data.week_number,
         employeeName=entry_data.employee_name,
@@ -408,9 +622,13 @@ async def create_bulk_payroll_report_entries(
     year: int,
     month: int,
     entries: list[PayrollEntryRequest],
-) -> list[PayrollReportEntry]:
+    upsert_existing: Annotated[bool, Query(alias="upsert")] = False,
+) -> PayrollEntriesBulkResponse:
     """Create multiple payroll report entries at once.
 
+    All the entries are written with a single statement. Entries of a week and
+    employee that already exist are skipped, or updated in upsert mode.
+
     Args:
         token: The decoded JWT token of the logged-in user.
         session: The database session.
@@ -418,12 +636,13 @@ async def create_bulk_payroll_report_entries(
         year: The year of the report.
         month: The month of the report.
         entries: List of payroll entry data.
+        upsert_existing: Whether to update the entries that already exist.
 
     Returns:
-        List of created payroll report entries.
+        Whether each entry was created, updated, or skipped.
 
     Raises:
-        HTTPException: If the user is not found, lacks permission, or the report is not found.
+        HTTPException: If the user is not found, lacks permission, or the entries are invalid.
     """
 
     user = await get_user(token.id, session, by_id=True)
@@ -448,102 +667,182 @@ async def create_bulk_payroll_report_entries(
             detail="No entries provided.",
         )
 
+    keys = [(e.week_number, e.employee_name) for e in entries]
+    if len(set(keys)) != len(keys):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each employee can only be provided once per week.",
+        )
+
     logger.debug(
-        "user `%s` creating bulk payroll report entries for school %s for %s-%s.",
+        "user `%s` %s %s payroll report entries for school %s for %s-%s.",
         token.id,
+        "upserting" if upsert_existing else "creating",
+        len(entries),
         school_id,
         year,
         month,
     )
 
-    # Check if the monthly report exists, create if not
-    monthly_report = session.exec(
-        select(MonthlyReport).where(
-            MonthlyReport.id == datetime.date(year=year, month=month, day=1),
-            MonthlyReport.submittedBySchool == school_id,
-        )
-    ).one_or_none()
+    report_date = datetime.date(year=year, month=month, day=1)
+    _ = await _get_draft_payroll_report(session, user.id, school_id, report_date)
 
-    if monthly_report is None:
-        monthly_report = MonthlyReport(
-            id=datetime.date(year=year, month=month, day=1),
-            name=f"Monthly Report for {datetime.date(year=year, month=month, day=1).strftime('%B %Y')}",
-            submittedBySchool=school_id,
-            reportStatus=ReportStatus.DRAFT,
-            preparedBy=user.id,
-        )
-        session.add(monthly_report)
+    existing_keys = set(
+        session.exec(
+            select(
+                PayrollReportEntry.weekNumber, PayrollReportEntry.employeeName
+            ).where(
+                PayrollReportEntry.schoolId == school_id,
+                PayrollReportEntry.parent == report_date,
+            )
+        ).all()
+    )
 
-    # Check if the payroll report exists, create if not
-    payroll_report = session.exec(
-        select(PayrollReport).where(
-            PayrollReport.parent == datetime.date(year=year, month=month, day=1),
+    session.flush()  # Write the parent reports before their entries
+    upsert(
+        session,
+        PayrollReportEntry.__table__,  # type: ignore
+        [
+            {
+                "schoolId": school_id,
+                "parent": report_date,
+                "weekNumber": e.week_number,
+                "employeeName": e.employee_name,
+                **{day: getattr(e, day) for day in PAYROLL_DAY_COLUMNS},
+                "signature": e.signature,
+            }
+            for e in entries
+            if upsert_existing or (e.week_number, e.employee_name) not in existing_keys
+        ],
+        update_columns=[*PAYROLL_DAY_COLUMNS, "signature"] if upsert_existing else [],
+    )
+    session.commit()
+
+    skipped = [key for key in keys if key in existing_keys and not upsert_existing]
+    if skipped:
+        logger.info(
+            "Skipped %d existing entries for user %s: %s",
+            len(skipped),
+            token.id,
+            skipped,
         )
-    ).one_or_none()
 
-    if payroll_report is None:
-        # Get the school's assigned noted by user
-        noted_by = await get_school_assigned_noted_by(school_id, session)
+    return PayrollEntriesBulkResponse(
+        entries=[
+            PayrollEntryBulkResult(
+                weekNumber=week_number,
+                employeeName=employee_name,
+                status=(
+                    "created"
+                    if (week_number, employee_name) not in existing_keys
+                    else "updated" if upsert_existing else "skipped"
+                ),
+            )
+            for week_number, employee_name in keys
+        ]
+    )
 
-        payroll_report = PayrollReport(
-            parent=datetime.date(year=year, month=month, day=1),
-            preparedBy=user.id,
-            notedBy=noted_by,
+
+@router.post("/{school_id}/{year}/{month}/entries/import")
+async def import_payroll_report_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    file: UploadFile = File(...),
+) -> ImportResult:
+    """Import payroll report entries from a CSV or XLSX file.
+
+    The first row of the file must have the headers of the payroll entry
+    fields (e.g. `week_number`, `employee_name`, `sun` to `sat`). The file is
+    read and written in batches, entries of the same employee and week are
+    updated, and invalid rows are skipped and reported.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school to import entries for.
+        year: The year of the report.
+        month: The month of the report.
+        file: The CSV or XLSX file to import.
+
+    Returns:
+        The number of imported and failed rows, and the errors of failed rows.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
         )
-        session.add(payroll_report)
 
-    # Check for existing entries
-    existing_entries = session.exec(
-        select(PayrollReportEntry).where(
-            PayrollReportEntry.parent == datetime.date(year=year, month=month, day=1),
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to import payroll report entries.",
         )
-    ).all()
 
-    existing_entries_set = {
-        (entry.weekNumber, entry.employeeName) for entry in existing_entries
-    }
+    try:
+        spreadsheet_format = get_spreadsheet_format(file.filename, file.content_type)
 
-    # Create new entries, skip existing ones
-    new_entries = []
-    skipped_entries = []
-
-    for entry_data in entries:
-        entry_key = (entry_data.week_number, entry_data.employee_name)
-        if entry_key in existing_entries_set:
-            skipped_entries.append(entry_key)
-            continue
-
-        new_entry = PayrollReportEntry(
-            parent=datetime.date(year=year, month=month, day=1),
-            weekNumber=entry_data.week_number,
-            employeeName=entry_data.employee_name,
-            sun=entry_data.sun,
-            mon=entry_data.mon,
-            tue=entry_data.tue,
-            wed=entry_data.wed,
-            thu=entry_data.thu,
-            fri=entry_data.fri,
-            sat=entry_data.sat,
-            signature=entry_data.signature,
-        )
-        new_entries.append(new_entry)
-        session.add(new_entry)
+    except SpreadsheetFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        ) from e
 
-    session.commit()
+    logger.debug(
+        "user `%s` importing payroll entries from `%s` for school %s for %s-%s.",
+        token.id,
+        file.filename,
+        school_id,
+        year,
+        month,
+    )
 
-    # Refresh all new entries
-    for entry in new_entries:
-        session.refresh(entry)
+    report_date = datetime.date(year=year, month=month, day=1)
+    _ = await _get_draft_payroll_report(session, user.id, school_id, report_date)
+    session.flush()  # Write the parent reports before their entries
+
+    def to_row(entry: PayrollEntryRequest) -> dict[str, Any]:
+        return {
+            "schoolId": school_id,
+            "parent": report_date,
+            "weekNumber": entry.week_number,
+            "employeeName": entry.employee_name,
+            "sun": entry.sun,
+            "mon": entry.mon,
+            "tue": entry.tue,
+            "wed": entry.wed,
+            "thu": entry.thu,
+            "fri": entry.fri,
+            "sat": entry.sat,
+            "signature": entry.signature,
+        }
 
-    if skipped_entries:
-        logger.info(
-            "Skipped %d existing entries for user %s: %s",
-            len(skipped_entries),
-            token.id,
-            skipped_entries,
+    try:
+        result = await asyncio.to_thread(
+            import_records,
+            session,
+            iter_spreadsheet_records(file.file, spreadsheet_format),
+            PayrollEntryRequest,
+            to_row,
+            PayrollReportEntry.__table__,  # type: ignore
+            ["sun", "mon", "tue", "wed", "thu", "fri", "sat", "signature"],
         )
 
-    return new_entries
+    except SpreadsheetFormatError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    session.commit()
+    return result
 
 
 @router.put("/{school_id}/{year}/{month}/entries/{week_number}/{employee_name}")
@@ -626,6 +925,7 @@ async def update_payroll_report_entry(
 
     existing_entry = session.exec(
         select(PayrollReportEntry).where(
+            PayrollReportEntry.schoolId == school_id,
             PayrollReportEntry.parent == payroll_report.parent,
             PayrollReportEntry.weekNumber == week_number,
             PayrollReportEntry.employeeName == employee_name,
@@ -740,6 +1040,7 @@ async def delete_payroll_report_entry(
 
     existing_entry = session.exec(
         select(PayrollReportEntry).where(
+            PayrollReportEntry.schoolId == school_id,
             PayrollReportEntry.parent == payroll_report.parent,
             PayrollReportEntry.weekNumber == week_number,
             PayrollReportEntry.employeeName == employee_name,
@@ -759,6 +1060,199 @@ async def delete_payroll_report_entry(
     }
 
 
+async def _check_payroll_entry_ids(
+    session: Session, school_id: int, report_date: datetime.date, ids: list[int]
+) -> None:
+    """Check that payroll entries can be written, by their IDs.
+
+    Args:
+        session: The database session.
+        school_id: The ID of the school of the report.
+        report_date: The first day of the month of the report.
+        ids: The IDs of the entries.
+
+    Raises:
+        HTTPException: If the report is not found or no longer a draft, an ID
+            is given twice, or an entry is not in the report.
+    """
+
+    payroll_report = session.get(PayrollReport, (school_id, report_date))
+    if payroll_report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Payroll report not found.",
+        )
+
+    if payroll_report.reportStatus != ReportStatus.DRAFT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot update entries in a submitted report.",
+        )
+
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each entry can only be provided once.",
+        )
+
+    found = set(
+        session.exec(
+            select(PayrollReportEntry.id).where(
+                PayrollReportEntry.schoolId == school_id,
+                PayrollReportEntry.parent == report_date,
+                col(PayrollReportEntry.id).in_(ids),
+            )
+        ).all()
+    )
+    missing = [entry_id for entry_id in ids if entry_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Payroll entries {missing} not found.",
+        )
+
+
+@router.patch("/{school_id}/{year}/{month}/entries")
+async def update_payroll_report_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    entries: list[PayrollEntryBatchUpdateRequest],
+) -> list[PayrollReportEntry]:
+    """Update several payroll report entries at once, by their IDs.
+
+    Only the provided fields of each entry are updated.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school of the report.
+        year: The year of the report.
+        month: The month of the report.
+        entries: The IDs and updated fields of the entries.
+
+    Returns:
+        The updated payroll report entries.
+
+    Raises:
+        HTTPException: If the user is not found, lacks permission, or an entry is not found.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to update payroll report entries.",
+        )
+
+    if not entries:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No entries provided.",
+        )
+
+    logger.debug(
+        "user `%s` updating %s payroll report entries for school %s for %s-%s.",
+        token.id,
+        len(entries),
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    ids = [entry.id for entry in entries]
+    await _check_payroll_entry_ids(session, school_id, report_date, ids)
+
+    rows = [entry.model_dump(exclude_none=True) for entry in entries]
+    if any(len(row) > 1 for row in rows):
+        # Rows that update the same columns are sent together as one executemany.
+        _ = session.exec(
+            update(PayrollReportEntry), params=[row for row in rows if len(row) > 1]
+        )
+    session.commit()
+
+    return list(
+        session.exec(
+            select(PayrollReportEntry)
+            .where(col(PayrollReportEntry.id).in_(ids))
+            .order_by(col(PayrollReportEntry.id))
+        ).all()
+    )
+
+
+@router.delete("/{school_id}/{year}/{month}/entries")
+async def delete_payroll_report_entries(
+    token: logged_in_dep,
+    session: Annotated[Session, Depends(get_db_session)],
+    school_id: int,
+    year: int,
+    month: int,
+    ids: Annotated[list[int], Query(alias="id")],
+) -> dict[str, str]:
+    """Delete several payroll report entries at once, by their IDs.
+
+    Args:
+        token: The decoded JWT token of the logged-in user.
+        session: The database session.
+        school_id: The ID of the school of the report.
+        year: The year of the report.
+        month: The month of the report.
+        ids: The IDs of the entries to delete.
+
+    Returns:
+        A confirmation message.
+
+    Raises:
+        HTTPException: If the user is not found, lacks permission, or an entry is not found.
+    """
+
+    user = await get_user(token.id, session, by_id=True)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found.",
+        )
+
+    required_permission = (
+        "reports:local:write" if user.schoolId == school_id else "reports:global:write"
+    )
+    if not await verify_user_permission(required_permission, session, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to delete payroll report entries.",
+        )
+
+    logger.debug(
+        "user `%s` deleting %s payroll report entries for school %s for %s-%s.",
+        token.id,
+        len(ids),
+        school_id,
+        year,
+        month,
+    )
+
+    report_date = datetime.date(year=year, month=month, day=1)
+    await _check_payroll_entry_ids(session, school_id, report_date, ids)
+
+    _ = session.exec(
+        delete(PayrollReportEntry).where(col(PayrollReportEntry.id).in_(ids))
+    )
+    session.commit()
+    return {"message": f"{len(ids)} payroll entries deleted successfully."}
+
+
 @router.put("/{school_id}/{year}/{month}")
 async def update_payroll_report(
     token: logged_in_dep,
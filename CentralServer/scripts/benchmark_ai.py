@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""benchmark_ai.py
+
+Measure how many prompts per second the AI assistant can correct and
+classify locally, without calling the Gemini API.
+
+Run it from the `CentralServer` directory:
+
+    PYTHONPATH=. python scripts/benchmark_ai.py
+"""
+
+import argparse
+import sys
+from time import perf_counter
+
+from centralserver.internals.ai.core import classify_intent_local
+from centralserver.internals.ai.typo import correct_token, correct_typos_advanced
+
+SAMPLE_PROMPTS: tuple[str, ...] = (
+    "Magkano ang kita kahapon?",
+    "What was the slaes on July 14?",
+    "benta noong 12 hulyo",
+    "how much did we earn today",
+    "helo",
+    "kumsta po",
+    "thank you!",
+    "maraming salamat",
+    "What is the sales for March 3, 2025?",
+    "who made you",
+)
+
+
+def run(prompts: tuple[str, ...], iterations: int) -> float:
+    """Correct and classify the prompts.
+
+    Args:
+        prompts: The prompts to process.
+        iterations: How many times to process all prompts.
+
+    Returns:
+        The number of prompts processed per second.
+    """
+
+    start = perf_counter()
+    for _ in range(iterations):
+        for prompt in prompts:
+            _ = classify_intent_local(correct_typos_advanced(prompt))
+
+    return len(prompts) * iterations / (perf_counter() - start)
+
+
+def main() -> int:
+    """The main function of the script."""
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark spell correction and intent classification."
+    )
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=100,
+        required=False,
+        help="How many times to process the sample prompts (default: 100)",
+    )
+
+    args = parser.parse_args()
+
+    # The first run fills the caches; later runs show the cached throughput.
+    correct_token.cache_clear()
+    classify_intent_local.cache_clear()
+    print(f"Cold: {run(SAMPLE_PROMPTS, 1):,.1f} prompts/sec")
+    print(f"Warm: {run(SAMPLE_PROMPTS, args.iterations):,.1f} prompts/sec")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
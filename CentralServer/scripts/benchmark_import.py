@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""benchmark_import.py
+
+Measure how long it takes to import `centralserver.main`, which is the cold
+start cost of every worker, and list the slowest modules.
+
+Run it from the `CentralServer` directory:
+
+    PYTHONPATH=. python scripts/benchmark_import.py
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_once(statement: str) -> tuple[float, dict[str, int]]:
+    """Run an import statement in a new interpreter.
+
+    Args:
+        statement: The Python code to run.
+
+    Returns:
+        The wall time in seconds, and the cumulative import time of each
+        top-level module in microseconds.
+    """
+
+    start = perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    duration = perf_counter() - start
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            name = match.group(4).strip()
+            cumulative[name] = max(cumulative.get(name, 0), int(match.group(2)))
+
+    return duration, cumulative
+
+
+def main() -> int:
+    """The main function of the script."""
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the import time of the central server."
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=5,
+        required=False,
+        help="How many times to import the server (default: 5)",
+    )
+    parser.add_argument(
+        "-t",
+        "--top",
+        type=int,
+        default=15,
+        required=False,
+        help="How many of the slowest modules to list (default: 15)",
+    )
+    parser.add_argument(
+        "--with-ai",
+        action="store_true",
+        help="Also import the AI assistant, like the first AI request does",
+    )
+
+    args = parser.parse_args()
+    statement = "import centralserver.main"
+    if args.with_ai:
+        statement += "; import centralserver.internals.ai.core"
+
+    durations: list[float] = []
+    slowest: dict[str, int] = {}
+    for _ in range(args.runs):
+        duration, cumulative = import_once(statement)
+        durations.append(duration)
+        slowest = cumulative
+
+    print(statement)
+    print(
+        f"Median: {statistics.median(durations):.3f} s, "
+        f"min: {min(durations):.3f} s, max: {max(durations):.3f} s"
+    )
+    print("\nSlowest modules (cumulative, last run):")
+    for name, microseconds in sorted(
+        slowest.items(), key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        print(f"{microseconds / 1000:10.1f} ms  {name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
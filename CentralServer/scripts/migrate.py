@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""migrate.py
+
+Apply the pending schema migrations to the database in the server's
+configuration file (`CENTRAL_SERVER_CONFIG_FILE`, or `config.json` by default).
+The server also applies them when it starts.
+
+Run it from the `CentralServer` directory:
+
+    PYTHONPATH=. python scripts/migrate.py --dry-run
+"""
+
+import argparse
+import sys
+
+from centralserver.internals.db_handler import engine
+from centralserver.internals.migration_handler import (
+    MIGRATION_LARGE_TABLE_ROWS,
+    migrate,
+    plan_migrations,
+)
+
+
+def main() -> int:
+    """The main function of the script."""
+
+    parser = argparse.ArgumentParser(description="Apply the schema migrations.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only show the statements that would run, and which ones lock large tables",
+    )
+    args = parser.parse_args()
+
+    planned = plan_migrations(engine)
+    print("Database: ", engine.url.render_as_string(hide_password=True))
+    for step in planned:
+        flag = "LOCKS" if step.blocking else "ok"
+        print(f"[{flag:>5}] v{step.version} {step.table} (~{step.rows} rows)")
+        print(f"        {step.statement}")
+
+    if not planned:
+        print("No statements to run.")
+    elif any(step.blocking for step in planned):
+        print(
+            f"LOCKS: the statement locks a table of at least "
+            f"{MIGRATION_LARGE_TABLE_ROWS} rows until it is done."
+        )
+
+    if args.dry_run:
+        return 0
+
+    for version in migrate(engine):
+        print(f"Applied migration {version}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
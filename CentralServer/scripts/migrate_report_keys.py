@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""migrate_report_keys.py
+
+Rewrite the report tables of a database created before reports were keyed by
+school and month. The database is the one in the server's configuration file
+(`CENTRAL_SERVER_CONFIG_FILE`, or `config.json` by default).
+
+Run it from the `CentralServer` directory while the server is stopped:
+
+    PYTHONPATH=. python scripts/migrate_report_keys.py
+"""
+
+import argparse
+import sys
+
+from centralserver.internals.db_handler import engine
+from centralserver.internals.exceptions import ReportKeyMigrationError
+from centralserver.internals.report_key_migration import (
+    REPORT_KEY_MIGRATION_BATCH_SIZE,
+    migrate_report_keys,
+    needs_report_key_migration,
+)
+
+
+def main() -> int:
+    """The main function of the script."""
+
+    parser = argparse.ArgumentParser(
+        description="Key the report tables by school and month."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=REPORT_KEY_MIGRATION_BATCH_SIZE,
+        help=f"Rows to copy at a time (default: {REPORT_KEY_MIGRATION_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check if the database needs to be migrated",
+    )
+    args = parser.parse_args()
+
+    with engine.connect() as connection:
+        needed = needs_report_key_migration(connection)
+
+    print("Database:         ", engine.url.render_as_string(hide_password=True))
+    print("Migration needed: ", "yes" if needed else "no")
+    if args.check or not needed:
+        return 1 if args.check and needed else 0
+
+    try:
+        copied = migrate_report_keys(engine, args.batch_size)
+
+    except ReportKeyMigrationError as e:
+        print(f"Migration failed: {e}", file=sys.stderr)
+        return 1
+
+    for table, rows in copied.items():
+        print(f"{table}: {rows} rows")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
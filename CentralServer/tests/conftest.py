@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlmodel import Session, col, select
+
+from centralserver import app, startup
+from centralserver.info import Database
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.school import School
+from centralserver.internals.models.user import User
+from centralserver.internals.report_key_migration import get_report_tables
+from centralserver.routers.reports_routes import (
+    bundle,
+    daily,
+    exports,
+    liquidation,
+    payroll,
+)
+
+
+async def allow(*_, **__) -> bool:
+    return True
+
+
+@dataclass
+class ReportTestSchool:
+    """A school to write reports for as the default user."""
+
+    id: int
+    user_id: str
+    headers: dict[str, str]
+
+
+@pytest.fixture
+def allow_report_routes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub out the permission check of the report routes, so that the default
+    user can read and write the reports of any school."""
+
+    for module in (bundle, daily, exports, liquidation, payroll):
+        monkeypatch.setattr(module, "verify_user_permission", allow)
+
+
+@pytest.fixture
+async def report_schools() -> AsyncIterator[Callable[[str], ReportTestSchool]]:
+    """Create schools to write reports for as the default user.
+
+    The permission check of the report routes is not stubbed, so request
+    `allow_report_routes` as well to skip it. The schools and all of their
+    reports are deleted after the test.
+    """
+
+    await startup()
+    login = TestClient(app).post(
+        "/api/v1/auth/login",
+        data={"username": Database.default_user, "password": Database.default_password},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    with Session(engine) as session:
+        user_id = session.exec(
+            select(User.id).where(User.username == Database.default_user)
+        ).one()
+
+    school_ids: list[int] = []
+
+    def create_school(name: str) -> ReportTestSchool:
+        with Session(engine) as session:
+            school = School(name=name)
+            session.add(school)
+            session.commit()
+            session.refresh(school)
+            assert school.id is not None
+
+        school_ids.append(school.id)
+        return ReportTestSchool(id=school.id, user_id=user_id, headers=headers)
+
+    yield create_school
+
+    with Session(engine) as session:
+        # Delete the entries and component reports before the monthly reports
+        for table in reversed(get_report_tables()):
+            school_column = (
+                table.c.submittedBySchool
+                if table.name == "monthlyReports"
+                else table.c.schoolId
+            )
+            _ = session.exec(delete(table).where(school_column.in_(school_ids)))
+
+        _ = session.exec(delete(School).where(col(School.id).in_(school_ids)))
+        session.commit()
+
+
+@pytest.fixture
+def report_school(
+    request: pytest.FixtureRequest,
+    allow_report_routes: None,
+    report_schools: Callable[[str], ReportTestSchool],
+) -> ReportTestSchool:
+    """Create a school whose reports can be written by the default user.
+
+    The permission check of the report routes is stubbed out.
+    """
+
+    return report_schools(f"{request.node.name} school")
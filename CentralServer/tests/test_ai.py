@@ -0,0 +1,282 @@
+import asyncio
+import datetime
+import json
+import threading
+import time
+
+import pytest
+from sqlmodel import Session
+
+from centralserver.internals.ai import core
+from centralserver.internals.ai.auth import UserInfo
+from centralserver.internals.ai.core import classify_intent_local, smart_ask
+from centralserver.internals.ai.llm import ModelClient
+from centralserver.internals.ai.loader import get_ai_core
+from centralserver.internals.ai.memory import (
+    ConversationMemory,
+    SQLiteConversationMemory,
+)
+from centralserver.internals.ai.typo import correct_token, correct_typos_advanced
+from centralserver.internals.ai.utils import (
+    PH_TZ,
+    extract_date_from_prompt,
+    extract_sales_period,
+)
+from centralserver.internals.config_handler import AI, read_config
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.token import DecodedJWTToken
+from centralserver.internals.models.user import User
+
+
+class FakeModel:
+    """A local model that replies with the same text to every prompt.
+
+    Intent classification prompts are classified as unknown.
+    """
+
+    def __init__(self, reply: str = "general_question", delay: float = 0) -> None:
+        self.reply = reply
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if "intent classification" in prompt:
+                return "unknown"
+
+            return self.reply
+
+        finally:
+            self.running -= 1
+
+
+def test_correct_typos_keywords():
+    assert correct_typos_advanced("helo") == "hello"
+    assert correct_typos_advanced("What was the slaes?") == "What was the sales?"
+
+
+def test_correct_typos_skipped_tokens():
+    """Numbers, dates, and Tagalog words are not changed by the spell checker."""
+
+    prompt = "Magkano ang benta noong 14 hulyo 2025?"
+    assert correct_typos_advanced(prompt) == prompt
+    assert correct_token("kahapon") == "kahapon"
+    assert correct_token("Sept") == "Sept"
+
+
+def test_classify_intent_local():
+    assert classify_intent_local("magkano ang kita kahapon?") == "sales_query"
+    assert classify_intent_local("kumusta") == "greeting"
+    assert classify_intent_local("maraming salamat") == "thank_you"
+    assert classify_intent_local("describe the canteen") == "unknown"
+
+
+async def test_model_client_cache():
+    model = FakeModel()
+    client = ModelClient(model, AI())
+
+    for _ in range(3):
+        assert await client.generate("hi", "user", cache_key=("intent", "hi")) == (
+            "general_question"
+        )
+
+    assert len(model.prompts) == 1
+    _ = await client.generate("hi", "user")  # Not cached without a key
+    assert len(model.prompts) == 2
+
+
+async def test_model_client_limits():
+    model = FakeModel(delay=0.01)
+    client = ModelClient(model, AI(max_concurrency=2, max_user_concurrency=1))
+
+    _ = await asyncio.gather(*(client.generate("hi", "user") for _ in range(3)))
+    assert model.max_running == 1  # One request at a time per user
+
+    model.max_running = 0
+    _ = await asyncio.gather(*(client.generate("hi", f"user{i}") for i in range(4)))
+    assert model.max_running == 2
+
+
+async def test_model_client_timeout():
+    client = ModelClient(FakeModel(delay=1), AI(timeout=0.01))
+
+    with pytest.raises(TimeoutError):
+        _ = await client.generate("hi", "user")
+
+
+async def test_smart_ask_fallback(monkeypatch: pytest.MonkeyPatch):
+    """Unknown prompts are classified and answered by the model."""
+
+    model = FakeModel(reply="I am the canteen assistant.")
+    client = ModelClient(model, AI())
+    monkeypatch.setattr(core, "get_model_client", lambda: client)
+
+    assert await smart_ask("what is the canteen", "test_ai") == (
+        "I am the canteen assistant."
+    )
+    assert await smart_ask("What is the canteen?", "test_ai2") == (
+        "I am the canteen assistant."
+    )
+    assert len(model.prompts) == 2  # Classified and answered once
+
+
+async def test_get_sales_permissions(monkeypatch: pytest.MonkeyPatch):
+    """Sales of another school need the global read permission."""
+
+    user = User(id="sales-user", username="sales", password="", roleId=5, schoolId=2)
+
+    async def get_user(*_, **__) -> User:
+        return user
+
+    async def local_read_only(permission: str, *_) -> bool:
+        return permission == "reports:local:read"
+
+    async def no_entry(*_) -> None:
+        return None
+
+    monkeypatch.setattr(core, "get_user", get_user)
+    monkeypatch.setattr(core, "verify_user_permission", local_read_only)
+    monkeypatch.setattr(core, "get_daily_entry", no_entry)
+    token = DecodedJWTToken(id=user.id, is_refresh_token=False)
+    other_school = UserInfo(user.id, "sales", "Sales User", "Canteen Manager", 1, "")
+
+    with Session(engine) as session:
+        reply = await core.get_sales("2026-10-01", other_school, token, session)
+        assert reply.startswith("🔒")
+        reply = await core.get_sales_summary(
+            "this_month", datetime.date(2026, 10, 19), other_school, token, session
+        )
+        assert reply.startswith("🔒")
+
+        reply = await core.get_sales("2026-10-01", None, token, session)
+        assert reply == "📭 No sales record found for 2026-10-01."
+
+        user.schoolId = None
+        reply = await core.get_sales("2026-10-01", None, token, session)
+        assert reply == core.NO_SCHOOL_REPLY
+
+
+def test_ai_config_reload():
+    """The model client and memory are created again when their config changes."""
+
+    with open("./config.pytest.json", "r", encoding="utf-8") as f:
+        confdata = json.load(f)
+
+    old_config = read_config("confdata", "utf-8", confdata)
+    confdata["ai"] = {"timeout": 5}
+    timeout_config = read_config("confdata", "utf-8", confdata)
+    confdata["ai"] = {"timeout": 5, "history_length": 5}
+    history_config = read_config("confdata", "utf-8", confdata)
+
+    client, memory = core.get_model_client(), core.get_user_memory()
+    core._apply_config(old_config, old_config)  # pylint: disable=W0212
+    assert core.get_model_client() is client
+    assert core.get_user_memory() is memory
+
+    core._apply_config(old_config, timeout_config)  # pylint: disable=W0212
+    assert core.get_model_client() is not client
+    assert core.get_user_memory() is memory
+
+    core._apply_config(timeout_config, history_config)  # pylint: disable=W0212
+    assert core.get_user_memory() is not memory
+
+
+def test_conversation_memory_limits():
+    memory = ConversationMemory(history_length=2, max_users=2, idle_timeout=60)
+
+    assert memory.add("a", "one") == ["one"]
+    assert memory.add("a", "two") == ["one", "two"]
+    assert memory.add("a", "three") == ["two", "three"]
+
+    _ = memory.add("b", "one")
+    _ = memory.add("a", "four")  # "a" is now the most recently active user
+    _ = memory.add("c", "one")
+    assert len(memory) == 2
+    assert memory.get("b") == []
+    assert memory.get("a") == ["three", "four"]
+
+
+def test_conversation_memory_idle_eviction():
+    memory = ConversationMemory(history_length=3, max_users=10, idle_timeout=0.05)
+
+    _ = memory.add("a", "one")
+    time.sleep(0.1)
+    assert memory.get("a") == []
+    assert len(memory) == 0
+
+
+def test_sqlite_conversation_memory(tmp_path):
+    filepath = tmp_path / "memory.db"
+    memory = SQLiteConversationMemory(
+        filepath, history_length=2, max_users=2, idle_timeout=60
+    )
+
+    _ = memory.add("a", "one")
+    _ = memory.add("a", "two")
+    assert memory.add("a", "three") == ["two", "three"]
+    _ = memory.add("b", "one")
+    _ = memory.add("c", "one")
+    assert memory.get("a") == []  # The least recently active user is forgotten
+    assert len(memory) == 2
+
+    # Conversations are kept after a restart
+    memory = SQLiteConversationMemory(
+        filepath, history_length=2, max_users=2, idle_timeout=60
+    )
+    assert memory.get("c") == ["one"]
+
+
+async def test_smart_ask_sqlite_memory(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """The persistent memory is not read and written on the event loop."""
+
+    threads: list[int] = []
+
+    class RecordingMemory(SQLiteConversationMemory):
+        def add(self, user_id: str, prompt: str) -> list[str]:
+            threads.append(threading.get_ident())
+            return super().add(user_id, prompt)
+
+    memory = RecordingMemory(
+        tmp_path / "memory.db", history_length=2, max_users=2, idle_timeout=60
+    )
+    monkeypatch.setattr(core, "get_user_memory", lambda: memory)
+
+    assert (await smart_ask("hello", "test_ai_sqlite")).startswith("👋 Hello")
+    assert (await smart_ask("hello", "test_ai_sqlite")).startswith("👋 Welcome back")
+    assert threads and threading.get_ident() not in threads
+
+
+def test_extract_sales_period():
+    assert extract_sales_period("sales this week") == "this_week"
+    assert extract_sales_period("magkano ang benta nakaraang linggo") == "last_week"
+    assert extract_sales_period("compare the sales to last month") == "compare_month"
+    assert extract_sales_period("sales on July 14") is None
+
+
+def test_extract_date_from_prompt():
+    now = PH_TZ.localize(datetime.datetime(2026, 10, 19, 10, 0))  # A Monday
+
+    assert extract_date_from_prompt("sales on July 14", now) == "2026-07-14"
+    assert extract_date_from_prompt("benta noong ika-14 ng Hulyo", now) == (
+        "2026-07-14"
+    )
+    assert extract_date_from_prompt("sales on Dec 25", now) == "2025-12-25"
+    assert extract_date_from_prompt("March 3, 2025", now) == "2025-03-03"
+    assert extract_date_from_prompt("2024-02-29", now) == "2024-02-29"
+    assert extract_date_from_prompt("magkano kahapon", now) == "2026-10-18"
+    assert extract_date_from_prompt("noong Lunes", now) == "2026-10-12"
+    assert extract_date_from_prompt("sales noong Linggo", now) == "2026-10-18"
+    assert extract_sales_period("benta nakaraang linggo") == "last_week"
+    assert extract_date_from_prompt("friday", now) == "2026-10-16"
+    # Formats without a rule are parsed by dateparser
+    assert extract_date_from_prompt("two weeks ago", now) == "2026-10-05"
+
+
+async def test_get_ai_core():
+    assert await get_ai_core() is core
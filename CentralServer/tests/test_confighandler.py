@@ -1,6 +1,9 @@
 import json
+import os
 from typing import Final
 
+import pytest
+
 from centralserver.internals import config_handler
 from centralserver.internals.adapters import config
 from centralserver.internals.models.oauth import OAuthConfigs
@@ -417,3 +420,83 @@ def test_configreader_invalid_objectstore():
         return
 
     raise AssertionError("Expected ValueError, but no exception was raised.")
+
+
+def test_configstore_reload(tmp_path):
+    with open("./config.pytest.json", "r", encoding="utf-8") as f:
+        confdata = json.load(f)
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(confdata), encoding="utf-8")
+
+    def load() -> config_handler.AppConfig:
+        with open(config_file, "r", encoding="utf-8") as f:
+            return config_handler.read_config(config_file, "utf-8", json.load(f))
+
+    store = config_handler.ConfigStore(load)
+    changes: list[tuple[int, int]] = []
+    store.subscribe(
+        lambda old, new: changes.append(
+            (
+                old.security.failed_login_lockout_attempts,
+                new.security.failed_login_lockout_attempts,
+            )
+        )
+    )
+    assert not store.reload_if_changed()
+
+    old_attempts = store.security.failed_login_lockout_attempts
+    confdata["security"]["failed_login_lockout_attempts"] = old_attempts + 1
+    config_file.write_text(json.dumps(confdata), encoding="utf-8")
+    _ = store.reload()
+
+    assert store.security.failed_login_lockout_attempts == old_attempts + 1
+    assert changes == [(old_attempts, old_attempts + 1)]
+
+    # Invalid configuration files are ignored.
+    confdata["database"]["type"] = "invalid database type"
+    config_file.write_text(json.dumps(confdata), encoding="utf-8")
+    try:
+        _ = store.reload()
+
+    except ValueError:
+        pass  # Expected
+
+    else:
+        raise AssertionError("Expected ValueError, but no exception was raised.")
+
+    assert store.security.failed_login_lockout_attempts == old_attempts + 1
+    assert len(changes) == 1
+
+    # Malformed sections are ignored by the watcher as well.
+    confdata["database"]["type"] = "sqlite"
+    confdata["security"] = "malformed"
+    config_file.write_text(json.dumps(confdata), encoding="utf-8")
+    os.utime(config_file, (0, 0))
+    assert not store.reload_if_changed()
+    assert store.security.failed_login_lockout_attempts == old_attempts + 1
+    assert not store.reload_if_changed()
+
+
+def test_configstore_read_only(tmp_path):
+    with open("./config.pytest.json", "r", encoding="utf-8") as f:
+        confdata = json.load(f)
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(confdata), encoding="utf-8")
+
+    def load() -> config_handler.AppConfig:
+        with open(config_file, "r", encoding="utf-8") as f:
+            return config_handler.read_config(config_file, "utf-8", json.load(f))
+
+    store = config_handler.ConfigStore(load)
+    snapshot = store.current
+    with pytest.raises(AttributeError):
+        store.run_internal = True
+
+    store.set_run_internal(True)
+    assert store.run_internal
+    assert not snapshot.run_internal  # The old snapshot is not changed
+
+    _ = store.reload()
+    assert store.run_internal
@@ -1,4 +1,10 @@
+from fastapi.testclient import TestClient
+
+from centralserver import app
+from centralserver.info import Database
 from centralserver.internals import db_handler
+from centralserver.internals.config_handler import app_config
+from centralserver.internals.middleware import QUERY_COUNT_HEADER
 
 
 async def test_db_repopulation() -> None:
@@ -7,3 +13,54 @@ async def test_db_repopulation() -> None:
     # The database should be populated already
     assert await db_handler.populate_db() is True
     assert await db_handler.populate_db() is False
+
+
+async def test_db_fingerprint(monkeypatch) -> None:
+    """Check that the database is only populated again when its schema changes."""
+
+    fingerprint = db_handler.get_schema_fingerprint(db_handler.engine.dialect)
+    _ = await db_handler.populate_db()
+    assert db_handler.get_stored_schema_fingerprint() == fingerprint
+
+    monkeypatch.setattr(db_handler, "get_schema_fingerprint", lambda _: "changed")
+    assert await db_handler.populate_db() is False
+    assert db_handler.get_stored_schema_fingerprint() == "changed"
+
+    monkeypatch.undo()
+    assert await db_handler.populate_db() is False
+    assert db_handler.get_stored_schema_fingerprint() == fingerprint
+
+
+def test_parameter_shape() -> None:
+    """Check that query parameters are described without their values."""
+
+    assert db_handler.parameter_shape(("bento", 1)) == "(str, int)"
+    assert (
+        db_handler.parameter_shape({"username": "bento", "id": 1})
+        == "{username: str, id: int}"
+    )
+    assert (
+        db_handler.parameter_shape([("a", 1), ("b", 2)], executemany=True)
+        == "2 x (str, int)"
+    )
+
+
+def test_query_budget_header(monkeypatch) -> None:
+    """Check that requests over their query budget are reported."""
+
+    client = TestClient(app)
+    login = client.post(
+        "/api/v1/auth/login",
+        data={"username": Database.default_user, "password": Database.default_password},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    monkeypatch.setattr(app_config.logging, "query_budget", 0)
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert QUERY_COUNT_HEADER not in response.headers
+
+    monkeypatch.setattr(app_config.logging, "query_budget", 1)
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert int(response.headers[QUERY_COUNT_HEADER]) > 1
@@ -0,0 +1,120 @@
+import json
+import logging
+import queue
+
+from fastapi.testclient import TestClient
+
+from centralserver import app
+from centralserver.internals.config_handler import app_config
+from centralserver.internals.logger import (
+    DroppingQueueHandler,
+    JSONFormatter,
+    LoggerFactory,
+    RequestContext,
+    RequestContextFilter,
+    bind_request_user,
+    request_context,
+)
+
+client = TestClient(app)
+
+
+def test_loggers_share_queue_handler() -> None:
+    """Check that all loggers use the same queue handler."""
+
+    first = LoggerFactory().get_logger("pytest.logger.first")
+    second = LoggerFactory().get_logger("pytest.logger.second")
+
+    assert len(first.handlers) == 1
+    assert first.handlers[0] is second.handlers[0]
+    assert isinstance(first.handlers[0], DroppingQueueHandler)
+
+
+def test_dropping_queue_handler() -> None:
+    """Check that records are dropped and counted when the queue is full."""
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    logger = logging.getLogger("pytest.logger.dropping")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = DroppingQueueHandler(log_queue)
+    logger.addHandler(handler)
+
+    for i in range(5):
+        logger.debug("Message %d", i)
+
+    assert handler.dropped == 3
+    assert log_queue.get_nowait().getMessage() == "Message 0"
+    assert log_queue.get_nowait().getMessage() == "Message 1"
+
+    # The next record reports the dropped records before being enqueued.
+    logger.debug("Message 5")
+    assert "Dropped 3 log records" in log_queue.get_nowait().getMessage()
+    assert log_queue.get_nowait().getMessage() == "Message 5"
+
+
+def test_request_id_header() -> None:
+    """Check that every response has a request ID, reusing valid client IDs."""
+
+    response = client.get("/api/v1/healthcheck")
+    assert len(response.headers["X-Request-ID"]) == 32
+
+    response = client.get(
+        "/api/v1/healthcheck", headers={"X-Request-ID": "pytest-request-1"}
+    )
+    assert response.headers["X-Request-ID"] == "pytest-request-1"
+
+    response = client.get(
+        "/api/v1/healthcheck", headers={"X-Request-ID": "invalid request id!"}
+    )
+    assert response.headers["X-Request-ID"] != "invalid request id!"
+
+
+def test_request_context_filter(monkeypatch) -> None:
+    """Check that records get the request context and debug records are sampled."""
+
+    log_filter = RequestContextFilter()
+    record = logging.makeLogRecord({"levelno": logging.DEBUG, "msg": "Outside"})
+    assert log_filter.filter(record)
+    assert record.request_id == "-"
+
+    monkeypatch.setattr(app_config.logging, "debug_sample_rate", 0.0)
+    token = request_context.set(
+        RequestContext(request_id="abc123", scope={"path": "/v1/healthcheck"})
+    )
+    try:
+        bind_request_user("pytest-user")
+        debug = logging.makeLogRecord({"levelno": logging.DEBUG, "msg": "Debug"})
+        warning = logging.makeLogRecord({"levelno": logging.WARNING, "msg": "Warn"})
+
+        assert not log_filter.filter(debug)
+        assert log_filter.filter(warning)
+        assert warning.request_id == "abc123"
+        assert warning.user_id == "pytest-user"
+        assert warning.route == "/v1/healthcheck"
+
+    finally:
+        request_context.reset(token)
+
+
+def test_json_formatter() -> None:
+    """Check that the JSON formatter includes the context and extra fields."""
+
+    record = logging.makeLogRecord(
+        {
+            "name": "pytest",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "Hello %s",
+            "args": ("world",),
+            "request_id": "abc123",
+            "headers": {"host": "localhost"},
+        }
+    )
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "Hello world"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc123"
+    assert entry["headers"] == {"host": "localhost"}
+    assert "args" not in entry
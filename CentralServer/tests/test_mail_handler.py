@@ -0,0 +1,46 @@
+import pytest
+
+from centralserver.internals import templater
+from centralserver.internals.exceptions import EmailTemplateNotFoundError
+from centralserver.internals.mail_handler import get_template_pair
+
+
+def test_precompile_templates() -> None:
+    """Check that all required email templates are found and compiled."""
+
+    assert templater.precompile_templates() >= len(templater.MAIL_TEMPLATES) * 2
+
+
+def test_precompile_templates_missing(monkeypatch) -> None:
+    """Check that a missing email template is reported by precompile_templates()."""
+
+    monkeypatch.setattr(
+        templater,
+        "MAIL_TEMPLATES",
+        templater.MAIL_TEMPLATES + ("nonexistent_template",),
+    )
+    with pytest.raises(EmailTemplateNotFoundError) as e:
+        _ = templater.precompile_templates()
+
+    assert "nonexistent_template.txt" in str(e.value)
+    assert "nonexistent_template.html" in str(e.value)
+
+
+def test_get_template_pair() -> None:
+    """Check that the plain text and HTML versions are rendered together."""
+
+    text, html = get_template_pair(
+        "mfa_otp_enabled", name="Pytest User", app_name="Pytest App"
+    )
+
+    assert "Pytest User" in text
+    assert "Pytest User" in html
+    assert "<html" in html
+    assert "<html" not in text
+
+
+def test_get_template_pair_missing() -> None:
+    """Check that a missing template raises EmailTemplateNotFoundError."""
+
+    with pytest.raises(EmailTemplateNotFoundError):
+        _ = get_template_pair("nonexistent_template")
@@ -0,0 +1,73 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from centralserver import app, startup
+from centralserver.info import Database
+from centralserver.internals import metrics
+
+client = TestClient(app)
+
+
+def test_histogram_render(monkeypatch) -> None:
+    """Check the Prometheus text format of a histogram."""
+
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    histogram = metrics.Histogram(
+        "pytest_duration_seconds", "Pytest durations.", ("route",), (0.1, 1.0)
+    )
+    counter = metrics.Counter("pytest_total", "Pytest counter.", ("route",))
+    histogram.observe(0.05, '/v1/"quoted"')
+    histogram.observe(0.5, '/v1/"quoted"')
+    histogram.observe(5, '/v1/"quoted"')
+    counter.inc("/v1/a", amount=2)
+
+    rendered = registry.render()
+    assert "# TYPE pytest_duration_seconds histogram" in rendered
+    assert 'pytest_duration_seconds_bucket{route="/v1/\\"quoted\\"",le="0.1"} 1' in (
+        rendered
+    )
+    assert 'pytest_duration_seconds_bucket{route="/v1/\\"quoted\\"",le="1"} 2' in (
+        rendered
+    )
+    assert 'pytest_duration_seconds_bucket{route="/v1/\\"quoted\\"",le="+Inf"} 3' in (
+        rendered
+    )
+    assert 'pytest_duration_seconds_count{route="/v1/\\"quoted\\""} 3' in rendered
+    assert 'pytest_total{route="/v1/a"} 2' in rendered
+
+
+async def test_metrics_endpoint() -> None:
+    """Check that the metrics endpoint requires a login and reports requests."""
+
+    await startup()
+    before = metrics.HTTP_REQUESTS.value("GET", "/v1/healthcheck", "200")
+    _ = client.get("/api/v1/healthcheck")
+    assert metrics.HTTP_REQUESTS.value("GET", "/v1/healthcheck", "200") == before + 1
+
+    response = client.get("/api/v1/admin/metrics")
+    assert response.status_code == 401
+
+    login = client.post(
+        "/api/v1/auth/login",
+        data={"username": Database.default_user, "password": Database.default_password},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    response = client.get("/api/v1/admin/metrics", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'centralserver_http_requests_total{method="GET",route="/v1/healthcheck",status="200"}'
+        in response.text
+    )
+    assert "centralserver_db_queries_total" in response.text
+
+
+def test_metric_without_samples() -> None:
+    """Check that a metric must implement samples() to be created."""
+
+    class Untyped(metrics.Metric):
+        pass
+
+    with pytest.raises(TypeError):
+        _ = Untyped("pytest_untyped", "A metric without samples.")  # type: ignore
@@ -0,0 +1,124 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from centralserver.internals.migration_handler import (
+    MIGRATIONS,
+    CreateIndex,
+    get_applied_versions,
+    migrate,
+    plan_migrations,
+)
+
+OWNER_INDEX = CreateIndex("notifications", "ix_notifications_ownerId_archived")
+
+
+def test_create_index_statements() -> None:
+    """Check that indexes are built online where the database supports it."""
+
+    assert OWNER_INDEX.statements(postgresql.dialect()) == [
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS "ix_notifications_ownerId_archived" '
+        'ON notifications ("ownerId", archived)'
+    ]
+    assert OWNER_INDEX.statements(mysql.dialect()) == [
+        "CREATE INDEX `ix_notifications_ownerId_archived` "
+        "ON notifications (`ownerId`, archived) ALGORITHM=INPLACE LOCK=NONE"
+    ]
+    assert OWNER_INDEX.statements(sqlite.dialect()) == [
+        'CREATE INDEX IF NOT EXISTS "ix_notifications_ownerId_archived" '
+        'ON notifications ("ownerId", archived)'
+    ]
+
+
+def test_migrations_match_models() -> None:
+    """Check that every index created by a migration is declared in a model."""
+
+    versions = [migration.version for migration in MIGRATIONS]
+    assert versions == sorted(set(versions))
+    for migration in MIGRATIONS:
+        for operation in migration.operations:
+            if isinstance(operation, CreateIndex):
+                _ = operation.get_index()
+
+
+def test_plan_and_migrate(tmp_path) -> None:
+    """Check that pending migrations are planned, applied, and recorded."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    with engine.begin() as connection:
+        _ = connection.execute(
+            text(
+                """CREATE TABLE notifications (
+                    id VARCHAR PRIMARY KEY,
+                    "ownerId" VARCHAR,
+                    archived BOOLEAN
+                )"""
+            )
+        )
+        _ = connection.execute(
+            text("INSERT INTO notifications VALUES ('a', 'user', 0), ('b', 'user', 1)")
+        )
+
+    planned = plan_migrations(engine)
+    assert [(step.table, step.rows, step.locks) for step in planned] == [
+        ("notifications", 2, True)
+    ]
+    assert not planned[0].blocking
+    # Planning does not change the database
+    assert not inspect(engine).has_table("schemaMigrations")
+
+    assert migrate(engine) == [migration.version for migration in MIGRATIONS]
+    assert "ix_notifications_ownerId_archived" in {
+        index["name"] for index in inspect(engine).get_indexes("notifications")
+    }
+
+    with engine.connect() as connection:
+        assert get_applied_versions(connection) == {
+            migration.version for migration in MIGRATIONS
+        }
+
+    assert not plan_migrations(engine)
+    assert not migrate(engine)
+
+
+def test_rebuild_payroll_entries(tmp_path) -> None:
+    """Check that payroll entries keyed by week and employee get IDs."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'payroll.db'}")
+    with engine.begin() as connection:
+        _ = connection.execute(
+            text(
+                """CREATE TABLE "payrollReportEntries" (
+                    "schoolId" INTEGER NOT NULL,
+                    parent DATE NOT NULL,
+                    "weekNumber" INTEGER NOT NULL,
+                    "employeeName" VARCHAR NOT NULL,
+                    sun FLOAT, mon FLOAT, tue FLOAT, wed FLOAT,
+                    thu FLOAT, fri FLOAT, sat FLOAT,
+                    signature VARCHAR,
+                    receipt_attachment_urns VARCHAR,
+                    PRIMARY KEY ("schoolId", parent, "weekNumber", "employeeName")
+                )"""
+            )
+        )
+        _ = connection.execute(
+            text(
+                """INSERT INTO "payrollReportEntries" VALUES
+                (1, '2023-01-01', 1, 'Ana', 0, 10, 0, 0, 0, 0, 0, NULL, NULL),
+                (1, '2023-01-01', 2, 'Ana', 0, 20, 0, 0, 0, 0, 0, NULL, NULL)"""
+            )
+        )
+
+    planned = plan_migrations(engine)
+    assert [(step.version, step.table, step.locks) for step in planned] == [
+        (3, "payrollReportEntries", True)
+    ]
+
+    _ = migrate(engine)
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text('SELECT id, "weekNumber", mon FROM "payrollReportEntries" ORDER BY id')
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 1, 10), (2, 2, 20)]
+    assert "ix_payrollReportEntries_entry" in {
+        index["name"] for index in inspect(engine).get_indexes("payrollReportEntries")
+    }
@@ -0,0 +1,112 @@
+import datetime
+
+from sqlmodel import Session, select
+
+from centralserver.internals import payroll_handler
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.models.reports.payroll_report import (
+    PayrollReport,
+    PayrollReportEntry,
+)
+from centralserver.internals.models.school import School
+from centralserver.internals.models.user import User
+
+
+async def test_payroll_totals():
+    """Check the payroll totals of a report and of a range of months."""
+
+    with Session(engine) as session:
+        user = session.exec(select(User)).first()
+        assert user is not None
+
+        school = School(name="Payroll Totals Test School")
+        session.add(school)
+        session.commit()
+        session.refresh(school)
+        assert school.id is not None
+
+        months = (datetime.date(2024, 5, 1), datetime.date(2024, 6, 1))
+        for month in months:
+            session.add(
+                MonthlyReport(id=month, submittedBySchool=school.id, preparedBy=user.id)
+            )
+            session.add(
+                PayrollReport(
+                    schoolId=school.id, parent=month, preparedBy=user.id, notedBy=None
+                )
+            )
+
+        for week, name, mon, fri in (
+            (1, "Ana", 100, 50),
+            (1, "Ben", 80, 0),
+            (2, "Ana", 100, 25),
+        ):
+            session.add(
+                PayrollReportEntry(
+                    schoolId=school.id,
+                    parent=months[0],
+                    weekNumber=week,
+                    employeeName=name,
+                    mon=mon,
+                    fri=fri,
+                )
+            )
+        session.add(
+            PayrollReportEntry(
+                schoolId=school.id,
+                parent=months[1],
+                weekNumber=1,
+                employeeName="Ana",
+                sat=40,
+            )
+        )
+        session.commit()
+
+        try:
+            summary = await payroll_handler.get_payroll_summary(
+                session, school.id, months[0]
+            )
+            assert [(e.employeeName, e.weeks, e.total) for e in summary.employees] == [
+                ("Ana", 2, 275),
+                ("Ben", 1, 80),
+            ]
+            assert [
+                (w.weekNumber, w.employees, w.mon, w.fri, w.total)
+                for w in summary.weeks
+            ] == [(1, 2, 180, 50, 230), (2, 1, 100, 25, 125)]
+            assert summary.total == 355
+
+            totals = await payroll_handler.get_payroll_totals(
+                session, datetime.date(2024, 5, 15), datetime.date(2024, 6, 15)
+            )
+            assert [
+                (t.parent, t.employees, t.entries, t.total)
+                for t in totals
+                if t.schoolId == school.id
+            ] == [(months[0], 2, 3, 355), (months[1], 1, 1, 40)]
+
+            totals = await payroll_handler.get_payroll_totals(
+                session, months[1], months[1], school.id
+            )
+            assert [(t.parent, t.total) for t in totals] == [(months[1], 40)]
+
+            empty = await payroll_handler.get_payroll_summary(
+                session, school.id, datetime.date(2024, 7, 1)
+            )
+            assert (empty.employees, empty.weeks, empty.total) == ([], [], 0)
+
+        finally:
+            for entry in session.exec(
+                select(PayrollReportEntry).where(
+                    PayrollReportEntry.schoolId == school.id
+                )
+            ):
+                session.delete(entry)
+            for model in (PayrollReport, MonthlyReport):
+                for month in months:
+                    report = session.get(model, (school.id, month))
+                    if report is not None:
+                        session.delete(report)
+            session.delete(school)
+            session.commit()
@@ -0,0 +1,149 @@
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlmodel import Session, select
+
+from centralserver.internals.exceptions import ReportKeyMigrationError
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.report_key_migration import (
+    migrate_report_keys,
+    needs_report_key_migration,
+)
+
+# The report tables as they were when a month could only have one report
+LEGACY_SCHEMA = (
+    """CREATE TABLE "monthlyReports" (
+        id DATE NOT NULL PRIMARY KEY,
+        name VARCHAR,
+        "submittedBySchool" INTEGER NOT NULL,
+        "reportStatus" VARCHAR(8) NOT NULL,
+        "preparedBy" VARCHAR,
+        "dateCreated" DATETIME NOT NULL,
+        "lastModified" DATETIME NOT NULL
+    )""",
+    'CREATE INDEX "ix_monthlyReports_id" ON "monthlyReports" (id)',
+    """CREATE TABLE "dailyFinancialReports" (
+        parent DATE NOT NULL PRIMARY KEY REFERENCES "monthlyReports" (id),
+        "reportStatus" VARCHAR(8),
+        "preparedBy" VARCHAR NOT NULL,
+        "notedBy" VARCHAR
+    )""",
+    'CREATE INDEX "ix_dailyFinancialReports_parent" ON "dailyFinancialReports" (parent)',
+    """CREATE TABLE "dailyFinancialReportsEntries" (
+        day INTEGER NOT NULL,
+        parent DATE NOT NULL REFERENCES "dailyFinancialReports" (parent),
+        sales FLOAT NOT NULL,
+        purchases FLOAT NOT NULL,
+        PRIMARY KEY (day, parent)
+    )""",
+)
+
+
+def test_migrate_report_keys(tmp_path) -> None:
+    """Check that reports keyed by month are rewritten with their school."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            _ = connection.execute(text(statement))
+
+        for month, school in ((1, 7), (2, 8)):
+            _ = connection.execute(
+                text(
+                    """INSERT INTO "monthlyReports" VALUES
+                    (:month, 'Report', :school, 'DRAFT', 'user', :now, :now)"""
+                ),
+                {
+                    "month": datetime.date(2023, month, 1).isoformat(),
+                    "school": school,
+                    "now": datetime.datetime.now().isoformat(" "),
+                },
+            )
+            _ = connection.execute(
+                text(
+                    """INSERT INTO "dailyFinancialReports"
+                    VALUES (:month, 'DRAFT', 'user', NULL)"""
+                ),
+                {"month": datetime.date(2023, month, 1).isoformat()},
+            )
+
+        _ = connection.execute(
+            text(
+                """INSERT INTO "dailyFinancialReportsEntries"
+                VALUES (:day, :month, :sales, 0)"""
+            ),
+            [
+                {
+                    "day": day,
+                    "month": datetime.date(2023, month, 1).isoformat(),
+                    "sales": day,
+                }
+                for month in (1, 2)
+                for day in range(1, 6)
+            ],
+        )
+
+        assert needs_report_key_migration(connection)
+
+    copied = migrate_report_keys(engine, batch_size=3)
+    assert copied == {
+        "monthlyReports": 2,
+        "dailyFinancialReports": 2,
+        "dailyFinancialReportsEntries": 10,
+    }
+    assert not any(
+        name.startswith("_legacy_") for name in inspect(engine).get_table_names()
+    )
+
+    with Session(engine) as session:
+        assert session.get(MonthlyReport, (7, datetime.date(2023, 1, 1))) is not None
+        assert (
+            session.get(DailyFinancialReport, (8, datetime.date(2023, 2, 1)))
+            is not None
+        )
+        entries = session.exec(
+            select(DailyFinancialReportEntry).where(
+                DailyFinancialReportEntry.schoolId == 8
+            )
+        ).all()
+        assert sorted(entry.day for entry in entries) == [1, 2, 3, 4, 5]
+
+    # The tables are only migrated once
+    assert migrate_report_keys(engine) == {}
+
+
+def test_migrate_report_keys_with_orphaned_rows(tmp_path) -> None:
+    """Check that rows without a monthly report stop the migration."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            _ = connection.execute(text(statement))
+
+        _ = connection.execute(
+            text(
+                """INSERT INTO "dailyFinancialReportsEntries"
+                VALUES (1, '2023-01-01', 10, 0), (2, '2023-01-01', 20, 0)"""
+            )
+        )
+
+    with pytest.raises(
+        ReportKeyMigrationError, match=r"dailyFinancialReportsEntries \(2\)"
+    ):
+        _ = migrate_report_keys(engine)
+
+    # The database is left as it was
+    with engine.connect() as connection:
+        assert needs_report_key_migration(connection)
+        rows = connection.execute(
+            text('SELECT COUNT(*) FROM "dailyFinancialReportsEntries"')
+        ).scalar_one()
+    assert rows == 2
+    assert not any(
+        name.startswith("_legacy_") for name in inspect(engine).get_table_names()
+    )
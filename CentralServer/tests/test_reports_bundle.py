@@ -0,0 +1,117 @@
+import datetime
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from centralserver import app
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.lr_operating_expenses import (
+    LiquidationReportOperatingExpenses,
+    OperatingExpenseEntry,
+)
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.models.reports.payroll_report import (
+    PayrollReport,
+    PayrollReportEntry,
+)
+from centralserver.internals.models.reports.report_status_manager import (
+    ReportStatusManager,
+)
+
+client = TestClient(app)
+
+
+async def test_monthly_report_bundle(monkeypatch, report_school) -> None:
+    """Check that a monthly report is returned with its component reports."""
+
+    headers = report_school.headers
+    monkeypatch.setattr(
+        ReportStatusManager, "check_view_permission", staticmethod(lambda *_: True)
+    )
+    school_id = report_school.id
+    user_id = report_school.user_id
+    report_date = datetime.date(2023, 9, 1)
+    with Session(engine) as session:
+        session.add(
+            MonthlyReport(
+                id=report_date, submittedBySchool=school_id, preparedBy=user_id
+            )
+        )
+        session.add(
+            DailyFinancialReport(
+                schoolId=school_id, parent=report_date, preparedBy=user_id
+            )
+        )
+        session.add(
+            PayrollReport(
+                schoolId=school_id, parent=report_date, preparedBy=user_id, notedBy=None
+            )
+        )
+        session.add(
+            LiquidationReportOperatingExpenses(
+                schoolId=school_id,
+                parent=report_date,
+                preparedBy=user_id,
+                notedBy=user_id,
+                teacherInCharge=user_id,
+            )
+        )
+        session.add_all(
+            DailyFinancialReportEntry(
+                schoolId=school_id, parent=report_date, day=day, sales=100, purchases=40
+            )
+            for day in (1, 2)
+        )
+        session.add(
+            PayrollReportEntry(
+                schoolId=school_id,
+                parent=report_date,
+                weekNumber=1,
+                employeeName="Ana",
+                mon=150,
+            )
+        )
+        session.add(
+            OperatingExpenseEntry(
+                schoolId=school_id,
+                parent=report_date,
+                date=datetime.datetime(2023, 9, 4),
+                particulars="Rice",
+                quantity=2,
+                unit="kg",
+                unit_price=50,
+            )
+        )
+        session.commit()
+
+    url = f"/api/v1/reports/bundle/{school_id}/2023/9"
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["report"]["submittedBySchool"] == school_id
+    assert result["transitions"]["monthly"]["current_status"] == "draft"
+    assert result["daily"]["preparedBy"] == user_id
+    assert [entry["day"] for entry in result["daily_entries"]] == [1, 2]
+    assert result["daily_summary"]["sales"] == 200
+    assert result["payroll_entries"][0]["employeeName"] == "Ana"
+    assert result["payroll_summary"]["total"] == 150
+    assert list(result["liquidation"]) == ["operating_expenses"]
+    assert result["liquidation"]["operating_expenses"]["totalAmount"] == 100
+    assert result["signatories"] == []
+
+    response = client.get(
+        url, headers=headers, params={"fields": ["daily", "payroll_summary"]}
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert set(result) == {"daily", "payroll_summary"}
+    assert result["daily"]["notedBy"] is None
+
+    response = client.get(
+        f"/api/v1/reports/bundle/{school_id}/2023/10", headers=headers
+    )
+    assert response.status_code == 404
@@ -0,0 +1,123 @@
+import datetime
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from centralserver import app
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReportEntry,
+)
+
+client = TestClient(app)
+
+
+async def test_upsert_daily_entries(report_school) -> None:
+    """Check that entries are created, then updated, by the bulk upsert."""
+
+    headers = report_school.headers
+    url = f"/api/v1/reports/daily/{report_school.id}/2023/2/entries"
+    response = client.put(
+        url,
+        headers=headers,
+        json=[
+            {"day": 1, "sales": 100, "purchases": 40},
+            {"day": 2, "sales": 200, "purchases": 80},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    assert [e["status"] for e in response.json()["entries"]] == [
+        "created",
+        "created",
+    ]
+
+    response = client.put(
+        url,
+        headers=headers,
+        json=[
+            {"day": 3, "sales": 50, "purchases": 10},
+            {"day": 2, "sales": 250, "purchases": 90},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert [(e["day"], e["status"]) for e in result["entries"]] == [
+        (2, "updated"),
+        (3, "created"),
+    ]
+    assert result["total"]["sales"] == 400
+    assert result["total"]["purchases"] == 140
+    assert result["total"]["days"] == 3
+
+    # February 2023 has 28 days
+    response = client.put(
+        url, headers=headers, json=[{"day": 29, "sales": 1, "purchases": 1}]
+    )
+    assert response.status_code == 400
+
+
+async def test_import_daily_entries(report_school) -> None:
+    """Check that valid rows of a CSV file are imported and invalid rows reported."""
+
+    headers = report_school.headers
+    url = f"/api/v1/reports/daily/{report_school.id}/2023/4/entries/import"
+    csv_file = (
+        "Day,Sales,Purchases\n"
+        "1,100,40\n"
+        "2,200,80\n"
+        "\n"
+        "31,1,1\n"  # April has 30 days
+        "3,abc,10\n"
+        "2,250,90\n"
+    )
+    response = client.post(
+        url,
+        headers=headers,
+        files={"file": ("entries.csv", csv_file.encode(), "text/csv")},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["failed"] == 3
+    assert [error["row"] for error in result["errors"]] == [5, 6, 7]
+    assert "Duplicate of row 3" in result["errors"][2]["message"]
+
+    with Session(engine) as session:
+        entries = session.exec(
+            select(DailyFinancialReportEntry).where(
+                DailyFinancialReportEntry.schoolId == report_school.id,
+                DailyFinancialReportEntry.parent == datetime.date(2023, 4, 1),
+            )
+        ).all()
+        assert sorted((e.day, e.sales) for e in entries) == [(1, 100), (2, 200)]
+
+    response = client.post(
+        url,
+        headers=headers,
+        files={"file": ("entries.txt", b"day,sales,purchases\n", "text/plain")},
+    )
+    assert response.status_code == 415
+
+
+async def test_daily_reports_of_schools_in_same_month(
+    allow_report_routes, report_schools
+) -> None:
+    """Check that two schools can each have a report for the same month."""
+
+    schools = [report_schools(f"Daily Shared Month Test School {i}") for i in (1, 2)]
+    for school, sales in zip(schools, (100, 300)):
+        response = client.put(
+            f"/api/v1/reports/daily/{school.id}/2023/3/entries",
+            headers=school.headers,
+            json=[{"day": 1, "sales": sales, "purchases": 10}],
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["total"]["sales"] == sales
+
+    for school, sales in zip(schools, (100, 300)):
+        response = client.get(
+            f"/api/v1/reports/daily/{school.id}/2023/3/entries",
+            headers=school.headers,
+        )
+        assert response.status_code == 200, response.text
+        assert [(e["day"], e["sales"]) for e in response.json()] == [(1, sales)]
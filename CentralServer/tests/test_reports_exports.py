@@ -0,0 +1,136 @@
+import csv
+import datetime
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from centralserver import app
+from centralserver.internals.adapters.object_store import (
+    BucketNames,
+    get_object_store_handler,
+)
+from centralserver.internals.config_handler import app_config
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.monthly_report import (
+    MonthlyReport,
+    ReportStatus,
+)
+from centralserver.internals.spreadsheet_handler import iter_spreadsheet_records
+from centralserver.routers.reports_routes import exports
+
+client = TestClient(app)
+
+
+@pytest.fixture
+async def cached_exports(monkeypatch):
+    """Record the exports that are cached, and delete them after the test."""
+
+    cache_names: list[str] = []
+    get_cache_name = exports.get_export_cache_name
+
+    def get_export_cache_name(*args, **kwargs) -> str | None:
+        name = get_cache_name(*args, **kwargs)
+        if name is not None:
+            cache_names.append(name)
+        return name
+
+    monkeypatch.setattr(exports, "get_export_cache_name", get_export_cache_name)
+    yield cache_names
+
+    handler = await get_object_store_handler(app_config.object_store)
+    for name in set(cache_names):
+        await handler.delete(BucketNames.REPORT_EXPORTS, name)
+
+
+async def test_export_daily_entries(report_school, cached_exports) -> None:
+    """Check that entries are exported, and that approved exports are cached."""
+
+    headers = report_school.headers
+    school_id = report_school.id
+    report_date = datetime.date(2023, 6, 1)
+    with Session(engine) as session:
+        session.add(
+            MonthlyReport(
+                id=report_date,
+                name="Export Test",
+                submittedBySchool=school_id,
+                preparedBy=report_school.user_id,
+            )
+        )
+        session.add(
+            DailyFinancialReport(
+                schoolId=school_id,
+                parent=report_date,
+                preparedBy=report_school.user_id,
+            )
+        )
+        session.add_all(
+            DailyFinancialReportEntry(
+                schoolId=school_id,
+                parent=report_date,
+                day=day,
+                sales=day * 10,
+                purchases=day,
+            )
+            for day in range(1, 31)
+        )
+        session.commit()
+
+    url = f"/api/v1/reports/exports/daily/{school_id}/2023/6"
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 30
+    assert rows[1] == {
+        "school": str(school_id),
+        "month": "2023-06-01",
+        "day": "2",
+        "sales": "20.0",
+        "purchases": "2.0",
+    }
+
+    response = client.get(
+        "/api/v1/reports/exports/daily",
+        headers=headers,
+        params={
+            "start": "2023-01-01",
+            "end": "2023-12-31",
+            "school_id": school_id,
+            "format": "xlsx",
+        },
+    )
+    assert response.status_code == 200, response.text
+    records = list(iter_spreadsheet_records(io.BytesIO(response.content), "xlsx"))
+    assert len(records) == 30
+    assert records[-1][1]["sales"] == 300
+
+    # Approved reports can no longer change, so their export is cached.
+    with Session(engine) as session:
+        daily_report = session.get(DailyFinancialReport, (school_id, report_date))
+        assert daily_report is not None
+        daily_report.reportStatus = ReportStatus.APPROVED
+        session.add(daily_report)
+        session.commit()
+
+    first = client.get(url, headers=headers)
+    with Session(engine) as session:
+        entry = session.get(DailyFinancialReportEntry, (school_id, report_date, 1))
+        assert entry is not None
+        entry.sales = 999
+        session.add(entry)
+        session.commit()
+
+    second = client.get(url, headers=headers)
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert len(set(cached_exports)) == 1
+
+    response = client.get("/api/v1/reports/exports/unknown/1/2023/6", headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,123 @@
+import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from centralserver import app
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.lr_operating_expenses import (
+    OperatingExpenseEntry,
+)
+from centralserver.routers.reports_routes import liquidation
+
+client = TestClient(app)
+
+
+def _entry(day: int, particulars: str, unit_price: float) -> dict:
+    return {
+        "date": f"2023-07-{day:02d}T00:00:00",
+        "particulars": particulars,
+        "quantity": 1,
+        "unit": "pc",
+        "unitPrice": unit_price,
+    }
+
+
+def _rowids(session: Session) -> dict[str, int]:
+    rows = session.exec(  # type: ignore
+        text(
+            'SELECT particulars, rowid FROM "liquidationReportOperatingExpensesEntries" '
+            "WHERE parent = '2023-07-01'"
+        )
+    )
+    return {particulars: rowid for particulars, rowid in rows}
+
+
+async def test_update_liquidation_entries(report_school) -> None:
+    """Check that only changed liquidation entries are written."""
+
+    headers = report_school.headers
+    user_id = report_school.user_id
+    url = f"/api/v1/reports/liquidation/{report_school.id}/2023/7/operating_expenses"
+    response = client.patch(
+        url,
+        headers=headers,
+        json={
+            "teacherInCharge": user_id,
+            "notedBy": user_id,
+            "entries": [_entry(1, "Rice", 50), _entry(2, "LPG", 900)],
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    with Session(engine) as session:
+        before = _rowids(session)
+
+    response = client.put(
+        f"{url}/entries",
+        headers=headers,
+        json=[_entry(1, "Rice", 50), _entry(2, "LPG", 950), _entry(3, "Oil", 80)],
+    )
+    assert response.status_code == 200, response.text
+
+    with Session(engine) as session:
+        after = _rowids(session)
+        # Unchanged and updated rows are not deleted and inserted again
+        assert after["Rice"] == before["Rice"]
+        assert after["LPG"] == before["LPG"]
+        assert (
+            session.get(
+                OperatingExpenseEntry,
+                (
+                    report_school.id,
+                    datetime.date(2023, 7, 1),
+                    datetime.datetime(2023, 7, 2),
+                    "LPG",
+                ),
+            ).unit_price
+            == 950
+        )  # type: ignore
+
+    response = client.patch(
+        f"{url}/entries",
+        headers=headers,
+        json={
+            "entries": [_entry(1, "Rice", 55), _entry(4, "Salt", 10)],
+            "deleted": [{"date": "2023-07-03T00:00:00", "particulars": "Oil"}],
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"inserted": 1, "updated": 1, "deleted": 1}
+
+    response = client.get(f"{url}/entries", headers=headers)
+    assert sorted((e["particulars"], e["unitPrice"]) for e in response.json()) == [
+        ("LPG", 950),
+        ("Rice", 55),
+        ("Salt", 10),
+    ]
+
+    response = client.get(
+        f"/api/v1/reports/liquidation/{report_school.id}/2023/7/summary",
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    summary = {c["category"]: c for c in response.json()["categories"]}
+    assert summary.keys() == liquidation.LIQUIDATION_CATEGORIES.keys()
+    assert summary["operating_expenses"]["entries"] == 3
+    assert summary["operating_expenses"]["totalAmount"] == 1015
+    assert summary["clinic_fund"]["reportStatus"] is None
+    assert response.json()["totalAmount"] == 1015
+
+    response = client.get(
+        f"/api/v1/reports/liquidation/{report_school.id}/2023/8/summary",
+        headers=headers,
+    )
+    assert response.status_code == 404
+
+    response = client.put(
+        f"{url}/entries",
+        headers=headers,
+        json=[_entry(1, "Rice", 50), _entry(1, "Rice", 60)],
+    )
+    assert response.status_code == 400
@@ -0,0 +1,144 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from centralserver import app
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.payroll_report import PayrollReportEntry
+
+client = TestClient(app)
+
+
+async def test_bulk_payroll_entries(report_school) -> None:
+    """Check that existing entries are skipped, or updated in upsert mode."""
+
+    headers = report_school.headers
+    url = f"/api/v1/reports/payroll/{report_school.id}/2023/3/entries/bulk"
+    response = client.post(
+        url,
+        headers=headers,
+        json=[
+            {"week_number": 1, "employee_name": "Ana", "mon": 100},
+            {"week_number": 1, "employee_name": "Ben", "mon": 80},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    assert [e["status"] for e in response.json()["entries"]] == [
+        "created",
+        "created",
+    ]
+
+    entries = [
+        {"week_number": 1, "employee_name": "Ana", "mon": 150},
+        {"week_number": 2, "employee_name": "Ana", "tue": 90},
+    ]
+    response = client.post(url, headers=headers, json=entries)
+    assert response.status_code == 200, response.text
+    assert [
+        (e["weekNumber"], e["employeeName"], e["status"])
+        for e in response.json()["entries"]
+    ] == [(1, "Ana", "skipped"), (2, "Ana", "created")]
+
+    response = client.post(url, headers=headers, params={"upsert": True}, json=entries)
+    assert response.status_code == 200, response.text
+    assert [e["status"] for e in response.json()["entries"]] == [
+        "updated",
+        "updated",
+    ]
+
+    with Session(engine) as session:
+        entry = session.exec(
+            select(PayrollReportEntry).where(
+                PayrollReportEntry.schoolId == report_school.id,
+                PayrollReportEntry.weekNumber == 1,
+                PayrollReportEntry.employeeName == "Ana",
+            )
+        ).one()
+        assert entry.mon == 150
+        names = session.exec(
+            select(PayrollReportEntry.employeeName).where(
+                PayrollReportEntry.schoolId == report_school.id
+            )
+        ).all()
+        assert sorted(names) == ["Ana", "Ana", "Ben"]
+
+    response = client.post(url, headers=headers, json=entries + entries[:1])
+    assert response.status_code == 400
+
+
+async def test_batch_payroll_entries(report_school) -> None:
+    """Check that payroll entries are updated and deleted by their IDs."""
+
+    headers = report_school.headers
+    url = f"/api/v1/reports/payroll/{report_school.id}/2023/4/entries"
+    response = client.post(
+        f"{url}/bulk",
+        headers=headers,
+        json=[
+            {"week_number": week, "employee_name": "Ana / Cruz", "mon": 10}
+            for week in (1, 2, 3)
+        ],
+    )
+    assert response.status_code == 200, response.text
+    entries = client.get(url, headers=headers).json()
+    ids = [entry["id"] for entry in entries]
+    assert len(set(ids)) == 3
+
+    response = client.patch(
+        url,
+        headers=headers,
+        json=[{"id": ids[0], "mon": 20, "tue": 5}, {"id": ids[1], "sat": 7}],
+    )
+    assert response.status_code == 200, response.text
+    assert [(e["id"], e["mon"], e["tue"], e["sat"]) for e in response.json()] == [
+        (ids[0], 20, 5, 0),
+        (ids[1], 10, 0, 7),
+    ]
+
+    response = client.patch(url, headers=headers, json=[{"id": -1, "mon": 1}])
+    assert response.status_code == 404
+
+    response = client.delete(url, headers=headers, params={"id": ids[:2]})
+    assert response.status_code == 200, response.text
+    assert [e["id"] for e in client.get(url, headers=headers).json()] == ids[2:]
+
+    response = client.delete(url, headers=headers, params={"id": ids[:1]})
+    assert response.status_code == 404
+
+
+async def test_import_payroll_entries(report_school) -> None:
+    """Check that payroll entries are imported by week and employee."""
+
+    headers = report_school.headers
+    url = f"/api/v1/reports/payroll/{report_school.id}/2023/5/entries"
+    csv_file = (
+        "Week Number,Employee Name,Mon,Tue\n"
+        "1,Ana,100,50\n"
+        "1,Ben,80,0\n"
+        "2,Ana,100,25\n"
+        "1,Ana,1,1\n"
+    )
+    response = client.post(
+        f"{url}/import",
+        headers=headers,
+        files={"file": ("entries.csv", csv_file.encode(), "text/csv")},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["imported"], result["failed"]) == (3, 1)
+    assert "Duplicate of row 2" in result["errors"][0]["message"]
+
+    response = client.post(
+        f"{url}/import",
+        headers=headers,
+        files={"file": ("entries.csv", b"week_number,employee_name,mon\n1,Ana,150\n")},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 1
+
+    entries = client.get(url, headers=headers).json()
+    assert sorted((e["weekNumber"], e["employeeName"], e["mon"]) for e in entries) == [
+        (1, "Ana", 150),
+        (1, "Ben", 80),
+        (2, "Ana", 100),
+    ]
+    assert len({entry["id"] for entry in entries}) == 3
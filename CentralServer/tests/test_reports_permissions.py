@@ -0,0 +1,69 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from centralserver import app
+from centralserver.internals.auth_handler import crypt_ctx
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.user import User
+
+client = TestClient(app)
+
+CANTEEN_MANAGER_PASSWORD = "Pytest-Canteen-Manager-123"
+
+
+@pytest.fixture
+def canteen_manager(report_schools):
+    """Create a canteen manager of a school, and log in as them."""
+
+    school = report_schools("Report Permissions Own School")
+    with Session(engine) as session:
+        user = User(
+            username="pytest_canteen_manager",
+            password=crypt_ctx.hash(CANTEEN_MANAGER_PASSWORD),
+            roleId=5,
+            schoolId=school.id,
+        )
+        session.add(user)
+        session.commit()
+        user_id = user.id
+
+    login = client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "pytest_canteen_manager",
+            "password": CANTEEN_MANAGER_PASSWORD,
+        },
+    )
+    assert login.status_code == 200, login.text
+    yield school.id, {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    with Session(engine) as session:
+        user = session.get(User, user_id)
+        if user is not None:
+            session.delete(user)
+            session.commit()
+
+
+async def test_reports_of_another_school(canteen_manager, report_schools) -> None:
+    """Check that reports of another school need the global permissions."""
+
+    own_school_id, headers = canteen_manager
+    other_school = report_schools("Report Permissions Other School")
+    # Each request, and its status for the user's own school, which has no reports
+    requests = (
+        ("GET", "/api/v1/reports/exports/daily/{}/2023/6", None, 200),
+        ("GET", "/api/v1/reports/bundle/{}/2023/6", None, 404),
+        ("GET", "/api/v1/reports/liquidation/{}/2023/6/summary", None, 404),
+        ("PATCH", "/api/v1/reports/payroll/{}/2023/6/entries", [{"id": 1}], 404),
+    )
+    for method, url, body, own_status in requests:
+        response = client.request(
+            method, url.format(other_school.id), headers=headers, json=body
+        )
+        assert response.status_code == 403, (url, response.text)
+
+        response = client.request(
+            method, url.format(own_school_id), headers=headers, json=body
+        )
+        assert response.status_code == own_status, (url, response.text)
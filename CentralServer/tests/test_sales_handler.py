@@ -0,0 +1,114 @@
+import datetime
+
+from sqlmodel import Session, select
+
+from centralserver.internals import sales_handler
+from centralserver.internals.db_handler import engine
+from centralserver.internals.models.reports.daily_financial_report import (
+    DailyFinancialReport,
+    DailyFinancialReportEntry,
+)
+from centralserver.internals.models.reports.monthly_report import MonthlyReport
+from centralserver.internals.models.school import School
+from centralserver.internals.models.user import User
+
+
+async def test_sales_lookup():
+    """Check daily entries and totals of a school across two months."""
+
+    with Session(engine) as session:
+        user = session.exec(select(User)).first()
+        assert user is not None
+
+        school = School(name="Sales Lookup Test School")
+        session.add(school)
+        session.commit()
+        session.refresh(school)
+        assert school.id is not None
+
+        months = (datetime.date(2024, 5, 1), datetime.date(2024, 6, 1))
+        for month in months:
+            session.add(
+                MonthlyReport(id=month, submittedBySchool=school.id, preparedBy=user.id)
+            )
+            session.add(
+                DailyFinancialReport(
+                    schoolId=school.id, parent=month, preparedBy=user.id
+                )
+            )
+
+        for day in (27, 30, 31):
+            session.add(
+                DailyFinancialReportEntry(
+                    schoolId=school.id,
+                    parent=months[0],
+                    day=day,
+                    sales=day * 10,
+                    purchases=day,
+                )
+            )
+        for day in (1, 3, 10):
+            session.add(
+                DailyFinancialReportEntry(
+                    schoolId=school.id,
+                    parent=months[1],
+                    day=day,
+                    sales=day * 10,
+                    purchases=day,
+                )
+            )
+        session.commit()
+
+        try:
+            entry = await sales_handler.get_daily_entry(
+                session, school.id, datetime.date(2024, 6, 3)
+            )
+            assert entry is not None and entry.sales == 30
+            assert (
+                await sales_handler.get_daily_entry(
+                    session, school.id, datetime.date(2024, 6, 2)
+                )
+                is None
+            )
+
+            entries = await sales_handler.get_daily_entries(
+                session,
+                school.id,
+                datetime.date(2024, 5, 30),
+                datetime.date(2024, 6, 3),
+            )
+            assert [(e.parent.month, e.day) for e in entries] == [
+                (5, 30),
+                (5, 31),
+                (6, 1),
+                (6, 3),
+            ]
+
+            # Monday 2024-05-27 to Sunday 2024-06-02
+            week = await sales_handler.get_weekly_total(
+                session, school.id, datetime.date(2024, 5, 29)
+            )
+            assert week.start == datetime.date(2024, 5, 27)
+            assert (week.sales, week.purchases, week.days) == (890, 89, 4)
+
+            month = await sales_handler.get_monthly_total(session, school.id, 2024, 6)
+            assert month.end == datetime.date(2024, 6, 30)
+            assert (month.sales, month.days) == (140, 3)
+
+            empty = await sales_handler.get_monthly_total(session, school.id, 2024, 7)
+            assert (empty.sales, empty.days) == (0, 0)
+
+        finally:
+            for entry in session.exec(
+                select(DailyFinancialReportEntry).where(
+                    DailyFinancialReportEntry.schoolId == school.id
+                )
+            ):
+                session.delete(entry)
+            for model in (DailyFinancialReport, MonthlyReport):
+                for month in months:
+                    report = session.get(model, (school.id, month))
+                    if report is not None:
+                        session.delete(report)
+            session.delete(school)
+            session.commit()
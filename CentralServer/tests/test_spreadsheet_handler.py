@@ -0,0 +1,116 @@
+import datetime
+import io
+import zipfile
+
+import pytest
+
+from centralserver.internals.exceptions import SpreadsheetFormatError
+from centralserver.internals.spreadsheet_handler import (
+    get_spreadsheet_format,
+    iter_spreadsheet_chunks,
+    iter_spreadsheet_records,
+)
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _make_xlsx() -> io.BytesIO:
+    """Create a workbook with shared strings, inline strings and a date."""
+
+    file = io.BytesIO()
+    with zipfile.ZipFile(file, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+            '<sheet name="Entries" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            "<Relationships xmlns="
+            '"http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml" Type="'
+            f'{_REL_NS}/worksheet"/></Relationships>',
+        )
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst xmlns="{_MAIN_NS}"><si><t>date</t></si><si><t>particulars</t></si>'
+            "<si><r><t>Ri</t></r><r><t>ce</t></r></si></sst>",
+        )
+        archive.writestr(
+            "xl/styles.xml",
+            f'<styleSheet xmlns="{_MAIN_NS}"><cellXfs count="2">'
+            '<xf numFmtId="0"/><xf numFmtId="14"/></cellXfs></styleSheet>',
+        )
+        archive.writestr(
+            "xl/worksheets/sheet1.xml",
+            f'<worksheet xmlns="{_MAIN_NS}"><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c>'
+            '<c r="C1" t="inlineStr"><is><t>amount</t></is></c></row>'
+            '<row r="3"><c r="A3" s="1"><v>45292</v></c><c r="B3" t="s"><v>2</v></c>'
+            '<c r="C3"><v>12.5</v></c></row>'
+            '<row r="4"><c r="B4" t="s"><v>2</v></c><c r="C4"><v>3</v></c></row>'
+            "</sheetData></worksheet>",
+        )
+
+    _ = file.seek(0)
+    return file
+
+
+def test_get_spreadsheet_format() -> None:
+    assert get_spreadsheet_format("entries.CSV") == "csv"
+    assert get_spreadsheet_format("entries.xlsx") == "xlsx"
+    assert get_spreadsheet_format("upload", "text/csv") == "csv"
+    with pytest.raises(SpreadsheetFormatError):
+        _ = get_spreadsheet_format("entries.xls")
+
+
+def test_iter_csv_records() -> None:
+    file = io.BytesIO("\ufeffday, sales\n1,100\n\n2,\n".encode())
+
+    assert list(iter_spreadsheet_records(file, "csv")) == [
+        (2, {"day": "1", "sales": "100"}),
+        (4, {"day": "2"}),
+    ]
+    assert not file.closed
+
+
+def test_iter_xlsx_records() -> None:
+    assert list(iter_spreadsheet_records(_make_xlsx(), "xlsx")) == [
+        (
+            3,
+            {
+                "date": datetime.datetime(2024, 1, 1),
+                "particulars": "Rice",
+                "amount": 12.5,
+            },
+        ),
+        (4, {"particulars": "Rice", "amount": 3}),
+    ]
+
+
+def test_iter_xlsx_records_invalid() -> None:
+    with pytest.raises(SpreadsheetFormatError):
+        _ = list(iter_spreadsheet_records(io.BytesIO(b"not a workbook"), "xlsx"))
+
+
+@pytest.mark.parametrize("spreadsheet_format", ["csv", "xlsx"])
+def test_spreadsheet_round_trip(spreadsheet_format) -> None:
+    rows = [
+        (datetime.datetime(2024, 1, 2, 8, 30), "Rice & <Beans>", 2, 12.5, None),
+        (datetime.datetime(2024, 1, 3), "LPG", 1, 900.0, "kg"),
+    ]
+    chunks = iter_spreadsheet_chunks(
+        ["date", "particulars", "quantity", "unitPrice", "unit"],
+        iter(rows),
+        spreadsheet_format,
+    )
+    file = io.BytesIO(b"".join(chunks))
+
+    records = list(iter_spreadsheet_records(file, spreadsheet_format))
+    assert [row_number for row_number, _ in records] == [2, 3]
+    assert records[0][1]["particulars"] == "Rice & <Beans>"
+    assert "unit" not in records[0][1]
+    if spreadsheet_format == "xlsx":
+        assert records[0][1]["date"] == rows[0][0]
+        assert records[1][1]["quantity"] == 1